@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""Frame-energy analysis of PCM audio.
+
+Computes an RMS envelope (one value per short frame) and uses it to move
+chunk boundaries into quiet regions, so cuts land between words instead of
+through them, and to find the speech in a recording so long silences can be
+left out of the upload (voice-activity trimming, see find_speech_regions and
+TimestampMap).
+
+The envelope is vectorized: NumPy when installed, otherwise the standard
+`array` module with the per-sample arithmetic done in C via map(). Files are
+analyzed through an ffmpeg pipe at a low sample rate, so memory stays
+constant whatever the recording length.
+
+Requirements:
+    ffmpeg on PATH (for rms_envelope_from_file)
+    numpy (optional, faster envelope)
+"""
+
+import array
+import bisect
+import math
+import operator
+import shutil
+import subprocess
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # Optional; the array fallback gives identical results
+    np = None
+
+ANALYSIS_SAMPLE_RATE = 8000  # Plenty for speech energy, and cheap to decode
+DEFAULT_FRAME_MS = 20
+DEFAULT_TOLERANCE_MS = 15 * 1000  # How far a cut may move to find a quiet spot
+QUIET_MARGIN = 1.05  # Frames within 5% of the window minimum count as equally quiet
+
+# Voice-activity trimming
+DEFAULT_MIN_SILENCE_MS = 1500  # Only pauses at least this long are shortened
+DEFAULT_SPEECH_PAD_MS = 300  # Silence kept on each side of speech, so word edges survive
+SILENCE_FLOOR_RMS = 100  # About -50 dBFS; anything quieter is never speech
+NOISE_FLOOR_PERCENTILE = 10  # Envelope percentile taken as the background level
+SPEECH_LEVEL_PERCENTILE = 95  # Envelope percentile taken as the speech level
+NOISE_FLOOR_RATIO = 3.0  # Speech is at least ~10 dB above the background...
+SPEECH_LEVEL_RATIO = 0.2  # ...and within ~14 dB of the speech level
+MAX_SPEECH_REGIONS = 1000  # Keeps the ffmpeg select expression a manageable size
+
+
+def rms_envelope(samples, frame_len: int) -> list[float]:
+    """Compute the RMS of consecutive frames of 16-bit PCM samples.
+
+    Args:
+        samples: Signed 16-bit mono samples (bytes, array('h') or NumPy array)
+        frame_len: Samples per frame; a trailing partial frame is included
+
+    Returns:
+        One RMS value per frame
+    """
+    if frame_len <= 0:
+        raise ValueError("frame_len must be positive")
+
+    if np is not None:
+        if isinstance(samples, (bytes, bytearray, memoryview)):
+            x = np.frombuffer(samples, dtype=np.int16)
+        else:
+            x = np.asarray(samples, dtype=np.int16)
+        x = x.astype(np.float64)
+        full = len(x) // frame_len
+        frames = x[:full * frame_len].reshape(full, frame_len)
+        envelope = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_len).tolist()
+        tail = x[full * frame_len:]
+        if len(tail):
+            envelope.append(float(np.sqrt(np.dot(tail, tail) / len(tail))))
+        return envelope
+
+    if isinstance(samples, (bytes, bytearray, memoryview)):
+        pcm = array.array("h")
+        pcm.frombytes(bytes(samples)[:len(samples) - len(samples) % 2])
+        if sys.byteorder == "big":
+            pcm.byteswap()
+    else:
+        pcm = array.array("h", samples)
+
+    envelope = []
+    for start in range(0, len(pcm), frame_len):
+        frame = pcm[start:start + frame_len]
+        envelope.append(math.sqrt(sum(map(operator.mul, frame, frame)) / len(frame)))
+    return envelope
+
+
+def rms_envelope_from_file(path: str, frame_ms: int = DEFAULT_FRAME_MS) -> list[float]:
+    """Compute the RMS envelope of an audio file by streaming it through ffmpeg.
+
+    The file is decoded to mono 8 kHz PCM on a pipe and consumed block by
+    block; only the envelope (a few floats per second) is kept in memory.
+
+    Raises:
+        RuntimeError: If ffmpeg is missing or fails to decode the file
+    """
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg not found")
+
+    frame_len = ANALYSIS_SAMPLE_RATE * frame_ms // 1000
+    block_bytes = frame_len * 2 * 500  # 500 frames (10 s at 20 ms) per read
+
+    cmd = [
+        "ffmpeg",
+        "-v", "error",
+        "-i", path,
+        "-vn",
+        "-ac", "1",
+        "-ar", str(ANALYSIS_SAMPLE_RATE),
+        "-f", "s16le",
+        "-",
+    ]
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    envelope = []
+    pending = b""
+    try:
+        while True:
+            block = process.stdout.read(block_bytes)
+            if not block:
+                break
+            pending += block
+            usable = len(pending) - len(pending) % (frame_len * 2)
+            if usable:
+                envelope.extend(rms_envelope(pending[:usable], frame_len))
+                pending = pending[usable:]
+        if len(pending) >= 2:
+            envelope.extend(rms_envelope(pending, frame_len))
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        process.wait()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to decode audio: {stderr.decode(errors='replace').strip()}")
+    return envelope
+
+
+def rms_envelope_from_segment(audio, frame_ms: int = DEFAULT_FRAME_MS) -> list[float]:
+    """Compute the RMS envelope of an already decoded pydub AudioSegment."""
+    mono = audio.set_channels(1).set_sample_width(2).set_frame_rate(ANALYSIS_SAMPLE_RATE)
+    frame_len = ANALYSIS_SAMPLE_RATE * frame_ms // 1000
+    return rms_envelope(mono.raw_data, frame_len)
+
+
+def find_quiet_boundaries(
+    envelope: list[float],
+    duration_ms: int,
+    chunk_duration_ms: int,
+    tolerance_ms: int = DEFAULT_TOLERANCE_MS,
+    max_chunk_ms: int | None = None,
+    frame_ms: int = DEFAULT_FRAME_MS,
+) -> list[int]:
+    """Choose chunk cut points that fall in low-energy regions.
+
+    Each cut aims for `chunk_duration_ms` after the previous one and moves to
+    the quietest frame within +/- `tolerance_ms` of that target. Among
+    equally quiet frames the one nearest the target wins, so the result is
+    deterministic and close to the fixed grid when there is no silence.
+
+    Args:
+        envelope: RMS values, one per `frame_ms` frame
+        duration_ms: Total audio duration in milliseconds
+        chunk_duration_ms: Nominal chunk length in milliseconds
+        tolerance_ms: Maximum distance a cut may move from its target
+        max_chunk_ms: Hard upper bound on any chunk's length (e.g. size limit)
+        frame_ms: Frame length the envelope was computed with
+
+    Returns:
+        Cut points in milliseconds, ascending, excluding 0 and duration_ms
+    """
+    if max_chunk_ms is None:
+        max_chunk_ms = chunk_duration_ms + tolerance_ms
+    nominal_ms = min(chunk_duration_ms, max_chunk_ms)
+    last_chunk_limit = min(nominal_ms + tolerance_ms, max_chunk_ms)
+
+    cuts = []
+    previous = 0
+    while duration_ms - previous > last_chunk_limit:
+        target = previous + nominal_ms
+        lo = max(previous + frame_ms, target - tolerance_ms) // frame_ms
+        hi = min(target + tolerance_ms, previous + max_chunk_ms) // frame_ms
+        window = envelope[lo:hi + 1]
+
+        if window:
+            quiet = min(window) * QUIET_MARGIN + 1e-9
+            target_frame = target // frame_ms
+            best = min(
+                (i for i, value in enumerate(window, start=lo) if value <= quiet),
+                key=lambda i: (abs(i - target_frame), i),
+            )
+            cut = best * frame_ms
+        else:
+            cut = target  # Envelope shorter than the probed duration
+
+        cut = min(max(cut, previous + frame_ms), previous + max_chunk_ms)
+        cuts.append(cut)
+        previous = cut
+
+    return cuts
+
+
+def speech_threshold(envelope) -> float | None:
+    """Pick the RMS level separating speech from background for this recording.
+
+    The level sits NOISE_FLOOR_RATIO above the background (a low percentile
+    of the envelope), but never more than SPEECH_LEVEL_RATIO below the speech
+    level (a high percentile), so recordings with little or no silence are
+    not mistaken for noise, and never below SILENCE_FLOOR_RMS.
+
+    Returns:
+        The threshold, or None if nothing stands out from the background
+        (no speech, or speech with no silence to compare against)
+    """
+    if np is not None:
+        values = np.asarray(envelope, dtype=np.float64)
+        floor, loud = np.percentile(values, [NOISE_FLOOR_PERCENTILE, SPEECH_LEVEL_PERCENTILE]).tolist()
+    else:
+        values = sorted(envelope)
+        floor = values[(len(values) - 1) * NOISE_FLOOR_PERCENTILE // 100]
+        loud = values[(len(values) - 1) * SPEECH_LEVEL_PERCENTILE // 100]
+    if loud < SILENCE_FLOOR_RMS or loud < floor * NOISE_FLOOR_RATIO:
+        return None
+    return max(SILENCE_FLOOR_RMS, min(floor * NOISE_FLOOR_RATIO, loud * SPEECH_LEVEL_RATIO))
+
+
+def _voiced_runs(envelope, threshold: float) -> list[tuple[int, int]]:
+    """[start, end) frame ranges where the envelope is above threshold."""
+    if np is not None:
+        voiced = np.asarray(envelope, dtype=np.float64) > threshold
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], voiced, [False])).astype(np.int8)))
+        return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+
+    runs = []
+    start = None
+    for i, value in enumerate(envelope):
+        if value > threshold:
+            if start is None:
+                start = i
+        elif start is not None:
+            runs.append((start, i))
+            start = None
+    if start is not None:
+        runs.append((start, len(envelope)))
+    return runs
+
+
+def find_speech_regions(
+    envelope,
+    duration_ms: int | None = None,
+    frame_ms: int = DEFAULT_FRAME_MS,
+    threshold: float | None = None,
+    min_silence_ms: int = DEFAULT_MIN_SILENCE_MS,
+    pad_ms: int = DEFAULT_SPEECH_PAD_MS,
+) -> list[tuple[int, int]]:
+    """Find the parts of a recording worth uploading.
+
+    Frames above the speech threshold are speech. Pauses shorter than
+    `min_silence_ms` are kept as they are; longer ones, and the silence
+    before the first and after the last word, are cut down to `pad_ms` on
+    each side of the speech. All boundaries fall on frame edges.
+
+    Args:
+        envelope: RMS values, one per `frame_ms` frame
+        duration_ms: Total audio duration (default: the envelope's length)
+        frame_ms: Frame length the envelope was computed with
+        threshold: Speech level (default: speech_threshold(envelope))
+        min_silence_ms: Shortest pause that gets shortened
+        pad_ms: Silence kept around speech
+
+    Returns:
+        (start_ms, end_ms) regions to keep, ascending and non-overlapping;
+        the whole recording if no speech is found
+    """
+    total_ms = len(envelope) * frame_ms
+    duration_ms = total_ms if duration_ms is None else min(duration_ms, total_ms)
+    if not len(envelope):
+        return [(0, duration_ms)] if duration_ms else []
+    if threshold is None:
+        threshold = speech_threshold(envelope)
+    runs = _voiced_runs(envelope, threshold) if threshold is not None else []
+    if not runs:
+        return [(0, duration_ms)]  # Nothing recognisable as speech: don't guess
+
+    pad = pad_ms // frame_ms
+    max_gap = max(min_silence_ms // frame_ms, 2 * pad)  # Shorter pauses stay whole
+    regions = []
+    start, end = runs[0]
+    for run_start, run_end in runs[1:]:
+        if run_start - end < max_gap:
+            end = run_end
+        else:
+            regions.append((start, end))
+            start, end = run_start, run_end
+    regions.append((start, end))
+
+    if len(regions) > MAX_SPEECH_REGIONS:
+        # Keep only the longest pauses as cuts
+        gaps = sorted(range(1, len(regions)), key=lambda i: regions[i][0] - regions[i - 1][1])
+        merge = set(gaps[:len(regions) - MAX_SPEECH_REGIONS])
+        merged = [regions[0]]
+        for i in range(1, len(regions)):
+            if i in merge:
+                merged[-1] = (merged[-1][0], regions[i][1])
+            else:
+                merged.append(regions[i])
+        regions = merged
+
+    last_frame = -(-duration_ms // frame_ms)
+    return [
+        (max(0, s - pad) * frame_ms, min(duration_ms, min(last_frame, e + pad) * frame_ms))
+        for s, e in regions
+    ]
+
+
+class TimestampMap:
+    """Maps times in trimmed audio back to the original recording.
+
+    Built from the regions that were kept (see find_speech_regions); the
+    trimmed audio is those regions played back to back.
+
+    Example:
+        timestamps = TimestampMap([(1200, 5400), (9000, 15000)], original_ms=16000)
+        timestamps.to_original(4500)  # 9300
+        timestamps.removed_ms         # 5800
+    """
+
+    def __init__(self, regions: list[tuple[int, int]], original_ms: int):
+        self.regions = [(int(start), int(end)) for start, end in regions]
+        self.original_ms = int(original_ms)
+        self._starts = []  # Trimmed-time start of each region
+        position = 0
+        for start, end in self.regions:
+            self._starts.append(position)
+            position += end - start
+        self.kept_ms = position
+
+    @classmethod
+    def identity(cls, duration_ms: int) -> "TimestampMap":
+        """A map for audio that was not trimmed."""
+        return cls([(0, duration_ms)], duration_ms)
+
+    @property
+    def removed_ms(self) -> int:
+        return self.original_ms - self.kept_ms
+
+    def to_original(self, trimmed_ms: float) -> float:
+        """Convert a time in the trimmed audio to the same moment in the original.
+
+        A time exactly on a joint maps to the start of the later region.
+        """
+        if not self.regions:
+            return trimmed_ms
+        index = max(0, bisect.bisect_right(self._starts, trimmed_ms) - 1)
+        start, end = self.regions[index]
+        return min(start + (trimmed_ms - self._starts[index]), end)
+
+    def to_dict(self) -> dict:
+        return {"original_ms": self.original_ms, "regions": [list(region) for region in self.regions]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TimestampMap":
+        return cls([tuple(region) for region in data["regions"]], data["original_ms"])
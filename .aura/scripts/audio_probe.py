@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Read audio durations from container headers without decoding or spawning.
+
+Supported natively (a few small reads per file, no subprocess):
+
+- WAV: fmt + data chunks (or the fact chunk for compressed WAV)
+- FLAC: total samples from STREAMINFO
+- MP3/MPEG audio: Xing/Info or VBRI frame count, else CBR bitrate and size
+- M4A/MP4: mvhd atom inside moov (moov may sit at the end of the file)
+- Ogg (Opus/Vorbis): granule position of the last page
+
+Anything else (webm, unusual or damaged files) falls back to ffprobe.
+
+examples/whisper/scripts/audio_probe.py is an identical copy, so the example
+stays self-contained; tests/test_script_copies.py fails if the two differ.
+
+Usage:
+    python .aura/scripts/audio_probe.py <audio-file> [...]
+"""
+
+import argparse
+import shutil
+import struct
+import subprocess
+import sys
+
+# Header reads that still cover typical ID3v2 tags and fragmented atom lists
+MAX_ID3_SKIP = 16 * 1024 * 1024
+MP3_SYNC_SEARCH_BYTES = 64 * 1024
+OGG_TAIL_BYTES = 64 * 1024  # The last Ogg page is at most ~64 KiB
+MAX_ATOMS = 1024
+
+# MPEG audio tables, indexed [version][layer] where version is 1 (MPEG-1) or 2 (MPEG-2/2.5)
+MP3_BITRATES_KBPS = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}  # By version bits
+
+
+def _wav_duration(f, size: int) -> int | None:
+    f.seek(12)
+    byte_rate = sample_rate = None
+    fact_samples = None
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        chunk_id, chunk_size = struct.unpack("<4sI", header)
+        start = f.tell()
+        if chunk_id == b"fmt ":
+            fmt = f.read(16)
+            if len(fmt) < 16:
+                return None
+            _, _, sample_rate, byte_rate, _, _ = struct.unpack("<HHIIHH", fmt)
+        elif chunk_id == b"fact":
+            fact_samples = struct.unpack("<I", f.read(4))[0]
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            # Recorders that were cut off leave 0 or 0xFFFFFFFF here; trust the file size instead
+            data_size = chunk_size if 0 < chunk_size <= size - start else size - start
+            if fact_samples and sample_rate:
+                return fact_samples * 1000 // sample_rate
+            return data_size * 1000 // byte_rate
+        f.seek(start + chunk_size + (chunk_size & 1))  # Chunks are word aligned
+
+
+def _flac_duration(f) -> int | None:
+    f.seek(4)
+    header = f.read(4)
+    if len(header) < 4 or header[0] & 0x7F != 0:  # First block must be STREAMINFO
+        return None
+    info = f.read(18)
+    if len(info) < 18:
+        return None
+    # Bytes 10-17: 20 bits sample rate, 3 channels, 5 bits per sample, 36 bits total samples
+    packed = int.from_bytes(info[10:18], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if not sample_rate or not total_samples:
+        return None  # Unknown length (e.g. a stream that was never finalized)
+    return total_samples * 1000 // sample_rate
+
+
+def _mp3_frame(header: bytes) -> tuple[int, int, int, int] | None:
+    """Parse a 4-byte frame header into (bitrate bps, sample rate, samples per frame, version bits)."""
+    b1, b2, b3 = header[1], header[2], header[3]
+    if header[0] != 0xFF or b1 & 0xE0 != 0xE0:
+        return None
+    version_bits = (b1 >> 3) & 3
+    layer_bits = (b1 >> 1) & 3
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None  # Reserved values, or free-format (no fixed bitrate)
+    version = 1 if version_bits == 3 else 2
+    layer = 4 - layer_bits
+    bitrate = MP3_BITRATES_KBPS[(version, layer)][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version_bits][rate_index]
+    if layer == 1:
+        samples = 384
+    elif layer == 3 and version == 2:
+        samples = 576
+    else:
+        samples = 1152
+    return bitrate, sample_rate, samples, version_bits
+
+
+def _mp3_duration(f, size: int) -> int | None:
+    f.seek(0)
+    start = 0
+    head = f.read(10)
+    if head[:3] == b"ID3" and len(head) == 10:
+        # Syncsafe size: 7 bits per byte, plus a 10-byte footer if flagged
+        tag_size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+        if tag_size > MAX_ID3_SKIP:
+            return None
+        start = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+
+    f.seek(start)
+    window = f.read(MP3_SYNC_SEARCH_BYTES)
+    for offset in range(len(window) - 3):
+        if window[offset] == 0xFF and window[offset + 1] & 0xE0 == 0xE0:
+            frame = _mp3_frame(window[offset:offset + 4])
+            if frame is not None:
+                break
+    else:
+        return None
+    bitrate, sample_rate, samples_per_frame, version_bits = frame
+    audio_start = start + offset
+    first = window[offset:offset + 200]
+
+    # VBR files carry a frame count in a Xing/Info header (after the side info) or a VBRI header
+    channel_mode = (first[3] >> 6) & 3 if len(first) > 3 else 0
+    if version_bits == 3:
+        side_info = 17 if channel_mode == 3 else 32
+    else:
+        side_info = 9 if channel_mode == 3 else 17
+    xing = 4 + side_info
+    if first[xing:xing + 4] in (b"Xing", b"Info") and len(first) >= xing + 12:
+        flags = struct.unpack(">I", first[xing + 4:xing + 8])[0]
+        if flags & 1:
+            frames = struct.unpack(">I", first[xing + 8:xing + 12])[0]
+            return frames * samples_per_frame * 1000 // sample_rate
+    if first[36:40] == b"VBRI" and len(first) >= 54:
+        frames = struct.unpack(">I", first[50:54])[0]
+        return frames * samples_per_frame * 1000 // sample_rate
+
+    # Constant bitrate: audio bytes / byte rate (minus a trailing ID3v1 tag)
+    end = size
+    if size >= 128:
+        f.seek(size - 128)
+        if f.read(3) == b"TAG":
+            end -= 128
+    return (end - audio_start) * 8 * 1000 // bitrate
+
+
+def _mp4_duration(f, size: int) -> int | None:
+    def atoms(start: int, end: int):
+        """Yield (type, payload start, payload end) for the atoms in [start, end)."""
+        pos = start
+        for _ in range(MAX_ATOMS):
+            if pos + 8 > end:
+                return
+            f.seek(pos)
+            atom_size, atom_type = struct.unpack(">I4s", f.read(8))
+            header = 8
+            if atom_size == 1:  # 64-bit size follows
+                atom_size = struct.unpack(">Q", f.read(8))[0]
+                header = 16
+            elif atom_size == 0:  # Extends to end of file
+                atom_size = end - pos
+            if atom_size < header:
+                return
+            yield atom_type, pos + header, min(pos + atom_size, end)
+            pos += atom_size
+
+    for atom_type, start, end in atoms(0, size):
+        if atom_type != b"moov":
+            continue
+        for child_type, child_start, _ in atoms(start, end):
+            if child_type != b"mvhd":
+                continue
+            f.seek(child_start)
+            mvhd = f.read(32)
+            if mvhd[:1] == b"\x01":
+                timescale, duration = struct.unpack(">IQ", mvhd[20:32])
+            else:
+                timescale, duration = struct.unpack(">II", mvhd[12:20])
+            if not timescale or duration in (0, 0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):
+                return None  # Fragmented MP4s leave the movie duration unset
+            return duration * 1000 // timescale
+        return None
+    return None
+
+
+def _ogg_duration(f, size: int) -> int | None:
+    f.seek(0)
+    first = f.read(28 + 255 + 19)
+    segments = first[26] if len(first) > 27 else 0
+    packet = first[27 + segments:]
+    if packet[:8] == b"OpusHead" and len(packet) >= 12:
+        sample_rate = 48000  # Opus granule positions always count 48 kHz samples
+        pre_skip = struct.unpack("<H", packet[10:12])[0]
+    elif packet[:7] == b"\x01vorbis" and len(packet) >= 16:
+        sample_rate = struct.unpack("<I", packet[12:16])[0]
+        pre_skip = 0
+    else:
+        return None
+
+    tail_start = max(0, size - OGG_TAIL_BYTES)
+    f.seek(tail_start)
+    tail = f.read()
+    last_page = tail.rfind(b"OggS")
+    while last_page >= 0:
+        if len(tail) >= last_page + 14:
+            granule = struct.unpack("<q", tail[last_page + 6:last_page + 14])[0]
+            if granule > 0:
+                return max(0, granule - pre_skip) * 1000 // sample_rate
+        last_page = tail.rfind(b"OggS", 0, last_page)
+    return None
+
+
+def read_duration_ms(path: str) -> int | None:
+    """Read an audio file's duration from its headers, without any subprocess.
+
+    The format is detected from magic bytes, not the extension.
+
+    Returns:
+        Duration in milliseconds, or None if the container isn't understood
+    """
+    try:
+        with open(path, "rb") as f:
+            magic = f.read(12)
+            f.seek(0, 2)
+            size = f.tell()
+            if magic[:4] == b"RIFF" and magic[8:12] == b"WAVE":
+                return _wav_duration(f, size)
+            if magic[:4] == b"fLaC":
+                return _flac_duration(f)
+            if magic[4:8] == b"ftyp":
+                return _mp4_duration(f, size)
+            if magic[:4] == b"OggS":
+                return _ogg_duration(f, size)
+            if magic[:3] == b"ID3" or (len(magic) > 1 and magic[0] == 0xFF and magic[1] & 0xE0 == 0xE0):
+                return _mp3_duration(f, size)
+    except (OSError, struct.error, IndexError, ValueError, ZeroDivisionError):
+        pass
+    return None
+
+
+def ffprobe_duration_ms(path: str) -> int | None:
+    """Read an audio file's duration via ffprobe (one subprocess, headers only).
+
+    Returns:
+        Duration in milliseconds, or None if ffprobe is unavailable or fails
+    """
+    if shutil.which("ffprobe") is None:
+        return None
+
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                path
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return int(float(result.stdout.strip()) * 1000)
+    except (subprocess.SubprocessError, ValueError):
+        pass
+    return None
+
+
+def probe_duration_ms(path: str) -> int | None:
+    """Duration from the headers, or from ffprobe for containers read_duration_ms can't parse."""
+    duration_ms = read_duration_ms(path)
+    if duration_ms is None:
+        duration_ms = ffprobe_duration_ms(path)
+    return duration_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print audio durations read from file headers")
+    parser.add_argument("files", nargs="+", help="Audio files")
+    parser.add_argument("--no-ffprobe", action="store_true", help="Only use the built-in header parsers")
+    args = parser.parse_args()
+
+    probe = read_duration_ms if args.no_ffprobe else probe_duration_ms
+    failed = 0
+    for path in args.files:
+        duration_ms = probe(path)
+        if duration_ms is None:
+            print(f"{path}: unknown", file=sys.stderr)
+            failed += 1
+        else:
+            print(f"{path}: {duration_ms / 1000:.3f}s")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
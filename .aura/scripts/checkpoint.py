@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Per-chunk checkpoints for resumable transcription of long recordings.
+
+A checkpoint directory sits next to the audio file (`audio.wav.chunks/`)
+and holds:
+
+    manifest.json      - source size and SHA-256, model, duration and the cut points used
+    chunk-000.json     - index, time range, upload size, status, transcript
+    chunk-001.json     - ...
+
+Every file is written atomically (temp file + rename), so a crash or Ctrl+C
+never leaves a half-written checkpoint. A later run that finds a matching
+manifest reuses the same cut points and only transcribes chunks whose status
+is not "done". The manifest matches only the same audio bytes: a memo
+re-recorded to the same path and length starts over.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+def checkpoint_dir_for(audio_path: str | Path) -> Path:
+    """Return the checkpoint directory that belongs to an audio file."""
+    audio_path = Path(audio_path)
+    return audio_path.with_name(audio_path.name + ".chunks")
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+class ChunkCheckpoint:
+    """Checkpoint state for one audio file's chunked transcription.
+
+    Example:
+        checkpoint = ChunkCheckpoint(checkpoint_dir_for(path), source_size, source_sha256, model)
+        cut_points = checkpoint.cut_points_ms  # None unless resuming
+        ...
+        checkpoint.start(cut_points, duration_ms)
+        checkpoint.mark_done(0, size_bytes, transcript)
+    """
+
+    def __init__(self, directory: str | Path, source_size: int, source_sha256: str, model: str):
+        self.directory = Path(directory)
+        self.source_size = source_size
+        self.source_sha256 = source_sha256
+        self.model = model
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict | None:
+        """Load the manifest if it describes the same source and model."""
+        manifest = _read_json(self.directory / "manifest.json")
+        if manifest is None:
+            return None
+        if (manifest.get("source_size") != self.source_size
+                or manifest.get("source_sha256") != self.source_sha256
+                or manifest.get("model") != self.model):
+            return None  # Different audio or model: start over
+        return manifest
+
+    @property
+    def cut_points_ms(self) -> list[int] | None:
+        """Cut points of the previous run, or None when not resuming."""
+        if self.manifest is None:
+            return None
+        return self.manifest.get("cut_points_ms")
+
+    def start(self, cut_points_ms: list[int], duration_ms: int) -> None:
+        """Record the chunk layout; stale chunk files are discarded on a fresh start."""
+        if self.manifest is None and self.directory.exists():
+            shutil.rmtree(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.manifest = {
+            "source_size": self.source_size,
+            "source_sha256": self.source_sha256,
+            "model": self.model,
+            "duration_ms": duration_ms,
+            "cut_points_ms": cut_points_ms,
+            "chunk_count": len(cut_points_ms) + 1,
+            "updated": time.time(),
+        }
+        _write_json_atomic(self.directory / "manifest.json", self.manifest)
+
+    def _chunk_path(self, index: int) -> Path:
+        return self.directory / f"chunk-{index:03d}.json"
+
+    def load(self, index: int) -> dict | None:
+        """Return the saved state of chunk `index`, if any."""
+        return _read_json(self._chunk_path(index))
+
+    def transcript(self, index: int) -> str | None:
+        """Return the transcript of chunk `index` if it already completed."""
+        state = self.load(index)
+        if state and state.get("status") == STATUS_DONE:
+            return state.get("transcript")
+        return None
+
+    def chunk_range_ms(self, index: int) -> tuple[int, int]:
+        """Return the (start, end) time range of chunk `index` in milliseconds."""
+        bounds = [0] + self.manifest["cut_points_ms"] + [self.manifest["duration_ms"]]
+        return bounds[index], bounds[index + 1]
+
+    def _save(self, index: int, status: str, size_bytes: int, **extra) -> None:
+        previous = self.load(index) or {}
+        start_ms, end_ms = self.chunk_range_ms(index)
+        data = {
+            "index": index,
+            "start_ms": start_ms,
+            "end_ms": end_ms,
+            "size_bytes": size_bytes,
+            "status": status,
+            "attempts": previous.get("attempts", 0) + 1,
+            "updated": time.time(),
+            **extra,
+        }
+        _write_json_atomic(self._chunk_path(index), data)
+
+    def mark_done(self, index: int, size_bytes: int, transcript: str) -> None:
+        self._save(index, STATUS_DONE, size_bytes, transcript=transcript)
+
+    def mark_failed(self, index: int, size_bytes: int, error: str) -> None:
+        self._save(index, STATUS_FAILED, size_bytes, error=error)
+
+    def summary(self) -> tuple[int, int]:
+        """Return (completed chunks, total chunks)."""
+        if self.manifest is None:
+            return 0, 0
+        total = self.manifest["chunk_count"]
+        done = sum(1 for i in range(total) if self.transcript(i) is not None)
+        return done, total
+
+    def remove(self) -> None:
+        """Delete the checkpoint directory (after a successful transcription)."""
+        shutil.rmtree(self.directory, ignore_errors=True)
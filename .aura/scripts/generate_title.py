@@ -5,21 +5,70 @@ Usage:
     python .aura/scripts/generate_title.py --text "transcription text"
     python .aura/scripts/generate_title.py --file transcription.txt
     echo "transcription text" | python .aura/scripts/generate_title.py
+    python .aura/scripts/generate_title.py --batch transcripts/ > titles.jsonl
+    cat items.jsonl | python .aura/scripts/generate_title.py --batch -
 
 Requirements:
     pip install -r .aura/scripts/requirements.txt
 
 Environment:
     OPENAI_API_KEY - Required. Your OpenAI API key.
+    AURA_TITLE_LOCAL_MAX_WORDS - Optional. Transcripts with at most this many
+        words are titled offline by keyword extraction (default: 0, disabled).
 """
 
 import os
 import sys
 import re
+import json
+import math
+import hashlib
 import argparse
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 
 MAX_TITLE_LENGTH = 50  # Characters before truncation
+LOCAL_TITLE_KEYWORDS = 3  # Keywords joined into an offline title
+
+# Batch mode: how many transcripts are packed into one request
+BATCH_MAX_ITEMS = 40
+BATCH_CHAR_BUDGET = 48000  # Prompt characters per request (~12k tokens)
+BATCH_ITEM_CHARS = 1500  # Each transcript is truncated to this for titling
+
+# Common words that never make a useful title keyword
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further get got had has
+have having he her here hers herself him himself his how i if in into is it its itself just like maybe
+me more most my myself need no nor not now of off on once only or other our ours ourselves out over own
+really same she should so some something such than that the their theirs them themselves then there
+these they thing things think this those through to too um uh under until up very want was we were what
+when where which while who whom why will with would yeah you your yours yourself yourselves going gonna
+kind know let lot make okay one right say see sort still sure take try use used using way well yes
+""".split())
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """Load .aura/.env (or .env in the current dir) once per process."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    # Check .aura/.env first (standard location), then .env in current dir
+    try:
+        from dotenv import load_dotenv
+        aura_env = Path(".aura/.env")
+        if aura_env.exists():
+            load_dotenv(aura_env)
+        else:
+            load_dotenv()  # Falls back to .env in current directory
+    except ImportError:
+        pass  # dotenv not installed, rely on environment variables
 
 
 def sanitize_title(title: str) -> str:
@@ -60,45 +109,166 @@ def sanitize_title(title: str) -> str:
     return title
 
 
-def generate_title(transcription: str, model: str = "gpt-4o-mini") -> str:
-    """Generate a concise title for a transcription using an LLM.
+def get_aura_dir() -> Path:
+    """Find the nearest .aura directory walking up from cwd (cwd/.aura if none)."""
+    cwd = Path.cwd()
+    for parent in [cwd] + list(cwd.parents):
+        if (parent / ".aura").exists():
+            return parent / ".aura"
+    return cwd / ".aura"
+
+
+def title_cache_key(transcription: str, model: str) -> str:
+    """Hash a normalized transcript (case, punctuation, whitespace ignored) with the model."""
+    normalized = " ".join(re.findall(r"[a-z0-9']+", transcription.lower()))
+    return hashlib.sha256(f"{model}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _cached_title(key: str) -> str | None:
+    """Look up a title in the on-disk cache (memoized for the process)."""
+    try:
+        import transcript_cache
+
+        return transcript_cache.get(key, cache_dir=transcript_cache.get_cache_dir("titles"))
+    except Exception:
+        return None
+
+
+def _store_title(key: str, title: str, model: str) -> None:
+    """Save a title to the on-disk cache; cache errors are ignored."""
+    _cached_title.cache_clear()
+    try:
+        import transcript_cache
+
+        transcript_cache.put(key, title, model, cache_dir=transcript_cache.get_cache_dir("titles"))
+    except Exception as e:
+        print(f"Warning: could not write title cache ({e})", file=sys.stderr)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase keyword candidates (stopwords and short words removed)."""
+    return [w for w in re.findall(r"[a-z][a-z0-9]+", text.lower()) if len(w) > 2 and w not in STOPWORDS]
+
+
+@lru_cache(maxsize=4)
+def load_document_frequencies(corpus_dir: str) -> tuple[int, Counter]:
+    """Count, for every word, how many processed visions contain it.
+
+    The corpus is every `*.txt` vision and `*/transcript.txt` under
+    `corpus_dir` (normally .aura/visions/processed).
+
+    Returns:
+        Tuple of (number of documents, Counter of document frequencies)
+    """
+    corpus = Path(corpus_dir)
+    doc_freq = Counter()
+    docs = 0
+    if corpus.exists():
+        for path in list(corpus.glob("*.txt")) + list(corpus.glob("*/transcript.txt")):
+            try:
+                words = set(tokenize(path.read_text(encoding="utf-8", errors="ignore")))
+            except OSError:
+                continue
+            doc_freq.update(words)
+            docs += 1
+    return docs, doc_freq
+
+
+def generate_local_title(transcription: str, corpus_dir: Path | None = None) -> str:
+    """Title a transcript offline from its highest TF-IDF keywords.
+
+    Term frequencies come from the transcript; document frequencies come
+    from the processed visions corpus, so words that appear in every memo
+    ("aura", "project") rank below what makes this memo distinctive.
+    Keywords keep their order of first appearance.
 
     Args:
         transcription: The transcription text to generate a title for
-        model: OpenAI model to use (default: gpt-4o-mini)
+        corpus_dir: Directory of processed visions (default: .aura/visions/processed)
 
     Returns:
         Sanitized kebab-case title
     """
-    # Load environment variables from .env file
-    # Check .aura/.env first (standard location), then .env in current dir
+    words = tokenize(transcription)
+    if not words:
+        return "short-memo"
+
+    if corpus_dir is None:
+        corpus_dir = get_aura_dir() / "visions" / "processed"
+    docs, doc_freq = load_document_frequencies(str(corpus_dir))
+
+    term_freq = Counter(words)
+    first_seen = {}
+    for i, word in enumerate(words):
+        first_seen.setdefault(word, i)
+
+    def score(word: str) -> float:
+        idf = math.log((docs + 1) / (doc_freq[word] + 1)) + 1
+        return term_freq[word] * idf
+
+    keywords = sorted(term_freq, key=lambda w: (-score(w), first_seen[w]))[:LOCAL_TITLE_KEYWORDS]
+    keywords.sort(key=first_seen.get)
+    return sanitize_title(" ".join(keywords))
+
+
+def get_local_max_words() -> int:
+    """Word-count threshold at or below which titles are generated offline."""
     try:
-        from dotenv import load_dotenv
-        from pathlib import Path
-        aura_env = Path(".aura/.env")
-        if aura_env.exists():
-            load_dotenv(aura_env)
-        else:
-            load_dotenv()  # Falls back to .env in current directory
-    except ImportError:
-        pass  # dotenv not installed, rely on environment variables
+        return int(os.environ.get("AURA_TITLE_LOCAL_MAX_WORDS", "0"))
+    except ValueError:
+        return 0
 
-    # Check for API key
-    if not os.environ.get("OPENAI_API_KEY"):
-        raise ValueError("OPENAI_API_KEY environment variable not set")
+
+def generate_title(transcription: str, model: str = "gpt-4o-mini", use_cache: bool = True) -> str:
+    """Generate a concise title for a transcription using an LLM.
+
+    Titles are memoized on a normalized transcript hash (in memory and in
+    .aura/cache/titles/), and transcripts of at most
+    AURA_TITLE_LOCAL_MAX_WORDS words are titled offline by
+    generate_local_title() without a network round-trip.
+
+    Args:
+        transcription: The transcription text to generate a title for
+        model: OpenAI model to use (default: gpt-4o-mini)
+        use_cache: Reuse/store titles in the title cache
+
+    Returns:
+        Sanitized kebab-case title
+    """
+    load_env()
 
     # Handle empty or very short transcriptions
     if not transcription or len(transcription.strip()) < 10:
         return "short-memo"
 
+    local_max_words = get_local_max_words()
+    use_local = local_max_words > 0 and len(transcription.split()) <= local_max_words
+    cache_model = "local-tfidf" if use_local else model
+
+    key = title_cache_key(transcription, cache_model)
+    if use_cache:
+        cached = _cached_title(key)
+        if cached:
+            return cached
+
+    if use_local:
+        title = generate_local_title(transcription)
+        if use_cache:
+            _store_title(key, title, cache_model)
+        return title
+
+    # Check for API key
+    if not os.environ.get("OPENAI_API_KEY"):
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+
     # Handle very long transcriptions - truncate to first 5,000 characters
     if len(transcription) > 10000:
         transcription = transcription[:5000]
 
     try:
-        from openai import OpenAI
-
-        client = OpenAI()
+        from openai_client import get_client, timed
+        from rate_limit import estimate_tokens, schedule
 
         # Construct focused prompt
         prompt = f"""Generate a short, memorable title (2-5 words) for this voice memo transcription.
@@ -108,21 +278,28 @@ Return ONLY the title, no explanation or formatting.
 Transcription:
 {transcription}"""
 
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=50
-        )
+        # Call OpenAI API (429s and timeouts are retried by the scheduler before we fall back)
+        def request():
+            with timed("title"):
+                return get_client().chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=50
+                )
+
+        response = schedule("title", request, tokens=estimate_tokens(prompt, 50))
 
         # Extract title from response
         title = response.choices[0].message.content.strip()
 
-        # Sanitize and return
-        return sanitize_title(title)
+        # Sanitize, remember and return
+        title = sanitize_title(title)
+        if use_cache:
+            _store_title(key, title, model)
+        return title
 
     except Exception as e:
         # Handle API errors - return fallback with timestamp
@@ -131,6 +308,175 @@ Transcription:
         return f"transcription-{timestamp}"
 
 
+def unique_title(title: str, taken: set[str]) -> str:
+    """Return `title`, or `title-2`, `title-3`, ... if already taken, and reserve it."""
+    candidate = title
+    n = 2
+    while candidate in taken:
+        suffix = f"-{n}"
+        candidate = title[:MAX_TITLE_LENGTH - len(suffix)].rstrip("-") + suffix
+        n += 1
+    taken.add(candidate)
+    return candidate
+
+
+def existing_queue_titles(queue_dir: Path | None = None) -> set[str]:
+    """Names already used in .aura/visions/queue (directories and text-vision stems)."""
+    if queue_dir is None:
+        queue_dir = get_aura_dir() / "visions" / "queue"
+    if not queue_dir.exists():
+        return set()
+    return {entry.stem if entry.is_file() else entry.name for entry in queue_dir.iterdir()}
+
+
+def pack_batches(items: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+    """Group (id, text) items into requests within BATCH_MAX_ITEMS and BATCH_CHAR_BUDGET."""
+    batches = []
+    current = []
+    used = 0
+    for item_id, text in items:
+        size = min(len(text), BATCH_ITEM_CHARS) + 16  # Plus numbering and separators
+        if current and (len(current) >= BATCH_MAX_ITEMS or used + size > BATCH_CHAR_BUDGET):
+            batches.append(current)
+            current, used = [], 0
+        current.append((item_id, text))
+        used += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def request_batch_titles(texts: list[str], model: str) -> list[str]:
+    """Ask the LLM for one title per transcript in a single request.
+
+    Raises:
+        ValueError: If the response doesn't contain exactly one title per transcript
+    """
+    from openai_client import get_client, timed
+    from rate_limit import estimate_tokens, schedule
+
+    numbered = "\n\n".join(
+        f"[{i}]\n{text[:BATCH_ITEM_CHARS]}" for i, text in enumerate(texts, 1)
+    )
+    prompt = f"""Generate a short, memorable title (2-5 words) for each of the {len(texts)} voice memo transcriptions below.
+Each title should capture the main topic or purpose of its memo.
+Return ONLY a JSON object of the form {{"titles": ["title for [1]", "title for [2]", ...]}} with exactly {len(texts)} titles in order.
+
+Transcriptions:
+{numbered}"""
+
+    max_tokens = 20 * len(texts) + 50
+
+    def request():
+        with timed("title_batch"):
+            return get_client().chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+            )
+
+    response = schedule("title_batch", request, tokens=estimate_tokens(prompt, max_tokens))
+
+    titles = json.loads(response.choices[0].message.content).get("titles")
+    if not isinstance(titles, list) or len(titles) != len(texts):
+        raise ValueError(f"expected {len(texts)} titles, got {len(titles) if isinstance(titles, list) else 'none'}")
+    return [str(title) for title in titles]
+
+
+def generate_titles_batch(
+    items: list[tuple[str, str]],
+    model: str = "gpt-4o-mini",
+    use_cache: bool = True,
+    taken: set[str] | None = None,
+) -> list[dict]:
+    """Title many transcripts with as few LLM calls as possible.
+
+    Cached titles and short memos (see AURA_TITLE_LOCAL_MAX_WORDS) are
+    resolved without the network; the rest are packed into requests by
+    pack_batches(). If a batch response can't be parsed, its items fall back
+    to one generate_title() call each. Titles are made unique against
+    `taken` (default: existing .aura/visions/queue names) and each other.
+
+    Args:
+        items: (id, transcript) pairs
+        model: OpenAI model to use (default: gpt-4o-mini)
+        use_cache: Reuse/store titles in the title cache
+        taken: Names that must not be reused; updated in place
+
+    Returns:
+        One {"id", "title"} dict per item, in input order
+    """
+    load_env()
+    if taken is None:
+        taken = existing_queue_titles()
+
+    titles: dict[int, str] = {}
+    pending = []
+    local_max_words = get_local_max_words()
+    for index, (_, text) in enumerate(items):
+        if not text or len(text.strip()) < 10:
+            titles[index] = "short-memo"
+        elif use_cache and (cached := _cached_title(title_cache_key(text, model))):
+            titles[index] = cached
+        elif local_max_words > 0 and len(text.split()) <= local_max_words:
+            titles[index] = generate_title(text, model=model, use_cache=use_cache)
+        else:
+            pending.append(index)
+
+    batches = pack_batches([(index, items[index][1]) for index in pending])
+    for n, batch in enumerate(batches, 1):
+        print(f"Requesting titles for batch {n}/{len(batches)} ({len(batch)} transcripts)...", file=sys.stderr)
+        texts = [text for _, text in batch]
+        try:
+            raw_titles = request_batch_titles(texts, model)
+        except Exception as e:
+            print(f"Warning: batch request failed ({e}), titling items one by one", file=sys.stderr)
+            for index, text in batch:
+                titles[index] = generate_title(text, model=model, use_cache=use_cache)
+            continue
+
+        for (index, text), raw in zip(batch, raw_titles):
+            title = sanitize_title(raw)
+            titles[index] = title
+            if use_cache:
+                _store_title(title_cache_key(text, model), title, model)
+
+    return [
+        {"id": item_id, "title": unique_title(titles[index], taken)}
+        for index, (item_id, _) in enumerate(items)
+    ]
+
+
+def read_batch_items(source: str) -> list[tuple[str, str]]:
+    """Read (id, transcript) pairs for batch mode.
+
+    `source` is either a directory (every `*.txt` file and `*/transcript.txt`,
+    id = file stem or directory name) or "-" for JSONL on stdin, one
+    {"id": ..., "text": ...} object per line (id defaults to the line number).
+    """
+    items = []
+    if source == "-":
+        for line_no, line in enumerate(sys.stdin, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            items.append((str(record.get("id", line_no)), record.get("text", "")))
+        return items
+
+    directory = Path(source)
+    if not directory.is_dir():
+        raise ValueError(f"Not a directory: {source}")
+    for path in sorted(directory.glob("*.txt")):
+        items.append((path.stem, path.read_text(encoding="utf-8").strip()))
+    for path in sorted(directory.glob("*/transcript.txt")):
+        items.append((path.parent.name, path.read_text(encoding="utf-8").strip()))
+    return items
+
+
 def main():
     """CLI interface for title generation."""
     parser = argparse.ArgumentParser(
@@ -138,7 +484,8 @@ def main():
         epilog="Examples:\n"
                "  echo 'Meeting notes about API refactor' | python .aura/scripts/generate_title.py\n"
                "  python .aura/scripts/generate_title.py --file transcription.txt\n"
-               "  python .aura/scripts/generate_title.py --text 'Quick memo about the bug fix'\n",
+               "  python .aura/scripts/generate_title.py --text 'Quick memo about the bug fix'\n"
+               "  python .aura/scripts/generate_title.py --batch transcripts/ > titles.jsonl\n",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
@@ -153,6 +500,12 @@ def main():
         type=str,
         help="Use provided text as transcription"
     )
+    input_group.add_argument(
+        "--batch",
+        type=str,
+        metavar="DIR",
+        help="Title every transcript in DIR (or JSONL on stdin with '-') and print JSONL results"
+    )
 
     parser.add_argument(
         "--model",
@@ -160,38 +513,55 @@ def main():
         default="gpt-4o-mini",
         help="OpenAI model to use (default: gpt-4o-mini)"
     )
+    parser.add_argument(
+        "--local",
+        action="store_true",
+        help="Generate the title offline by keyword extraction (no API call)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and don't update the title cache in .aura/cache/titles/"
+    )
 
     args = parser.parse_args()
 
-    # Load environment variables from .env file
-    # Check .aura/.env first (standard location), then .env in current dir
-    try:
-        from dotenv import load_dotenv
-        from pathlib import Path
-        aura_env = Path(".aura/.env")
-        if aura_env.exists():
-            load_dotenv(aura_env)
-        else:
-            load_dotenv()  # Falls back to .env in current directory
-    except ImportError:
-        pass
+    load_env()
 
-    # Check for API key
-    if not os.environ.get("OPENAI_API_KEY"):
+    # Check for API key (not needed for offline titles)
+    if not args.local and not os.environ.get("OPENAI_API_KEY"):
         print("Error: OPENAI_API_KEY environment variable not set", file=sys.stderr)
         print("Set it in .aura/.env or export it: export OPENAI_API_KEY=your-key", file=sys.stderr)
         sys.exit(1)
 
     # Check for required dependencies
-    try:
-        from openai import OpenAI
-    except ImportError:
-        print("Error: openai not installed", file=sys.stderr)
-        print("Install dependencies: pip install -r .aura/scripts/requirements.txt", file=sys.stderr)
-        sys.exit(1)
+    if not args.local:
+        try:
+            from openai import OpenAI
+        except ImportError:
+            print("Error: openai not installed", file=sys.stderr)
+            print("Install dependencies: pip install -r .aura/scripts/requirements.txt", file=sys.stderr)
+            sys.exit(1)
 
     # Get transcription text from appropriate source
     try:
+        if args.batch:
+            items = read_batch_items(args.batch)
+            if not items:
+                print("Error: No transcripts found for batch", file=sys.stderr)
+                sys.exit(1)
+            if args.local:
+                taken = existing_queue_titles()
+                results = [
+                    {"id": item_id, "title": unique_title(generate_local_title(text), taken)}
+                    for item_id, text in items
+                ]
+            else:
+                results = generate_titles_batch(items, model=args.model, use_cache=not args.no_cache)
+            for result in results:
+                print(json.dumps(result))
+            return
+
         if args.file:
             # Read from file
             if not os.path.exists(args.file):
@@ -216,7 +586,10 @@ def main():
             sys.exit(1)
 
         # Generate and print title
-        title = generate_title(transcription.strip(), model=args.model)
+        if args.local:
+            title = generate_local_title(transcription.strip())
+        else:
+            title = generate_title(transcription.strip(), model=args.model, use_cache=not args.no_cache)
         print(title)
 
     except KeyboardInterrupt:
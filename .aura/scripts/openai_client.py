@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Shared OpenAI client for the Aura scripts.
+
+Every script used to build a fresh `OpenAI()` per call, paying DNS, TCP and
+TLS setup each time. This module keeps one client per process on top of a
+pooled, keep-alive httpx connection pool, so transcription chunks and title
+requests reuse warm connections. It also records per-call latency. The
+SDK's own retries are off; rate_limit.py retries throttling and transient
+errors instead.
+
+Usage:
+    from openai_client import get_client, timed
+
+    with timed("transcription"):
+        get_client().audio.transcriptions.create(...)
+
+Environment:
+    AURA_OPENAI_TIMEOUT         - Optional. Read/write timeout in seconds (default: 120)
+    AURA_OPENAI_CONNECT_TIMEOUT - Optional. Connect timeout in seconds (default: 10)
+    AURA_OPENAI_MAX_CONNECTIONS - Optional. Pool size (default: 16)
+    AURA_OPENAI_METRICS         - Optional. Set to 1 to print latency metrics at exit
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_TIMEOUT = 120.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_MAX_CONNECTIONS = 16
+KEEPALIVE_EXPIRY = 60.0  # Seconds an idle connection stays in the pool
+
+_client = None
+_lock = threading.Lock()
+_metrics: dict[str, dict] = {}
+_metrics_lock = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_client():
+    """Return the process-wide OpenAI client, creating it on first use."""
+    global _client
+    if _client is not None:
+        return _client
+
+    with _lock:
+        if _client is None:
+            import httpx
+            from openai import OpenAI
+
+            timeout = _env_float("AURA_OPENAI_TIMEOUT", DEFAULT_TIMEOUT)
+            max_connections = int(_env_float("AURA_OPENAI_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS))
+            http_client = httpx.Client(
+                timeout=httpx.Timeout(timeout, connect=_env_float("AURA_OPENAI_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
+            # Retries are left to rate_limit.py, which backs off and adapts concurrency
+            _client = OpenAI(http_client=http_client, max_retries=0)
+            atexit.register(close_client)
+            if os.environ.get("AURA_OPENAI_METRICS") == "1":
+                atexit.register(print_metrics)
+    return _client
+
+
+def close_client() -> None:
+    """Close the pooled connections (registered to run at exit)."""
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+@contextmanager
+def timed(name: str):
+    """Record the wall-clock latency of the enclosed API call under `name`."""
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        elapsed = time.perf_counter() - start
+        with _metrics_lock:
+            stats = _metrics.setdefault(name, {"calls": 0, "errors": 0, "total_s": 0.0, "min_s": None, "max_s": 0.0})
+            stats["calls"] += 1
+            stats["errors"] += 0 if ok else 1
+            stats["total_s"] += elapsed
+            stats["min_s"] = elapsed if stats["min_s"] is None else min(stats["min_s"], elapsed)
+            stats["max_s"] = max(stats["max_s"], elapsed)
+
+
+def get_metrics() -> dict[str, dict]:
+    """Return a copy of the latency metrics, with mean_s filled in."""
+    with _metrics_lock:
+        metrics = {name: dict(stats) for name, stats in _metrics.items()}
+    for stats in metrics.values():
+        stats["mean_s"] = stats["total_s"] / stats["calls"] if stats["calls"] else 0.0
+    return metrics
+
+
+def print_metrics() -> None:
+    """Print a one-line latency summary per call type to stderr."""
+    for name, stats in sorted(get_metrics().items()):
+        print(
+            f"[openai] {name}: {stats['calls']} calls, {stats['errors']} errors, "
+            f"mean {stats['mean_s']:.2f}s, min {stats['min_s'] or 0:.2f}s, max {stats['max_s']:.2f}s",
+            file=sys.stderr,
+        )
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""Rate-limit-aware scheduling of OpenAI API requests.
+
+Every transcription and title request in a process goes through one
+scheduler, which:
+
+- caps requests in flight with an adaptive (AIMD) concurrency limit: +1 per
+  window of successes, halved on a 429 or a timeout
+- keeps optional request-per-minute and token-per-minute budgets
+- retries 429s, timeouts, connection errors and 5xx responses with jittered
+  exponential backoff, honoring Retry-After, and pauses every caller while
+  the server asks for it
+- counts what happened, so callers can report it
+
+Usage:
+    from rate_limit import schedule
+
+    text = schedule("transcription", lambda: client.audio.transcriptions.create(...).text)
+
+`aura ingest` replaces the default scheduler with configure(). The OpenAI
+client's own retries are disabled (see openai_client.py) so that throttling
+is seen, and adapted to, here.
+
+Environment:
+    AURA_API_MAX_CONCURRENCY - Optional. Upper bound on requests in flight (default: 8)
+    AURA_API_RPM             - Optional. Requests per minute budget (default: unlimited)
+    AURA_API_TPM             - Optional. Tokens per minute budget for title requests (default: unlimited)
+    AURA_API_MAX_RETRIES     - Optional. Retries per request on throttling/transient errors (default: 5)
+    AURA_OPENAI_METRICS      - Optional. Set to 1 to print the scheduler state at exit
+"""
+
+import atexit
+import os
+import random
+import sys
+import threading
+import time
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 5
+BASE_DELAY_S = 1.0  # First backoff step
+MAX_DELAY_S = 60.0  # Backoff ceiling
+DECREASE_FACTOR = 0.5  # Multiplicative decrease on throttling
+DECREASE_COOLDOWN_S = 2.0  # One decrease per burst of 429s, not one per failed request
+BUCKET_WINDOW_S = 10.0  # Token buckets hold up to 10 seconds' worth of budget
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+# Exceptions from openai/httpx that mean "try again", matched by name so this
+# module doesn't import either package
+TIMEOUT_ERRORS = {"APITimeoutError", "TimeoutException", "ReadTimeout", "ConnectTimeout", "WriteTimeout", "PoolTimeout"}
+CONNECTION_ERRORS = {"APIConnectionError", "ConnectError", "RemoteProtocolError"}
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def classify_error(error: Exception) -> str | None:
+    """Return "throttled", "timeout" or "transient" for retryable errors, else None."""
+    status = getattr(error, "status_code", None)
+    if status == 429:
+        return "throttled"
+    names = {cls.__name__ for cls in type(error).__mro__}
+    if names & TIMEOUT_ERRORS or isinstance(error, TimeoutError):
+        return "timeout"
+    if names & CONNECTION_ERRORS or status in RETRYABLE_STATUS:
+        return "transient"
+    return None
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """Read Retry-After (or retry-after-ms) from an API error's response, if present."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Jittered exponential backoff: uniform in [d/2, d] for d = BASE * 2^attempt, capped.
+
+    A server-provided Retry-After is used as the lower bound.
+    """
+    delay = min(MAX_DELAY_S, BASE_DELAY_S * 2 ** attempt)
+    delay = random.uniform(delay / 2, delay)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class TokenBucket:
+    """Per-minute budget that refills continuously."""
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, self.rate * BUCKET_WINDOW_S)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self, amount: float) -> float:
+        """Consume `amount`, blocking until the bucket allows it.
+
+        Requests larger than the bucket go through once it is full and leave
+        it in debt, so they are never starved.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+                self.updated = now
+                need = min(amount, self.capacity)
+                if self.level >= need:
+                    self.level -= amount
+                    return waited
+                delay = (need - self.level) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RateLimitScheduler:
+    """Adaptive concurrency plus request/token budgets for API calls.
+
+    Example:
+        scheduler = RateLimitScheduler(max_concurrency=8, requests_per_minute=50)
+        result = scheduler.call("title", make_request, tokens=1200)
+        print(scheduler.format_state())
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        initial_concurrency: int | None = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(min(initial_concurrency or self.max_concurrency, self.max_concurrency))
+        self.max_retries = max_retries
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self.stats = {
+            "requests": 0,  # Attempts sent, including retries
+            "succeeded": 0,
+            "failed": 0,  # Gave up (non-retryable or out of retries)
+            "throttled": 0,  # 429 responses
+            "timeouts": 0,
+            "transient": 0,  # Connection errors and 5xx
+            "retries": 0,
+            "backoff_s": 0.0,  # Time spent sleeping before retries
+            "budget_wait_s": 0.0,  # Time spent waiting on rpm/tpm budgets
+            "min_limit": self.limit,
+        }
+
+    def _acquire(self, tokens: int) -> None:
+        with self._cond:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause <= 0 and self.in_flight < int(self.limit):
+                    break
+                self._cond.wait(timeout=pause if pause > 0 else None)
+            self.in_flight += 1
+            self.stats["requests"] += 1
+
+        waited = 0.0
+        if self.requests is not None:
+            waited += self.requests.take(1)
+        if self.tokens is not None and tokens:
+            waited += self.tokens.take(tokens)
+        if waited:
+            with self._cond:
+                self.stats["budget_wait_s"] += waited
+
+    def _release(self, outcome: str | None, retry_after: float | None = None) -> None:
+        """Return the slot and adapt the limit: outcome None = success."""
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if outcome is None:
+                # Additive increase: about +1 per `limit` successes
+                self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+            elif outcome in ("throttled", "timeout"):
+                if now - self._last_decrease >= DECREASE_COOLDOWN_S:
+                    self.limit = max(1.0, self.limit * DECREASE_FACTOR)
+                    self._last_decrease = now
+                    self.stats["min_limit"] = min(self.stats["min_limit"], self.limit)
+                if retry_after:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+            self._cond.notify_all()
+
+    def call(self, name: str, fn, tokens: int = 0):
+        """Run `fn()` under the limits, retrying throttling and transient errors.
+
+        Args:
+            name: Request kind, used in log messages (e.g. "transcription")
+            fn: Zero-argument callable performing one API request
+            tokens: Estimated tokens the request consumes (for the TPM budget)
+
+        Returns:
+            Whatever `fn` returns
+
+        Raises:
+            Exception: The error from `fn` once it is non-retryable or retries run out
+        """
+        attempt = 0
+        while True:
+            self._acquire(tokens)
+            try:
+                result = fn()
+            except Exception as e:
+                kind = classify_error(e)
+                retry_after = retry_after_seconds(e) if kind else None
+                self._release(kind or "error", retry_after)
+                with self._cond:
+                    if kind == "throttled":
+                        self.stats["throttled"] += 1
+                    elif kind == "timeout":
+                        self.stats["timeouts"] += 1
+                    elif kind == "transient":
+                        self.stats["transient"] += 1
+                    if kind is None or attempt >= self.max_retries:
+                        self.stats["failed"] += 1
+                        raise
+
+                delay = backoff_delay(attempt, retry_after)
+                print(f"{name}: {kind} ({e.__class__.__name__}), retrying in {delay:.1f}s "
+                      f"[limit {int(self.limit)}]", file=sys.stderr)
+                time.sleep(delay)
+                attempt += 1
+                with self._cond:
+                    self.stats["retries"] += 1
+                    self.stats["backoff_s"] += delay
+                continue
+
+            self._release(None)
+            with self._cond:
+                self.stats["succeeded"] += 1
+            return result
+
+    def state(self) -> dict:
+        """Snapshot of the current limit, load, budgets and counters."""
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "paused_s": max(0.0, self._paused_until - time.monotonic()),
+                "requests_per_minute": self.requests_per_minute,
+                "tokens_per_minute": self.tokens_per_minute,
+                **self.stats,
+            }
+
+    def format_state(self) -> str:
+        """One-line summary of state() for logs."""
+        s = self.state()
+        return (
+            f"limit {s['limit']}/{s['max_concurrency']} (min {int(s['min_limit'])}), {s['in_flight']} in flight; "
+            f"{s['succeeded']} ok, {s['failed']} failed, {s['throttled']} throttled, {s['timeouts']} timeouts, "
+            f"{s['retries']} retries ({s['backoff_s']:.1f}s backoff, {s['budget_wait_s']:.1f}s budget wait)"
+        )
+
+
+def _env_number(name: str) -> float | None:
+    try:
+        value = float(os.environ.get(name, ""))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _env_max_retries() -> int:
+    """AURA_API_MAX_RETRIES, where 0 means no retries; the default if unset or not a number."""
+    try:
+        value = int(os.environ.get("AURA_API_MAX_RETRIES", ""))
+    except ValueError:
+        return DEFAULT_MAX_RETRIES
+    return value if value >= 0 else DEFAULT_MAX_RETRIES
+
+
+def get_scheduler() -> RateLimitScheduler:
+    """Return the process-wide scheduler, configured from the environment on first use."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RateLimitScheduler(
+                    max_concurrency=int(_env_number("AURA_API_MAX_CONCURRENCY") or DEFAULT_MAX_CONCURRENCY),
+                    requests_per_minute=_env_number("AURA_API_RPM"),
+                    tokens_per_minute=_env_number("AURA_API_TPM"),
+                    max_retries=_env_max_retries(),
+                )
+                if os.environ.get("AURA_OPENAI_METRICS") == "1":
+                    atexit.register(print_state)
+    return _scheduler
+
+
+def configure(**kwargs) -> RateLimitScheduler:
+    """Replace the process-wide scheduler (kwargs as for RateLimitScheduler).
+
+    Budgets and limits not given fall back to the environment defaults.
+    """
+    global _scheduler
+    kwargs.setdefault("max_concurrency", int(_env_number("AURA_API_MAX_CONCURRENCY") or DEFAULT_MAX_CONCURRENCY))
+    kwargs.setdefault("requests_per_minute", _env_number("AURA_API_RPM"))
+    kwargs.setdefault("tokens_per_minute", _env_number("AURA_API_TPM"))
+    kwargs.setdefault("max_retries", _env_max_retries())
+    with _scheduler_lock:
+        _scheduler = RateLimitScheduler(**kwargs)
+    return _scheduler
+
+
+def schedule(name: str, fn, tokens: int = 0):
+    """Run one API request through the process-wide scheduler."""
+    return get_scheduler().call(name, fn, tokens)
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 0) -> int:
+    """Rough token count for a chat request (about 4 characters per token)."""
+    return len(text) // 4 + max_output_tokens
+
+
+def print_state() -> None:
+    """Print the scheduler summary to stderr."""
+    if _scheduler is not None and _scheduler.stats["requests"]:
+        print(f"[scheduler] {_scheduler.format_state()}", file=sys.stderr)
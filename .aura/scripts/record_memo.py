@@ -2,7 +2,9 @@
 """Record voice memos with automatic transcription and title generation.
 
 Usage:
-    python .aura/scripts/record_memo.py [--max-duration SECONDS]
+    python .aura/scripts/record_memo.py [--max-duration SECONDS] [--stream] [--format wav|flac|opus] [--trim-silence]
+    python .aura/scripts/record_memo.py --replay recording.wav [--replay-speed 0]
+    python .aura/scripts/record_memo.py --retry .aura/visions/failed/<title>
 
 Records audio via sox, transcribes via OpenAI Whisper, generates a title,
 and saves to .aura/visions/queue/<title>/.
@@ -12,12 +14,31 @@ Requirements:
     - pip install -r .aura/scripts/requirements.txt
 
 Environment:
-    OPENAI_API_KEY - Required. Your OpenAI API key.
+    OPENAI_API_KEY      - Required. Your OpenAI API key.
+    AURA_RECORD_FORMAT  - Optional. Default for --format (default: wav)
+    AURA_TRIM_SILENCE   - Optional. Set to "1" to make --trim-silence the default
 
 Exit Codes:
     0 - Success (audio recorded, transcribed, titled, saved to queue/)
     1 - Recording failed (sox error, no audio)
     2 - Transcription failed (audio saved to failed/)
+
+A failed memo keeps its per-chunk checkpoints (audio.wav.chunks/), so
+--retry only transcribes the chunks that never completed.
+
+--stream transcribes while recording: sox's PCM is read from a pipe, cut
+into segments at pauses and transcribed in the background, so the transcript
+is ready seconds after Ctrl+C (see stream_capture.py). --replay feeds an
+audio file through the same path in place of the microphone.
+
+--format flac|opus encodes the recording on the fly through an ffmpeg pipe
+(audio.flac, or audio.ogg at 24 kbps Opus) instead of writing 16 kHz WAV,
+which shrinks both the saved memo and the upload.
+
+--trim-silence cuts leading/trailing silence and long pauses out of the
+upload (the saved memo keeps the full recording) and reports the seconds
+saved. Streamed segments are already cut at pauses, so it only applies to
+whole-file transcription.
 """
 
 import os
@@ -27,6 +48,7 @@ import shutil
 import subprocess
 import tempfile
 import argparse
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -34,6 +56,9 @@ from pathlib import Path
 # Default maximum recording duration (10 minutes)
 DEFAULT_MAX_DURATION = 600
 
+# Recording format -> file extension (keep in sync with stream_capture.CAPTURE_FORMATS)
+RECORD_FORMATS = {"wav": ".wav", "flac": ".flac", "opus": ".ogg"}
+
 
 def check_sox_installed() -> bool:
     """Check if sox is installed and available."""
@@ -61,16 +86,28 @@ def ensure_directories(visions_dir: Path) -> None:
     (visions_dir / "failed").mkdir(parents=True, exist_ok=True)
 
 
-def record_audio(output_path: Path, max_duration: int = DEFAULT_MAX_DURATION) -> bool:
+def find_memo_audio(memo_dir: Path) -> Path | None:
+    """Return the memo's audio file (audio.wav, audio.flac, audio.ogg, ...), if any."""
+    for path in sorted(memo_dir.glob("audio.*")):
+        if path.is_file():
+            return path
+    return None
+
+
+def record_audio(output_path: Path, max_duration: int = DEFAULT_MAX_DURATION, audio_format: str = "wav") -> bool:
     """Record audio using sox.
 
     Args:
         output_path: Path to save the recorded audio
         max_duration: Maximum recording duration in seconds
+        audio_format: "wav", or "flac"/"opus" to encode through an ffmpeg pipe
 
     Returns:
         True if recording succeeded, False otherwise
     """
+    if audio_format != "wav":
+        return record_compressed(output_path, max_duration, audio_format)
+
     print("Recording... Press Ctrl+C to stop.", file=sys.stderr)
     print(f"(Max duration: {max_duration} seconds)", file=sys.stderr)
 
@@ -121,11 +158,99 @@ def record_audio(output_path: Path, max_duration: int = DEFAULT_MAX_DURATION) ->
         return False
 
 
-def transcribe_audio(audio_path: Path) -> str | None:
+def record_compressed(output_path: Path, max_duration: int, audio_format: str) -> bool:
+    """Record audio as raw PCM from sox and encode it to FLAC/Opus on the fly."""
+    script_dir = Path(__file__).parent
+    sys.path.insert(0, str(script_dir))
+
+    try:
+        from stream_capture import record_to_file
+
+        return record_to_file(output_path, max_duration, audio_format)
+
+    except FileNotFoundError:
+        print("Error: sox not found. Install it with: brew install sox (macOS) or apt install sox (Linux)", file=sys.stderr)
+        return False
+    except Exception as e:
+        print(f"Error during recording: {e}", file=sys.stderr)
+        return False
+    finally:
+        if str(script_dir) in sys.path:
+            sys.path.remove(str(script_dir))
+
+
+def warm_up_client() -> None:
+    """Build the shared OpenAI client (see openai_client.py) before it's needed.
+
+    Importing openai/httpx and setting up the connection pool happens while
+    the user is still talking, instead of after they press Ctrl+C. The same
+    pooled client is then reused for every transcription chunk and the title.
+    """
+    script_dir = Path(__file__).parent
+    sys.path.insert(0, str(script_dir))
+
+    try:
+        from openai_client import get_client
+
+        get_client()
+    except Exception as e:
+        print(f"Warning: could not initialize OpenAI client early ({e})", file=sys.stderr)
+    finally:
+        if str(script_dir) in sys.path:
+            sys.path.remove(str(script_dir))
+
+
+def stream_record_and_transcribe(
+    output_path: Path,
+    max_duration: int = DEFAULT_MAX_DURATION,
+    replay: Path | None = None,
+    replay_speed: float = 1.0,
+    audio_format: str = "wav",
+) -> tuple[bool, str | None]:
+    """Record audio and transcribe it segment by segment while recording.
+
+    Args:
+        output_path: Path to save the recorded audio
+        max_duration: Maximum recording duration in seconds
+        replay: Audio file to replay instead of recording from the microphone
+        replay_speed: Replay rate relative to real time (0 = as fast as possible)
+        audio_format: Format of the saved recording ("wav", "flac" or "opus")
+
+    Returns:
+        Tuple of (recorded, transcript) where transcript is None if transcription failed
+    """
+    script_dir = Path(__file__).parent
+    sys.path.insert(0, str(script_dir))
+
+    try:
+        from stream_capture import stream_record
+
+        return stream_record(
+            output_path,
+            max_duration,
+            replay=str(replay) if replay is not None else None,
+            replay_speed=replay_speed,
+            audio_format=audio_format,
+        )
+
+    except FileNotFoundError:
+        print("Error: sox not found. Install it with: brew install sox (macOS) or apt install sox (Linux)", file=sys.stderr)
+        return False, None
+    except Exception as e:
+        print(f"Error during recording: {e}", file=sys.stderr)
+        return False, None
+    finally:
+        if str(script_dir) in sys.path:
+            sys.path.remove(str(script_dir))
+
+
+def transcribe_audio(audio_path: Path, checkpoint_dir: Path | None = None, trim: bool | None = None) -> str | None:
     """Transcribe audio file using OpenAI Whisper.
 
     Args:
         audio_path: Path to the audio file
+        checkpoint_dir: Optional directory for resumable per-chunk checkpoints
+        trim: Remove long silences before uploading (default: AURA_TRIM_SILENCE)
 
     Returns:
         Transcription text, or None if transcription failed
@@ -135,16 +260,14 @@ def transcribe_audio(audio_path: Path) -> str | None:
     sys.path.insert(0, str(script_dir))
 
     try:
-        from transcribe import transcribe_audio as _transcribe, split_audio_into_chunks, transcribe_chunks, get_audio_duration_ms, CHUNK_THRESHOLD_MS
+        from transcribe import transcribe_file
 
         print("Transcribing...", file=sys.stderr)
-
-        duration_ms = get_audio_duration_ms(str(audio_path))
-        if duration_ms > CHUNK_THRESHOLD_MS:
-            chunk_paths = split_audio_into_chunks(str(audio_path))
-            transcript = transcribe_chunks(chunk_paths, str(audio_path))
-        else:
-            transcript = _transcribe(str(audio_path))
+        transcript = transcribe_file(
+            str(audio_path),
+            checkpoint_dir=str(checkpoint_dir) if checkpoint_dir is not None else None,
+            trim=trim,
+        )
 
         return transcript
 
@@ -191,13 +314,19 @@ def get_fallback_title() -> str:
     return f"memo-{timestamp}"
 
 
-def save_memo(audio_path: Path, transcript: str | None, visions_dir: Path) -> tuple[Path, bool]:
+def save_memo(
+    audio_path: Path,
+    transcript: str | None,
+    visions_dir: Path,
+    checkpoint_dir: Path | None = None,
+) -> tuple[Path, bool]:
     """Save memo to appropriate directory.
 
     Args:
         audio_path: Path to the recorded audio file
         transcript: Transcription text, or None if transcription failed
         visions_dir: Base visions directory (.aura/visions)
+        checkpoint_dir: Chunk checkpoints to keep alongside a failed memo
 
     Returns:
         Tuple of (final_dir, success) where success indicates if saved to queue/
@@ -220,10 +349,17 @@ def save_memo(audio_path: Path, transcript: str | None, visions_dir: Path) -> tu
     # Create directory and move/save files
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    # Move audio file
-    target_audio = target_dir / "audio.wav"
+    # Move audio file (audio.wav, or audio.flac / audio.ogg for compressed captures)
+    target_audio = target_dir / f"audio{audio_path.suffix}"
     shutil.move(str(audio_path), str(target_audio))
 
+    # Keep chunk checkpoints next to a failed memo so --retry can resume
+    if checkpoint_dir is not None and checkpoint_dir.exists():
+        if transcript:
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        else:
+            shutil.move(str(checkpoint_dir), str(target_dir / f"{target_audio.name}.chunks"))
+
     # Save transcript if available
     if transcript:
         target_transcript = target_dir / "transcript.txt"
@@ -233,13 +369,63 @@ def save_memo(audio_path: Path, transcript: str | None, visions_dir: Path) -> tu
         return target_dir, False
 
 
+def retry_failed_memo(failed_dir: Path, visions_dir: Path, trim: bool | None = None) -> tuple[Path, bool]:
+    """Retry transcription of a memo in failed/, resuming from its checkpoints.
+
+    On success the memo directory is renamed into queue/<title>/ with its
+    transcript; on failure it stays in failed/ with updated checkpoints.
+
+    Args:
+        failed_dir: Memo directory under visions/failed/
+        visions_dir: Base visions directory (.aura/visions)
+        trim: Remove long silences before uploading (default: AURA_TRIM_SILENCE)
+
+    Returns:
+        Tuple of (final_dir, success)
+    """
+    audio_path = find_memo_audio(failed_dir)
+    checkpoint_dir = failed_dir / f"{audio_path.name}.chunks"
+
+    if checkpoint_dir.exists():
+        sys.path.insert(0, str(Path(__file__).parent))
+        from transcribe import open_checkpoint
+
+        # Failed chunks have checkpoint files too; only finished ones count
+        done, total = open_checkpoint(str(audio_path), checkpoint_dir, trim=trim).summary()
+        if total:
+            print(f"Found checkpoints: {done}/{total} chunks transcribed, resuming...", file=sys.stderr)
+        else:
+            print("Checkpoints are for another model or recording, starting over...", file=sys.stderr)
+
+    transcript = transcribe_audio(audio_path, checkpoint_dir, trim)
+    if not transcript:
+        return failed_dir, False
+
+    title = generate_title(transcript)
+    target_dir = visions_dir / "queue" / title
+    if target_dir.exists():
+        timestamp = datetime.now().strftime("%H%M%S")
+        target_dir = visions_dir / "queue" / f"{title}-{timestamp}"
+
+    # Write the transcript before the rename so queue/ never sees a partial memo
+    (failed_dir / "transcript.txt").write_text(transcript, encoding="utf-8")
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
+    os.replace(failed_dir, target_dir)
+    return target_dir, True
+
+
 def main():
     """Main entry point for record_memo script."""
     parser = argparse.ArgumentParser(
         description="Record voice memos with automatic transcription and title generation",
         epilog="Examples:\n"
                "  python .aura/scripts/record_memo.py\n"
-               "  python .aura/scripts/record_memo.py --max-duration 120\n",
+               "  python .aura/scripts/record_memo.py --max-duration 120\n"
+               "  python .aura/scripts/record_memo.py --stream\n"
+               "  python .aura/scripts/record_memo.py --stream --format opus\n"
+               "  python .aura/scripts/record_memo.py --trim-silence\n"
+               "  python .aura/scripts/record_memo.py --replay meeting.wav --replay-speed 0\n"
+               "  python .aura/scripts/record_memo.py --retry .aura/visions/failed/memo-20250101-120000\n",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
@@ -249,6 +435,40 @@ def main():
         default=DEFAULT_MAX_DURATION,
         help=f"Maximum recording duration in seconds (default: {DEFAULT_MAX_DURATION})"
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Transcribe segments while recording so the transcript is ready right after Ctrl+C"
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(RECORD_FORMATS),
+        help="Format of the saved recording; flac and opus need ffmpeg (default: $AURA_RECORD_FORMAT or wav)"
+    )
+    parser.add_argument(
+        "--trim-silence",
+        action="store_true",
+        default=None,  # Resolved from AURA_TRIM_SILENCE once .aura/.env is loaded
+        help="Cut long pauses and leading/trailing silence from the upload; the saved audio is kept whole"
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        metavar="AUDIO_FILE",
+        help="Feed an audio file through streaming capture instead of the microphone (implies --stream)"
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Replay rate relative to real time, 0 for as fast as possible (default: 1.0)"
+    )
+    parser.add_argument(
+        "--retry",
+        type=Path,
+        metavar="FAILED_DIR",
+        help="Retry transcription of a memo in visions/failed/ instead of recording"
+    )
 
     args = parser.parse_args()
 
@@ -264,7 +484,11 @@ def main():
         pass
 
     # Check prerequisites
-    if not check_sox_installed():
+    if args.replay is not None and not args.replay.exists():
+        print(f"Error: File not found: {args.replay}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.retry is None and args.replay is None and not check_sox_installed():
         print("Error: sox is not installed", file=sys.stderr)
         print("Install it with: brew install sox (macOS) or apt install sox (Linux)", file=sys.stderr)
         sys.exit(1)
@@ -278,23 +502,54 @@ def main():
     visions_dir = get_aura_visions_dir()
     ensure_directories(visions_dir)
 
+    if args.retry is not None:
+        if find_memo_audio(args.retry) is None:
+            print(f"Error: No audio file in {args.retry}", file=sys.stderr)
+            sys.exit(1)
+        final_dir, success = retry_failed_memo(args.retry, visions_dir, args.trim_silence)
+        if success:
+            print(f"\n✓ Memo saved to: {final_dir}", file=sys.stderr)
+            sys.exit(0)
+        print(f"\n⚠ Transcription failed again. Progress kept in: {final_dir}", file=sys.stderr)
+        sys.exit(2)
+
+    audio_format = args.format or os.environ.get("AURA_RECORD_FORMAT", "wav")
+    if audio_format not in RECORD_FORMATS:
+        print(f"Error: Unsupported AURA_RECORD_FORMAT: {audio_format}", file=sys.stderr)
+        sys.exit(1)
+    if audio_format != "wav" and shutil.which("ffmpeg") is None:
+        print(f"Error: ffmpeg is required to record {audio_format}", file=sys.stderr)
+        sys.exit(1)
+
     # Create temp file for recording
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+    with tempfile.NamedTemporaryFile(suffix=RECORD_FORMATS[audio_format], delete=False) as tmp:
         temp_audio_path = Path(tmp.name)
+    checkpoint_dir = temp_audio_path.with_name(temp_audio_path.name + ".chunks")
 
     try:
-        # Step 1: Record audio
-        if not record_audio(temp_audio_path, args.max_duration):
+        # Step 1: Record audio (the API client is prepared in the background meanwhile)
+        if os.environ.get("AURA_TRANSCRIPTION_BACKEND") != "fake":
+            threading.Thread(target=warm_up_client, daemon=True).start()
+        if args.stream or args.replay is not None:
+            # Steps 1+2: Record and transcribe segments as they complete
+            recorded, transcript = stream_record_and_transcribe(
+                temp_audio_path, args.max_duration, args.replay, args.replay_speed, audio_format
+            )
+        else:
+            recorded, transcript = record_audio(temp_audio_path, args.max_duration, audio_format), None
+
+        if not recorded:
             # Clean up temp file
             if temp_audio_path.exists():
                 temp_audio_path.unlink()
             sys.exit(1)
 
-        # Step 2: Transcribe audio
-        transcript = transcribe_audio(temp_audio_path)
+        # Step 2: Transcribe audio (streaming mode only falls back here if a segment failed)
+        if transcript is None:
+            transcript = transcribe_audio(temp_audio_path, checkpoint_dir, args.trim_silence)
 
         # Step 3: Save memo (handles both success and failure cases)
-        final_dir, success = save_memo(temp_audio_path, transcript, visions_dir)
+        final_dir, success = save_memo(temp_audio_path, transcript, visions_dir, checkpoint_dir)
 
         if success:
             print(f"\n✓ Memo saved to: {final_dir}", file=sys.stderr)
@@ -302,18 +557,20 @@ def main():
             sys.exit(0)
         else:
             print(f"\n⚠ Transcription failed. Audio saved to: {final_dir}", file=sys.stderr)
-            print(f"  You can retry transcription manually or delete the memo.", file=sys.stderr)
+            print(f"  Retry with: python .aura/scripts/record_memo.py --retry {final_dir}", file=sys.stderr)
             sys.exit(2)
 
     except KeyboardInterrupt:
         print("\nAborted.", file=sys.stderr)
         if temp_audio_path.exists():
             temp_audio_path.unlink()
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
         sys.exit(130)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         if temp_audio_path.exists():
             temp_audio_path.unlink()
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
         sys.exit(1)
 
 
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""Transcribe while recording: streaming capture for record_memo.py.
+
+sox writes raw PCM to a pipe instead of a file. Frames are read as they
+arrive, appended to the memo's audio file, and cut into segments at pauses
+in speech. Each finished segment is transcribed on a worker thread while
+recording continues, so after Ctrl+C only the last few seconds still need
+to be sent.
+
+For testing without a microphone, replay_pcm() feeds any audio file through
+the same path (decoded by ffmpeg, or read directly for 16 kHz mono WAV),
+optionally paced in real time:
+
+    python .aura/scripts/record_memo.py --replay meeting.wav --replay-speed 0
+
+The full recording can be written as WAV or, through an ffmpeg encoder
+pipe, as FLAC (lossless, about half the size) or Opus (speech bitrate, about
+a tenth). record_to_file() uses the same pipe for compressed capture without
+streaming transcription.
+
+Requirements:
+    sox (microphone capture), ffmpeg (compressed formats, replay of non-WAV files)
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # Bytes per sample (signed 16-bit)
+FRAME_MS = 20
+FRAME_BYTES = SAMPLE_RATE * FRAME_MS // 1000 * SAMPLE_WIDTH
+READ_BYTES = FRAME_BYTES * 10  # 200 ms per pipe read
+
+MIN_SEGMENT_MS = 20 * 1000  # Don't cut before this much audio has accumulated
+MAX_SEGMENT_MS = 60 * 1000  # Force a cut (at the quietest recent frame) after this
+PAUSE_MS = 400  # This much continuous quiet counts as a pause between phrases
+SILENCE_MIN_RMS = 200.0  # Quiet threshold floor on the 16-bit scale
+SILENCE_FLOOR_FACTOR = 1.5  # Quiet = below this multiple of the segment's 10th-percentile energy
+DEFAULT_STREAM_JOBS = 2
+
+# Capture format -> (file extension, ffmpeg output args); wav is written directly
+CAPTURE_FORMATS = {
+    "wav": (".wav", None),
+    "flac": (".flac", ["-c:a", "flac", "-compression_level", "8", "-f", "flac"]),
+    "opus": (".ogg", ["-c:a", "libopus", "-b:a", "24k", "-application", "voip", "-f", "ogg"]),
+}
+
+
+def sox_pcm_command(max_duration: int) -> list[str]:
+    """sox command that captures the default microphone as raw PCM on stdout."""
+    return [
+        "sox",
+        "-q",
+        "-d",  # Use default audio device
+        "-t", "raw",
+        "-b", "16",
+        "-e", "signed-integer",
+        "-c", "1",  # Mono
+        "-r", str(SAMPLE_RATE),
+        "-",
+        "trim", "0", str(max_duration),
+    ]
+
+
+def read_pcm_blocks(stream):
+    """Yield raw PCM blocks from a binary stream until EOF."""
+    while True:
+        block = stream.read(READ_BYTES)
+        if not block:
+            return
+        yield block
+
+
+def replay_pcm(path: str, speed: float = 1.0, max_duration: int | None = None):
+    """Yield an audio file as 16 kHz mono PCM blocks, standing in for the microphone.
+
+    Args:
+        path: Audio file to replay (16 kHz mono 16-bit WAV is read directly,
+            anything else is decoded through an ffmpeg pipe)
+        speed: Playback rate relative to real time; 0 means as fast as possible
+        max_duration: Stop after this many seconds, like sox's trim
+    """
+    limit = None if max_duration is None else max_duration * SAMPLE_RATE * SAMPLE_WIDTH
+    start = time.monotonic()
+    sent = 0
+
+    process = None
+    reader = None
+    try:
+        with wave.open(path, "rb") as wav:
+            direct = (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) == (SAMPLE_RATE, 1, SAMPLE_WIDTH)
+    except (wave.Error, EOFError, OSError):
+        direct = False
+
+    if direct:
+        reader = wave.open(path, "rb")
+        read = lambda: reader.readframes(READ_BYTES // SAMPLE_WIDTH)
+    else:
+        if shutil.which("ffmpeg") is None:
+            raise RuntimeError("ffmpeg is required to replay non-WAV files")
+        process = subprocess.Popen(
+            ["ffmpeg", "-v", "error", "-i", path, "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "-"],
+            stdout=subprocess.PIPE,
+        )
+        read = lambda: process.stdout.read(READ_BYTES)
+
+    try:
+        while True:
+            block = read()
+            if not block:
+                return
+            if limit is not None:
+                block = block[:limit - sent]
+                if not block:
+                    return
+            sent += len(block)
+            if speed > 0:
+                due = start + sent / (SAMPLE_RATE * SAMPLE_WIDTH) / speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            yield block
+    finally:
+        if reader is not None:
+            reader.close()
+        if process is not None:
+            process.kill()
+            process.wait()
+
+
+class WavSink:
+    """Appends PCM to a 16 kHz mono WAV file as it is captured."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._wav = wave.open(str(self.path), "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(SAMPLE_WIDTH)
+        self._wav.setframerate(SAMPLE_RATE)
+
+    def write(self, pcm: bytes) -> None:
+        self._wav.writeframes(pcm)
+
+    def close(self) -> None:
+        self._wav.close()
+
+
+class EncoderSink:
+    """Pipes PCM into an ffmpeg encoder that writes a compressed file.
+
+    ffmpeg runs in its own session so Ctrl+C reaches only the recorder; the
+    encoder sees EOF on close() and finalizes the file cleanly.
+    """
+
+    def __init__(self, path: Path, codec_args: list[str]):
+        self.path = Path(path)
+        self.process = subprocess.Popen(
+            [
+                "ffmpeg", "-v", "error", "-y",
+                "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", "1", "-i", "-",
+                *codec_args,
+                str(self.path),
+            ],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+
+    def write(self, pcm: bytes) -> None:
+        self.process.stdin.write(pcm)
+
+    def close(self) -> None:
+        """Flush the encoder and wait for it to finish the file.
+
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
+        if self.process.stdin.closed:
+            return
+        self.process.stdin.close()
+        stderr = self.process.stderr.read()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg encoder failed: {stderr.decode(errors='replace').strip()}")
+
+
+def capture_extension(audio_format: str) -> str:
+    """File extension (with dot) used for a capture format."""
+    return CAPTURE_FORMATS[audio_format][0]
+
+
+def open_sink(path: Path, audio_format: str = "wav"):
+    """Open a WAV or ffmpeg-encoded sink for the full recording.
+
+    Raises:
+        RuntimeError: If a compressed format is requested but ffmpeg is missing
+    """
+    codec_args = CAPTURE_FORMATS[audio_format][1]
+    if codec_args is None:
+        return WavSink(path)
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError(f"ffmpeg is required to record {audio_format}")
+    return EncoderSink(path, codec_args)
+
+
+class StreamingTranscriber:
+    """Cuts a live PCM stream into segments and transcribes them as it goes.
+
+    Example:
+        streamer = StreamingTranscriber(WavSink(audio_path))
+        for block in read_pcm_blocks(sox.stdout):
+            streamer.feed(block)
+        transcript = streamer.finish()
+    """
+
+    def __init__(self, sink, jobs: int = DEFAULT_STREAM_JOBS, transcribe=None):
+        from audio_energy import rms_envelope
+
+        if transcribe is None:
+            from transcribe import transcribe_audio as transcribe
+
+        self._rms_envelope = rms_envelope
+        self._transcribe = transcribe
+        self.sink = sink
+        self.segment_dir = Path(tempfile.mkdtemp(prefix="aura-stream-"))
+        self.executor = ThreadPoolExecutor(max_workers=max(1, jobs))
+        self.futures = []
+        self.captured_bytes = 0
+
+        self._segment = bytearray()  # PCM of the segment being accumulated
+        self._envelope: list[float] = []  # RMS per complete frame of _segment
+        self._min_frames = MIN_SEGMENT_MS // FRAME_MS
+        self._max_frames = MAX_SEGMENT_MS // FRAME_MS
+        self._pause_frames = PAUSE_MS // FRAME_MS
+
+    def feed(self, pcm: bytes) -> None:
+        """Consume a block of captured PCM, dispatching any finished segment."""
+        self.sink.write(pcm)
+        self.captured_bytes += len(pcm)
+
+        analyzed = len(self._envelope) * FRAME_BYTES
+        self._segment.extend(pcm)
+        complete = (len(self._segment) - analyzed) // FRAME_BYTES * FRAME_BYTES
+        if complete:
+            new_frames = bytes(self._segment[analyzed:analyzed + complete])
+            self._envelope.extend(self._rms_envelope(new_frames, FRAME_BYTES // SAMPLE_WIDTH))
+
+        cut = self._find_cut()
+        while cut is not None:
+            self._dispatch(cut)
+            cut = self._find_cut()
+
+    def _quiet_threshold(self) -> float:
+        ranked = sorted(self._envelope)
+        floor = ranked[len(ranked) // 10] if ranked else 0.0
+        return max(SILENCE_MIN_RMS, floor * SILENCE_FLOOR_FACTOR)
+
+    def _find_cut(self) -> int | None:
+        """Return a frame index to cut the current segment at, or None to keep going."""
+        frames = len(self._envelope)
+        if frames < self._min_frames:
+            return None
+
+        threshold = self._quiet_threshold()
+        recent = self._envelope[-self._pause_frames:]
+        if len(recent) == self._pause_frames and max(recent) < threshold:
+            return frames - self._pause_frames // 2  # Middle of the pause
+
+        if frames >= self._max_frames:
+            # No pause found: cut at the quietest frame of the last 10 seconds
+            window_start = max(self._min_frames, frames - 10 * 1000 // FRAME_MS)
+            window = self._envelope[window_start:]
+            return window_start + window.index(min(window))
+
+        return None
+
+    def _dispatch(self, cut_frame: int) -> None:
+        """Send the first `cut_frame` frames of the segment off for transcription."""
+        cut_bytes = cut_frame * FRAME_BYTES
+        pcm = bytes(self._segment[:cut_bytes])
+        del self._segment[:cut_bytes]
+        del self._envelope[:cut_frame]
+        self._submit(pcm)
+
+    def _submit(self, pcm: bytes) -> None:
+        index = len(self.futures)
+        path = self.segment_dir / f"segment{index:03d}.wav"
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(SAMPLE_WIDTH)
+            wav.setframerate(SAMPLE_RATE)
+            wav.writeframes(pcm)
+
+        seconds = len(pcm) / (SAMPLE_RATE * SAMPLE_WIDTH)
+        print(f"Segment {index + 1} ({seconds:.1f}s) sent for transcription", file=sys.stderr)
+        self.futures.append(self.executor.submit(self._run, path))
+
+    def _run(self, path: Path) -> str:
+        try:
+            return self._transcribe(str(path))
+        finally:
+            path.unlink(missing_ok=True)
+
+    def finish(self) -> str:
+        """Flush the last segment, wait for all transcriptions and join them in order.
+
+        Raises:
+            Exception: The first segment transcription error, if any
+        """
+        try:
+            self.sink.close()
+            # Ignore trailing audio that is too short or silent to contain speech
+            if self._envelope and max(self._envelope) >= SILENCE_MIN_RMS and len(self._segment) >= FRAME_BYTES * 10:
+                self._submit(bytes(self._segment))
+            self._segment.clear()
+            self._envelope.clear()
+
+            transcripts = [future.result() for future in self.futures]
+            return " ".join(text.strip() for text in transcripts if text.strip())
+        finally:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            shutil.rmtree(self.segment_dir, ignore_errors=True)
+
+    def abort(self) -> None:
+        """Stop without waiting for results and remove temp segments."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        try:
+            self.sink.close()
+        except Exception:
+            pass
+        shutil.rmtree(self.segment_dir, ignore_errors=True)
+
+    @property
+    def captured_seconds(self) -> float:
+        return self.captured_bytes / (SAMPLE_RATE * SAMPLE_WIDTH)
+
+
+def capture(feed, max_duration: int, replay: str | None = None, replay_speed: float = 1.0):
+    """Read PCM from sox (or a replayed file) and pass each block to `feed`.
+
+    Returns when the input ends or the user presses Ctrl+C.
+
+    Returns:
+        The sox process (to inspect stderr), or None when replaying
+    """
+    process = None
+    if replay is not None:
+        print(f"Replaying {replay} in place of the microphone...", file=sys.stderr)
+        blocks = replay_pcm(replay, replay_speed, max_duration)
+    else:
+        print("Recording... Press Ctrl+C to stop.", file=sys.stderr)
+        print(f"(Max duration: {max_duration} seconds)", file=sys.stderr)
+        process = subprocess.Popen(sox_pcm_command(max_duration), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        blocks = read_pcm_blocks(process.stdout)
+
+    try:
+        for block in blocks:
+            feed(block)
+    except KeyboardInterrupt:
+        # sox got the same SIGINT; drain what it already captured
+        if process is not None:
+            for block in read_pcm_blocks(process.stdout):
+                feed(block)
+        print("\nRecording stopped.", file=sys.stderr)
+    finally:
+        if process is not None:
+            process.wait()
+    return process
+
+
+def _report_no_audio(process) -> None:
+    print("Error: No audio recorded", file=sys.stderr)
+    if process is not None and process.stderr is not None:
+        stderr = process.stderr.read()
+        if stderr:
+            print(f"Sox error: {stderr.decode()}", file=sys.stderr)
+
+
+def record_to_file(audio_path: Path, max_duration: int, audio_format: str = "wav") -> bool:
+    """Record from the microphone into a (possibly compressed) file via a pipe.
+
+    Returns:
+        True if any audio was recorded
+    """
+    sink = open_sink(audio_path, audio_format)
+    captured = 0
+
+    def feed(pcm: bytes) -> None:
+        nonlocal captured
+        sink.write(pcm)
+        captured += len(pcm)
+
+    try:
+        process = capture(feed, max_duration)
+    finally:
+        sink.close()
+
+    if captured == 0:
+        _report_no_audio(process)
+        return False
+    return True
+
+
+def stream_record(
+    audio_path: Path,
+    max_duration: int,
+    replay: str | None = None,
+    replay_speed: float = 1.0,
+    jobs: int = DEFAULT_STREAM_JOBS,
+    audio_format: str = "wav",
+) -> tuple[bool, str | None]:
+    """Record (or replay) audio while transcribing finished segments in parallel.
+
+    Ctrl+C stops the capture; the remaining audio is flushed and the
+    transcript is assembled from segments that were mostly done already.
+
+    Args:
+        audio_path: Where the full recording is saved
+        max_duration: Maximum recording duration in seconds
+        replay: Audio file to feed instead of the microphone
+        replay_speed: Replay rate relative to real time (0 = as fast as possible)
+        jobs: Segments transcribed concurrently
+        audio_format: Format of the saved recording (see CAPTURE_FORMATS)
+
+    Returns:
+        Tuple of (audio_recorded, transcript or None if transcription failed)
+    """
+    streamer = StreamingTranscriber(open_sink(audio_path, audio_format), jobs=jobs)
+
+    try:
+        process = capture(streamer.feed, max_duration, replay, replay_speed)
+    except BaseException:
+        streamer.abort()
+        raise
+
+    if streamer.captured_bytes == 0:
+        streamer.abort()
+        _report_no_audio(process)
+        return False, None
+
+    print(f"Captured {streamer.captured_seconds:.1f}s; waiting for remaining segments...", file=sys.stderr)
+    try:
+        return True, streamer.finish() or None
+    except Exception as e:
+        print(f"Transcription error: {e}", file=sys.stderr)
+        return True, None
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Transcription timing history and a processing-time estimator fitted to it.
+
+Every transcription request that reaches the API appends one JSON line to
+.aura/metrics/transcriptions.jsonl with the chunk's audio duration, size,
+model, wall time and the number of requests in flight at the time. The
+file is trimmed to the newest MAX_RECORDS lines as it grows.
+
+estimate_eta() fits wall = overhead + seconds_per_audio_second * audio to
+that history, then simulates transcribing the queue's chunks on N workers
+(longest first), resampling the observed residuals each trial, and reports
+the p50/p90 finishing time.
+
+examples/whisper/scripts/throughput.py is an identical copy, so the example
+stays self-contained; tests/test_script_copies.py fails if the two differ.
+
+Usage:
+    python .aura/scripts/throughput.py [--workers 2] [audio files...]
+"""
+
+import argparse
+import heapq
+import json
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+METRICS_FILE = "transcriptions.jsonl"
+MAX_RECORDS = 5000  # Trim to the newest this many once the file grows past 2x
+MIN_RECORDS = 5  # Fewer than this and there is nothing to fit
+DEFAULT_TRIALS = 300
+# Keep in sync with transcribe.py: long files are split into 5-minute chunks
+CHUNK_DURATION_MS = 5 * 60 * 1000
+CHUNK_THRESHOLD_MS = 8 * 60 * 1000
+
+_write_lock = threading.Lock()
+
+
+def get_metrics_path() -> Path:
+    """Get the .aura/metrics/transcriptions.jsonl path (not created)."""
+    cwd = Path.cwd()
+    for parent in [cwd] + list(cwd.parents):
+        aura_dir = parent / ".aura"
+        if aura_dir.exists():
+            return aura_dir / "metrics" / METRICS_FILE
+    return cwd / ".aura" / "metrics" / METRICS_FILE
+
+
+def record_transcription(
+    audio_ms: int | None,
+    size_bytes: int,
+    model: str,
+    wall_s: float,
+    concurrency: int = 1,
+    path: Path | None = None,
+) -> None:
+    """Append one request's timing to the metrics file; failures are only warned about."""
+    if not audio_ms:
+        return  # Nothing to learn a rate from
+    path = path or get_metrics_path()
+    line = json.dumps({
+        "ts": round(time.time(), 3),
+        "audio_ms": int(audio_ms),
+        "bytes": int(size_bytes),
+        "model": model,
+        "wall_s": round(wall_s, 3),
+        "concurrency": int(concurrency),
+    }) + "\n"
+    try:
+        with _write_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # One write per line in append mode, so concurrent processes don't interleave
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+                size = f.tell()
+            if size > MAX_RECORDS * 2 * len(line):
+                _trim(path)
+    except OSError as e:
+        print(f"Warning: could not record transcription timing ({e})", file=sys.stderr)
+
+
+def _trim(path: Path) -> None:
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    if len(lines) <= MAX_RECORDS:
+        return
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text("".join(lines[-MAX_RECORDS:]), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_records(path: Path | None = None, model: str | None = None) -> list[dict]:
+    """Read the timing history, skipping malformed lines, optionally for one model."""
+    path = path or get_metrics_path()
+    records = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if record["audio_ms"] > 0 and record["wall_s"] > 0:
+                        records.append(record)
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except OSError:
+        return []
+    if model:
+        records = [r for r in records if r.get("model") == model]
+    return records
+
+
+def fit_throughput(records: list[dict]) -> dict | None:
+    """Least-squares fit of wall seconds = overhead + rate * audio seconds.
+
+    Returns:
+        Dict with 'overhead_s', 'rate' (wall seconds per audio second),
+        'residuals' (observed / predicted ratios) and 'count', or None if
+        there are fewer than MIN_RECORDS records
+    """
+    if len(records) < MIN_RECORDS:
+        return None
+    xs = [r["audio_ms"] / 1000 for r in records]
+    ys = [r["wall_s"] for r in records]
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x > 0:
+        rate = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+        overhead = mean_y - rate * mean_x
+    else:
+        rate, overhead = 0.0, mean_y  # All chunks the same length: only a per-request time
+    if rate < 0 or overhead < 0:
+        # Noise can tilt the line; fall back to a pure ratio through the origin
+        rate = sum(ys) / sum(xs)
+        overhead = 0.0
+
+    residuals = []
+    for x, y in zip(xs, ys):
+        predicted = overhead + rate * x
+        if predicted > 0:
+            residuals.append(y / predicted)
+    return {"overhead_s": overhead, "rate": rate, "residuals": residuals or [1.0], "count": n}
+
+
+def split_chunks(duration_ms: int) -> list[int]:
+    """Chunk lengths transcribe.py would upload for a file of this duration."""
+    if duration_ms <= CHUNK_THRESHOLD_MS:
+        return [duration_ms]
+    full, rest = divmod(duration_ms, CHUNK_DURATION_MS)
+    return [CHUNK_DURATION_MS] * full + ([rest] if rest else [])
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def estimate_eta(
+    durations_ms: list[int],
+    workers: int = 2,
+    records: list[dict] | None = None,
+    trials: int = DEFAULT_TRIALS,
+    seed: int = 0,
+) -> dict | None:
+    """Estimate how long transcribing these files takes with `workers` requests in flight.
+
+    Prefers history recorded at the same concurrency when there is enough
+    of it, since per-request latency grows with load.
+
+    Args:
+        durations_ms: Audio durations of the queued files
+        workers: Concurrent transcription requests
+        records: Timing history (default: load_records())
+        trials: Monte Carlo trials
+        seed: Random seed, so repeated calls agree
+
+    Returns:
+        Dict with 'p50_s', 'p90_s', 'records' (history used), 'rate' and
+        'overhead_s', or None without enough history
+    """
+    records = load_records() if records is None else records
+    matching = [r for r in records if r.get("concurrency") == workers]
+    fit = fit_throughput(matching if len(matching) >= MIN_RECORDS else records)
+    if fit is None:
+        return None
+
+    chunks = sorted((ms / 1000 for d in durations_ms if d for ms in split_chunks(d)), reverse=True)
+    if not chunks:
+        return {"p50_s": 0.0, "p90_s": 0.0, "records": fit["count"], "rate": fit["rate"],
+                "overhead_s": fit["overhead_s"]}
+
+    rng = random.Random(seed)
+    residuals = fit["residuals"]
+    workers = max(1, workers)
+    makespans = []
+    for _ in range(trials):
+        # Longest-processing-time-first onto the worker that frees up first
+        finish = [0.0] * min(workers, len(chunks))
+        for audio_s in chunks:
+            took = (fit["overhead_s"] + fit["rate"] * audio_s) * rng.choice(residuals)
+            heapq.heapreplace(finish, finish[0] + took)
+        makespans.append(max(finish))
+
+    return {
+        "p50_s": _percentile(makespans, 50),
+        "p90_s": _percentile(makespans, 90),
+        "records": fit["count"],
+        "rate": fit["rate"],
+        "overhead_s": fit["overhead_s"],
+    }
+
+
+def format_eta(seconds: float) -> str:
+    """Human-readable duration such as 40s, 12 min or 2.5 h."""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f} min"
+    return f"{seconds / 3600:.1f} h"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show transcription throughput and estimate processing time")
+    parser.add_argument("files", nargs="*", help="Audio files to estimate for")
+    parser.add_argument("--workers", type=int, default=2, help="Concurrent transcription requests (default: 2)")
+    args = parser.parse_args()
+
+    records = load_records()
+    fit = fit_throughput(records)
+    if fit is None:
+        print(f"Not enough timing history yet ({len(records)} of {MIN_RECORDS} requests) in {get_metrics_path()}")
+        sys.exit(1)
+    print(f"{fit['count']} requests: {fit['overhead_s']:.1f}s + {fit['rate']:.3f}s per audio second")
+
+    if args.files:
+        from audio_probe import probe_duration_ms
+
+        durations = [probe_duration_ms(path) or 0 for path in args.files]
+        eta = estimate_eta(durations, workers=args.workers, records=records)
+        print(f"Estimated with {args.workers} worker(s): {format_eta(eta['p50_s'])} (p50), "
+              f"{format_eta(eta['p90_s'])} (p90)")
+
+
+if __name__ == "__main__":
+    main()
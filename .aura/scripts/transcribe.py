@@ -2,21 +2,32 @@
 """Transcribe audio files using OpenAI's Whisper API.
 
 Usage:
-    python .aura/scripts/transcribe.py <audio-file-path>
+    python .aura/scripts/transcribe.py <audio-file-path> [--jobs N] [--trim-silence]
 
 Requirements:
     pip install -r .aura/scripts/requirements.txt
 
 Environment:
     OPENAI_API_KEY - Required. Your OpenAI API key.
+    AURA_TRANSCRIPTION_MODEL - Optional. Override the default transcription model.
+    AURA_TRANSCRIPTION_BACKEND - Optional. Set to "fake" to use the local fake
+        backend (no network, deterministic output) for testing.
+    AURA_TRIM_SILENCE - Optional. Set to "1" to make --trim-silence the default.
 """
 
+import argparse
+import hashlib
 import os
+import random
+import shutil
+import subprocess
 import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-SUPPORTED_FORMATS = {"mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"}
+SUPPORTED_FORMATS = {"flac", "mp3", "mp4", "mpeg", "mpga", "m4a", "ogg", "wav", "webm"}
 MAX_FILE_SIZE_MB = 25
 CHUNK_DURATION_MS = 5 * 60 * 1000  # 5 minutes in milliseconds
 CHUNK_THRESHOLD_MS = 8 * 60 * 1000  # Only chunk files longer than 8 minutes
@@ -24,18 +35,168 @@ CHUNK_THRESHOLD_MS = 8 * 60 * 1000  # Only chunk files longer than 8 minutes
 # Map file extensions to ffmpeg export format names (some differ from extension)
 EXPORT_FORMAT_MAP = {"m4a": "ipod", "mpga": "mp3"}
 
+DEFAULT_MODEL = "gpt-4o-mini-transcribe"
+DEFAULT_JOBS = 4  # Chunks uploaded concurrently
+MAX_CHUNK_RETRIES = 2  # Sequential retries per chunk failing with an error the scheduler doesn't retry
+CHUNK_DIR_PREFIX = "aura-chunks-"  # Temp directories holding ffmpeg segments
+SILENCE_TOLERANCE_MS = 15 * 1000  # How far a chunk boundary may move to land in silence
+CHUNK_SIZE_HEADROOM = 0.95  # Keep chunks below 95% of MAX_FILE_SIZE_MB
+
+# Re-encoding of oversized uploads: mono 16 kHz speech at a bitrate chosen to fit
+REENCODE_SAMPLE_RATE = 16000
+REENCODE_MIN_KBPS = 12  # Below this, long files rely on chunking to fit
+REENCODE_MAX_KBPS = 64  # Transparent for speech; no point going higher
+# (extension, ffmpeg muxer, ffmpeg encoder), tried in order. Both muxers can write to a pipe.
+REENCODE_CODECS = [("ogg", "ogg", "libopus"), ("mp3", "mp3", "libmp3lame")]
+
+MIN_TRIM_SAVING_MS = 2000  # Below this, silence trimming isn't worth a re-encode
+
+
+def probe_duration_ms(path: str) -> int | None:
+    """Read an audio file's duration from its container metadata.
+
+    WAV, FLAC, MP3, M4A and Ogg headers are parsed in-process (see
+    audio_probe.py); other containers go through ffprobe. Only headers are
+    read, so this is cheap regardless of recording length.
+
+    Returns:
+        Duration in milliseconds, or None if neither the headers nor ffprobe give one
+    """
+    from audio_probe import probe_duration_ms as probe_headers
+
+    return probe_headers(path)
+
+
+class AudioHandle:
+    """An audio file that is probed cheaply and decoded at most once.
+
+    Duration comes from container metadata when possible. If a decode is
+    unavoidable (unreadable headers and no ffprobe), the decoded
+    AudioSegment is kept and reused for the duration, splitting and export,
+    instead of every step decoding the file again.
+
+    Example:
+        audio = AudioHandle("meeting.m4a")
+        if audio.duration_ms > CHUNK_THRESHOLD_MS:
+            chunk_paths = audio.split()
+    """
+
+    def __init__(self, path: str, duration_ms: int | None = None):
+        self.path = str(path)
+        self.decode_count = 0
+        self._duration_ms = duration_ms
+        self._segment = None
+
+    @property
+    def duration_ms(self) -> int:
+        """Duration in milliseconds (metadata probe, decoding only as a fallback)."""
+        if self._duration_ms is None:
+            if self._segment is None:
+                self._duration_ms = probe_duration_ms(self.path)
+            if self._duration_ms is None:
+                self._duration_ms = len(self.segment)
+        return self._duration_ms
+
+    @property
+    def segment(self):
+        """The decoded pydub AudioSegment, decoded on first access only."""
+        if self._segment is None:
+            from pydub import AudioSegment
+
+            self._segment = AudioSegment.from_file(self.path)
+            self.decode_count += 1
+        return self._segment
+
+    def split(
+        self,
+        chunk_duration_ms: int = CHUNK_DURATION_MS,
+        silence_aware: bool = True,
+        cut_points_ms: list[int] | None = None,
+    ) -> list[str]:
+        """Split into chunks if the audio exceeds CHUNK_THRESHOLD_MS.
+
+        Stream-copies with ffmpeg unless the file is already decoded or
+        ffmpeg is missing, in which case chunks are exported from the
+        decoded buffer.
+
+        Args:
+            chunk_duration_ms: Nominal duration of each chunk in milliseconds
+            silence_aware: Move cuts into nearby quiet regions (see find_cut_points)
+            cut_points_ms: Explicit boundaries (e.g. from a checkpoint); skips planning
+
+        Returns:
+            List of file paths (original path if no splitting needed, or temp chunk paths)
+        """
+        if self.duration_ms <= CHUNK_THRESHOLD_MS:
+            return [self.path]
+
+        if cut_points_ms is None:
+            cut_points_ms = self.plan_cut_points(chunk_duration_ms, silence_aware)
+
+        if self._segment is None and shutil.which("ffmpeg") is not None:
+            return split_audio_with_ffmpeg(self.path, chunk_duration_ms, cut_points_ms)
+
+        return export_chunks(self.segment, self.path, chunk_duration_ms, cut_points_ms)
+
+    def plan_cut_points(self, chunk_duration_ms: int = CHUNK_DURATION_MS, silence_aware: bool = True) -> list[int]:
+        """Return the cut points split() would use, without splitting.
+
+        Falls back to the fixed CHUNK_DURATION_MS grid when silence detection
+        is disabled or fails.
+        """
+        if silence_aware:
+            try:
+                return self.find_cut_points(chunk_duration_ms)
+            except Exception as e:
+                print(f"Warning: silence detection failed ({e}), using fixed chunk boundaries", file=sys.stderr)
+        return list(range(chunk_duration_ms, self.duration_ms, chunk_duration_ms))
+
+    def find_cut_points(self, chunk_duration_ms: int = CHUNK_DURATION_MS) -> list[int]:
+        """Pick chunk boundaries in low-energy regions near the fixed grid.
+
+        Each cut may move up to SILENCE_TOLERANCE_MS from its nominal
+        position, and no chunk is allowed to grow past the upload size limit
+        (estimated from the file's average bytes per millisecond).
+
+        Returns:
+            Cut points in milliseconds, excluding 0 and the end of the audio
+        """
+        from audio_energy import find_quiet_boundaries, rms_envelope_from_file, rms_envelope_from_segment
+
+        if self._segment is not None or shutil.which("ffmpeg") is None:
+            envelope = rms_envelope_from_segment(self.segment)
+        else:
+            envelope = rms_envelope_from_file(self.path)
+
+        bytes_per_ms = os.path.getsize(self.path) / max(self.duration_ms, 1)
+        max_chunk_ms = int(MAX_FILE_SIZE_MB * 1024 * 1024 * CHUNK_SIZE_HEADROOM / max(bytes_per_ms, 1e-9))
+
+        return find_quiet_boundaries(
+            envelope,
+            self.duration_ms,
+            chunk_duration_ms,
+            tolerance_ms=SILENCE_TOLERANCE_MS,
+            max_chunk_ms=min(max_chunk_ms, chunk_duration_ms + SILENCE_TOLERANCE_MS),
+        )
+
 
 def get_audio_duration_ms(path: str) -> int:
-    """Get the duration of an audio file in milliseconds."""
-    from pydub import AudioSegment
+    """Get the duration of an audio file in milliseconds.
 
-    audio = AudioSegment.from_file(path)
-    return len(audio)
+    Uses container metadata (headers, then ffprobe) and only falls back to
+    decoding the whole file with pydub when neither works.
+    """
+    return AudioHandle(path).duration_ms
 
 
 def split_audio_into_chunks(path: str, chunk_duration_ms: int = CHUNK_DURATION_MS) -> list[str]:
     """Split an audio file into chunks if it exceeds the threshold duration.
 
+    Uses ffmpeg's segment muxer with stream copy when available, so memory
+    use stays constant whatever the input length. Falls back to decoding
+    with pydub when ffmpeg is missing. Prefer AudioHandle when the duration
+    is also needed.
+
     Args:
         path: Path to the audio file
         chunk_duration_ms: Duration of each chunk in milliseconds
@@ -43,77 +204,622 @@ def split_audio_into_chunks(path: str, chunk_duration_ms: int = CHUNK_DURATION_M
     Returns:
         List of file paths (original path if no splitting needed, or temp chunk paths)
     """
-    from pydub import AudioSegment
+    return AudioHandle(path).split(chunk_duration_ms)
+
+
+def export_chunks(
+    audio,
+    path: str,
+    chunk_duration_ms: int = CHUNK_DURATION_MS,
+    cut_points_ms: list[int] | None = None,
+) -> list[str]:
+    """Export chunks of an already decoded AudioSegment.
+
+    Args:
+        audio: Decoded pydub AudioSegment
+        path: Original file path (chunks keep its extension)
+        chunk_duration_ms: Duration of each chunk in milliseconds
+        cut_points_ms: Explicit boundaries; overrides chunk_duration_ms
 
-    audio = AudioSegment.from_file(path)
+    Returns:
+        List of temp chunk paths, in playback order
+    """
+    ext = Path(path).suffix.lower().lstrip(".")
+    export_format = EXPORT_FORMAT_MAP.get(ext, ext)
     duration_ms = len(audio)
 
-    if duration_ms <= CHUNK_THRESHOLD_MS:
-        return [path]
+    if cut_points_ms is None:
+        cut_points_ms = list(range(chunk_duration_ms, duration_ms, chunk_duration_ms))
+    bounds = [0] + cut_points_ms + [duration_ms]
 
     chunk_paths = []
-    for i, start_ms in enumerate(range(0, duration_ms, chunk_duration_ms)):
-        end_ms = min(start_ms + chunk_duration_ms, duration_ms)
+    for i, (start_ms, end_ms) in enumerate(zip(bounds, bounds[1:])):
         chunk = audio[start_ms:end_ms]
 
         # Create temp file with same extension for compatibility
-        ext = Path(path).suffix.lower().lstrip(".")
-        export_format = EXPORT_FORMAT_MAP.get(ext, ext)
-        temp_file = tempfile.NamedTemporaryFile(suffix=f".{ext}", delete=False)
+        temp_file = tempfile.NamedTemporaryFile(prefix=f"chunk{i:03d}-", suffix=f".{ext}", delete=False)
         chunk.export(temp_file.name, format=export_format)
         chunk_paths.append(temp_file.name)
 
     return chunk_paths
 
 
-def transcribe_audio(path: str, model: str = "gpt-4o-mini-transcribe") -> str:
+def split_audio_with_ffmpeg(
+    path: str,
+    chunk_duration_ms: int = CHUNK_DURATION_MS,
+    cut_points_ms: list[int] | None = None,
+) -> list[str]:
+    """Cut an audio file into segments with ffmpeg stream copy.
+
+    Packets are copied without decoding, so the audio never exists as raw PCM
+    in memory. Segments are written to a fresh temp directory, which
+    cleanup_chunks() removes once it is empty.
+
+    Args:
+        path: Path to the audio file
+        chunk_duration_ms: Duration of each chunk in milliseconds
+        cut_points_ms: Explicit boundaries; overrides chunk_duration_ms
+
+    Returns:
+        List of temp chunk paths, in playback order
+
+    Raises:
+        RuntimeError: If ffmpeg fails or produces no segments
+    """
+    ext = Path(path).suffix.lower().lstrip(".")
+    export_format = EXPORT_FORMAT_MAP.get(ext, ext)
+    out_dir = tempfile.mkdtemp(prefix=CHUNK_DIR_PREFIX)
+
+    if cut_points_ms:
+        segment_args = ["-segment_times", ",".join(f"{ms / 1000:.3f}" for ms in cut_points_ms)]
+    else:
+        segment_args = ["-segment_time", f"{chunk_duration_ms / 1000:.3f}"]
+
+    cmd = [
+        "ffmpeg",
+        "-v", "error",
+        "-i", path,
+        "-map", "0:a",  # Audio only (drops cover art / video streams)
+        "-c", "copy",
+        "-fflags", "+bitexact",  # Deterministic bytes, so chunk cache keys are stable across runs
+        "-f", "segment",
+        *segment_args,
+        "-segment_format", export_format,
+        "-reset_timestamps", "1",
+        os.path.join(out_dir, f"chunk%03d.{ext}"),
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    chunk_paths = sorted(os.path.join(out_dir, name) for name in os.listdir(out_dir))
+    if result.returncode != 0 or not chunk_paths:
+        cleanup_chunks(chunk_paths, path)
+        shutil.rmtree(out_dir, ignore_errors=True)
+        raise RuntimeError(f"ffmpeg failed to split audio: {result.stderr.decode(errors='replace').strip()}")
+
+    return chunk_paths
+
+
+def choose_bitrate_kbps(duration_ms: int, max_bytes: int = MAX_FILE_SIZE_MB * 1024 * 1024) -> int:
+    """Pick the highest re-encode bitrate at which `duration_ms` of audio fits in `max_bytes`.
+
+    Clamped to [REENCODE_MIN_KBPS, REENCODE_MAX_KBPS]; at the floor a very
+    long file may still exceed the limit, which chunking then takes care of.
+    """
+    seconds = max(duration_ms / 1000, 1)
+    kbps = int(max_bytes * 8 * CHUNK_SIZE_HEADROOM / seconds / 1000)
+    return max(REENCODE_MIN_KBPS, min(REENCODE_MAX_KBPS, kbps))
+
+
+def reencode_for_upload(path: str, duration_ms: int, audio_filter: str | None = None) -> str:
+    """Re-encode audio to compact mono 16 kHz speech that fits the upload limit.
+
+    ffmpeg decodes and encodes in one pass and writes the compressed stream
+    to a pipe, which is copied into a temp file; no uncompressed audio ever
+    touches the disk.
+
+    Args:
+        path: Path to the audio file
+        duration_ms: Duration of the output audio, used to choose the bitrate
+        audio_filter: Optional ffmpeg audio filter chain applied while re-encoding
+
+    Returns:
+        Path of the re-encoded temp file (caller deletes it)
+
+    Raises:
+        RuntimeError: If ffmpeg is missing or no encoder succeeded
+    """
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is required to re-encode files larger than "
+                           f"{MAX_FILE_SIZE_MB}MB")
+
+    kbps = choose_bitrate_kbps(duration_ms)
+    errors = []
+    for ext, muxer, encoder in REENCODE_CODECS:
+        cmd = [
+            "ffmpeg",
+            "-v", "error",
+            "-i", path,
+            "-vn",
+            *(["-af", audio_filter] if audio_filter else []),
+            "-ac", "1",
+            "-ar", str(REENCODE_SAMPLE_RATE),
+            "-c:a", encoder,
+            "-b:a", f"{kbps}k",
+            "-fflags", "+bitexact",  # No random stream serials, so cache keys are stable
+            "-flags:a", "+bitexact",
+            "-f", muxer,
+            "pipe:1",
+        ]
+        temp_file = tempfile.NamedTemporaryFile(prefix="reencoded-", suffix=f".{ext}", delete=False)
+        with temp_file:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            shutil.copyfileobj(process.stdout, temp_file, 1 << 20)
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            process.wait()
+
+        if process.returncode == 0 and os.path.getsize(temp_file.name) > 0:
+            return temp_file.name
+
+        os.unlink(temp_file.name)
+        errors.append(f"{encoder}: {stderr.decode(errors='replace').strip()}")
+
+    raise RuntimeError("ffmpeg failed to re-encode audio: " + "; ".join(errors))
+
+
+def fit_to_upload_limit(audio: AudioHandle) -> AudioHandle:
+    """Return `audio` unchanged if it is within MAX_FILE_SIZE_MB, else a re-encoded copy.
+
+    When a new handle is returned its path is a temp file the caller must
+    delete once done.
+    """
+    size_mb = os.path.getsize(audio.path) / (1024 * 1024)
+    if size_mb <= MAX_FILE_SIZE_MB:
+        return audio
+
+    duration_ms = audio.duration_ms
+    kbps = choose_bitrate_kbps(duration_ms)
+    print(f"File is {size_mb:.1f}MB (limit {MAX_FILE_SIZE_MB}MB), re-encoding to mono "
+          f"{REENCODE_SAMPLE_RATE // 1000}kHz at {kbps}kbps...", file=sys.stderr)
+    reencoded = AudioHandle(reencode_for_upload(audio.path, duration_ms), duration_ms=duration_ms)
+    print(f"Re-encoded to {os.path.getsize(reencoded.path) / (1024 * 1024):.1f}MB", file=sys.stderr)
+    return reencoded
+
+
+def speech_filter(regions: list[tuple[int, int]]) -> str:
+    """ffmpeg filter chain that keeps only `regions` (ms) and plays them back to back.
+
+    Audio is cut into 20 ms frames first, so every region boundary (a
+    multiple of the analysis frame) falls exactly on a frame edge.
+    """
+    from audio_energy import DEFAULT_FRAME_MS
+
+    frame_samples = REENCODE_SAMPLE_RATE * DEFAULT_FRAME_MS // 1000
+    keep = "+".join(f"gte(t,{start / 1000:.3f})*lt(t,{end / 1000:.3f})" for start, end in regions)
+    return (f"aresample={REENCODE_SAMPLE_RATE},asetnsamples=n={frame_samples}:p=0,"
+            f"aselect='{keep}',asetpts=N/SR/TB")
+
+
+def trim_silence(audio: AudioHandle) -> tuple[AudioHandle, "TimestampMap"]:
+    """Return a copy of `audio` with long silences removed, and the map back to original time.
+
+    Speech is found from the frame-energy envelope (see
+    audio_energy.find_speech_regions). The kept regions are re-encoded like
+    oversized uploads, so the result also fits the upload limit. If there is
+    too little silence to be worth it, or ffmpeg is missing, `audio` is
+    returned unchanged with an identity map.
+
+    When a new handle is returned its path is a temp file the caller must
+    delete once done.
+    """
+    from audio_energy import TimestampMap, find_speech_regions, rms_envelope_from_file
+
+    duration_ms = audio.duration_ms
+    try:
+        regions = find_speech_regions(rms_envelope_from_file(audio.path), duration_ms)
+    except RuntimeError as e:
+        print(f"Warning: silence trimming skipped ({e})", file=sys.stderr)
+        return audio, TimestampMap.identity(duration_ms)
+
+    timestamps = TimestampMap(regions, duration_ms)
+    if timestamps.removed_ms < MIN_TRIM_SAVING_MS:
+        return audio, TimestampMap.identity(duration_ms)
+
+    try:
+        trimmed_path = reencode_for_upload(audio.path, timestamps.kept_ms, speech_filter(regions))
+    except RuntimeError as e:
+        print(f"Warning: silence trimming skipped ({e})", file=sys.stderr)
+        return audio, TimestampMap.identity(duration_ms)
+    trimmed = AudioHandle(trimmed_path, duration_ms=timestamps.kept_ms)
+    print(f"Trimmed {timestamps.removed_ms / 1000:.1f}s of silence "
+          f"({duration_ms / 1000:.1f}s -> {timestamps.kept_ms / 1000:.1f}s uploaded)", file=sys.stderr)
+    return trimmed, timestamps
+
+
+def cleanup_chunks(chunk_paths: list[str], original_path: str) -> None:
+    """Delete temporary chunk files (and their temp directory, once empty)."""
+    for chunk_path in chunk_paths:
+        if chunk_path != original_path and os.path.exists(chunk_path):
+            os.unlink(chunk_path)
+            parent = os.path.dirname(chunk_path)
+            if os.path.basename(parent).startswith(CHUNK_DIR_PREFIX):
+                try:
+                    os.rmdir(parent)
+                except OSError:
+                    pass  # Other chunks still present
+
+
+def get_transcription_model() -> str:
+    """Resolve the transcription model (AURA_TRANSCRIPTION_MODEL overrides the default)."""
+    return os.environ.get("AURA_TRANSCRIPTION_MODEL") or DEFAULT_MODEL
+
+
+def trim_silence_enabled() -> bool:
+    """Whether silence trimming is on by default (AURA_TRIM_SILENCE=1)."""
+    return os.environ.get("AURA_TRIM_SILENCE") == "1"
+
+
+def _cache_model_id(model: str) -> str:
+    """Model identifier used in cache keys; keeps fake-backend output separate."""
+    if os.environ.get("AURA_TRANSCRIPTION_BACKEND") == "fake":
+        return f"fake:{model}"
+    return model
+
+
+def _file_model(model: str, trim: bool) -> str:
+    """Model identifier for whole-file transcripts and checkpoints."""
+    # Only the upload is affected; chunk transcripts are keyed by their own bytes anyway
+    return f"{model}+trim" if trim else model
+
+
+def open_checkpoint(path: str, checkpoint_dir: str | Path, model: str | None = None,
+                    trim: bool | None = None) -> "ChunkCheckpoint":
+    """Open the checkpoint transcribe_file() would use for `path` with these settings."""
+    from checkpoint import ChunkCheckpoint
+    from transcript_cache import hash_file
+
+    model = model or get_transcription_model()
+    if trim is None:
+        trim = trim_silence_enabled()
+    return ChunkCheckpoint(
+        checkpoint_dir, os.path.getsize(path), hash_file(path), _cache_model_id(_file_model(model, trim))
+    )
+
+
+def _cache_get(path: str, model: str) -> tuple[str | None, str | None]:
+    """Look up a transcript for `path`; returns (transcript, key). Never raises."""
+    try:
+        import transcript_cache
+
+        key = transcript_cache.audio_cache_key(path, _cache_model_id(model))
+        return transcript_cache.get(key), key
+    except Exception as e:
+        print(f"Warning: transcript cache unavailable ({e})", file=sys.stderr)
+        return None, None
+
+
+def _cache_put(key: str | None, transcript: str, model: str, source: str) -> None:
+    """Store a transcript under `key`; cache errors are reported, not raised."""
+    if key is None:
+        return
+    try:
+        import transcript_cache
+
+        transcript_cache.put(key, transcript, _cache_model_id(model), source=source)
+    except Exception as e:
+        print(f"Warning: could not write transcript cache ({e})", file=sys.stderr)
+
+
+def transcribe_audio(path: str, model: str | None = None, use_cache: bool = True) -> str:
     """Transcribe an audio file using OpenAI's Whisper API.
 
     Args:
         path: Path to the audio file
-        model: OpenAI model to use for transcription
+        model: OpenAI model to use for transcription (default: get_transcription_model())
+        use_cache: Reuse/store the transcript in the content-addressed cache
 
     Returns:
         Transcribed text
     """
-    from openai import OpenAI
+    model = model or get_transcription_model()
+
+    key = None
+    if use_cache:
+        cached, key = _cache_get(path, model)
+        if cached is not None:
+            print(f"Using cached transcript for {Path(path).name}", file=sys.stderr)
+            return cached
+
+    from openai_client import get_client, timed
+    from rate_limit import get_scheduler, schedule
+
+    def request() -> str:
+        with timed("transcription"):
+            if os.environ.get("AURA_TRANSCRIPTION_BACKEND") == "fake":
+                return fake_transcribe_audio(path, model)
+            concurrency = get_scheduler().in_flight
+            start = time.perf_counter()
+            with open(path, "rb") as f:
+                tx = get_client().audio.transcriptions.create(
+                    model=model,
+                    file=f,
+                )
+            _record_timing(path, model, time.perf_counter() - start, concurrency)
+            return tx.text
+
+    # Throttling and transient errors are retried with backoff by the scheduler
+    text = schedule("transcription", request)
+
+    _cache_put(key, text, model, source=Path(path).name)
+    return text
+
+
+def _record_timing(path: str, model: str, wall_s: float, concurrency: int) -> None:
+    """Add a successful request to the throughput history (see throughput.py)."""
+    from audio_probe import read_duration_ms
+    from throughput import record_transcription
 
-    client = OpenAI()
-    with open(path, "rb") as f:
-        tx = client.audio.transcriptions.create(
-            model=model,
-            file=f,
-        )
-    return tx.text
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return
+    record_transcription(read_duration_ms(path), size, model, wall_s, concurrency)
+
+
+def fake_transcribe_audio(path: str, model: str = DEFAULT_MODEL) -> str:
+    """Local stand-in for the transcription API, used for testing without network.
 
+    Output is deterministic for a given file: its name plus a short content
+    digest, so ordering of reassembled chunks can be checked. Behaviour is
+    tuned with environment variables:
 
-def transcribe_chunks(chunk_paths: list[str], original_path: str, model: str = "gpt-4o-mini-transcribe") -> str:
+        AURA_FAKE_LATENCY    - Max seconds of random delay per call (default: 0)
+        AURA_FAKE_FAIL_RATE  - Probability in [0, 1] of raising an error (default: 0)
+
+    Args:
+        path: Path to the audio file
+        model: Ignored; accepted for signature compatibility
+
+    Returns:
+        Fake transcribed text
+    """
+    latency = float(os.environ.get("AURA_FAKE_LATENCY", "0"))
+    fail_rate = float(os.environ.get("AURA_FAKE_FAIL_RATE", "0"))
+
+    if latency > 0:
+        time.sleep(random.uniform(0, latency))
+    if fail_rate > 0 and random.random() < fail_rate:
+        raise RuntimeError(f"fake backend error for {Path(path).name}")
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return f"[{Path(path).stem} {digest.hexdigest()[:8]}]"
+
+
+def transcribe_chunks(
+    chunk_paths: list[str],
+    original_path: str,
+    model: str | None = None,
+    jobs: int = DEFAULT_JOBS,
+    use_cache: bool = True,
+    checkpoint=None,
+) -> str:
     """Transcribe multiple audio chunks and concatenate the results.
 
+    Chunks are uploaded concurrently (at most `jobs` at a time). Throttling
+    and transient API errors are already retried with backoff by the
+    scheduler (rate_limit.py), so a chunk failing with one of those fails
+    the file. Other errors get up to MAX_CHUNK_RETRIES sequential retries.
+    Transcripts are always joined in chunk order.
+
+    With a checkpoint (see checkpoint.py), chunks already marked done are
+    not re-sent, and every chunk's outcome is recorded as soon as it is
+    known so a later run can resume.
+
     Args:
         chunk_paths: List of paths to audio chunk files
         original_path: Original audio file path (to know which files are temp)
-        model: OpenAI model to use for transcription
+        model: OpenAI model to use for transcription (default: get_transcription_model())
+        jobs: Maximum number of chunks transcribed concurrently
+        use_cache: Reuse/store each chunk's transcript in the cache
+        checkpoint: Optional ChunkCheckpoint matching chunk_paths
 
     Returns:
         Concatenated transcribed text from all chunks
+
+    Raises:
+        Exception: The last error of a chunk that still fails after retries
     """
-    transcripts = []
+    total = len(chunk_paths)
+    transcripts: list[str | None] = [None] * total
+
+    def run(index: int) -> str:
+        print(f"Transcribing chunk {index + 1}/{total}...", file=sys.stderr)
+        transcript = transcribe_audio(chunk_paths[index], model, use_cache=use_cache)
+        if checkpoint is not None:
+            checkpoint.mark_done(index, os.path.getsize(chunk_paths[index]), transcript)
+        return transcript
+
+    def record_failure(index: int, error: Exception) -> None:
+        if checkpoint is not None:
+            checkpoint.mark_failed(index, os.path.getsize(chunk_paths[index]), str(error))
+
+    pending = list(range(total))
+    if checkpoint is not None:
+        for i in range(total):
+            transcripts[i] = checkpoint.transcript(i)
+        pending = [i for i in range(total) if transcripts[i] is None]
+        if len(pending) < total:
+            print(f"Resuming: {total - len(pending)}/{total} chunks already transcribed", file=sys.stderr)
+
+    from rate_limit import classify_error
+
     try:
-        for i, chunk_path in enumerate(chunk_paths):
-            print(f"Transcribing chunk {i + 1}/{len(chunk_paths)}...", file=sys.stderr)
-            transcript = transcribe_audio(chunk_path, model)
-            transcripts.append(transcript)
+        failed = []
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(pending) or 1))) as pool:
+            futures = {i: pool.submit(run, i) for i in pending}
+            for i, future in futures.items():
+                try:
+                    transcripts[i] = future.result()
+                except Exception as e:
+                    print(f"Chunk {i + 1}/{total} failed: {e}", file=sys.stderr)
+                    record_failure(i, e)
+                    failed.append((i, e))
+
+        # Retry failures sequentially so a flaky API isn't hammered further.
+        # The scheduler has already spent its retries on throttling and
+        # transient errors; retrying those here would multiply billed attempts.
+        for i, error in failed:
+            if classify_error(error) is not None:
+                raise error
+        for i, _ in failed:
+            for attempt in range(1, MAX_CHUNK_RETRIES + 1):
+                print(f"Retrying chunk {i + 1}/{total} (attempt {attempt}/{MAX_CHUNK_RETRIES})...", file=sys.stderr)
+                try:
+                    transcripts[i] = run(i)
+                    break
+                except Exception as e:
+                    record_failure(i, e)
+                    if attempt == MAX_CHUNK_RETRIES or classify_error(e) is not None:
+                        raise
     finally:
         # Clean up temporary chunk files
-        for chunk_path in chunk_paths:
-            if chunk_path != original_path and os.path.exists(chunk_path):
-                os.unlink(chunk_path)
+        cleanup_chunks(chunk_paths, original_path)
 
     return " ".join(transcripts)
 
 
+def transcribe_file(
+    path: str,
+    model: str | None = None,
+    jobs: int = DEFAULT_JOBS,
+    silence_aware: bool = True,
+    use_cache: bool = True,
+    checkpoint_dir: str | None = None,
+    trim: bool | None = None,
+) -> str:
+    """Transcribe an audio file end to end.
+
+    Re-encodes oversized files, splits long ones into chunks, transcribes
+    them concurrently, and caches both the whole-file and per-chunk
+    transcripts so repeat runs are free.
+
+    With `trim`, long silences are cut out before upload (see
+    trim_silence), so less audio is billed. Trimmed and untrimmed
+    transcripts are cached and checkpointed separately.
+
+    With `checkpoint_dir`, per-chunk progress is written there as it
+    happens. A later call with the same directory reuses the recorded chunk
+    layout and only transcribes the missing chunks; the directory is
+    removed once the whole file succeeds.
+
+    Args:
+        path: Path to the audio file
+        model: OpenAI model to use for transcription (default: get_transcription_model())
+        jobs: Maximum number of chunks transcribed concurrently
+        silence_aware: Move chunk boundaries into nearby silence
+        use_cache: Reuse/store transcripts in the content-addressed cache
+        checkpoint_dir: Directory for resumable per-chunk checkpoints
+        trim: Remove long silences before uploading (default: AURA_TRIM_SILENCE=1)
+
+    Returns:
+        Transcribed text
+    """
+    model = model or get_transcription_model()
+    if trim is None:
+        trim = trim_silence_enabled()
+    file_model = _file_model(model, trim)
+
+    checkpoint = None
+    if checkpoint_dir is not None:
+        checkpoint = open_checkpoint(path, checkpoint_dir, model, trim)
+
+    key = None
+    if use_cache:
+        cached, key = _cache_get(path, file_model)
+        if cached is not None:
+            print(f"Using cached transcript for {Path(path).name}", file=sys.stderr)
+            return cached
+
+    timestamps = None
+    trimmed = audio = AudioHandle(path)
+    try:
+        if trim:
+            trimmed, timestamps = trim_silence(audio)
+        audio = fit_to_upload_limit(trimmed)
+        duration_ms = audio.duration_ms
+        if duration_ms > CHUNK_THRESHOLD_MS:
+            print(f"Audio is {duration_ms / 1000 / 60:.1f} minutes, splitting into chunks...", file=sys.stderr)
+            cut_points_ms = checkpoint.cut_points_ms if checkpoint is not None else None
+            if cut_points_ms is None:
+                cut_points_ms = audio.plan_cut_points(silence_aware=silence_aware)
+            if checkpoint is not None:
+                checkpoint.start(cut_points_ms, duration_ms)
+            chunk_paths = audio.split(cut_points_ms=cut_points_ms)
+            print(f"Split into {len(chunk_paths)} chunks", file=sys.stderr)
+            if timestamps is not None and timestamps.removed_ms:
+                starts = ", ".join(f"{timestamps.to_original(ms) / 1000:.1f}s" for ms in cut_points_ms)
+                print(f"Chunk boundaries in the original recording: {starts}", file=sys.stderr)
+            transcript = transcribe_chunks(
+                chunk_paths, audio.path, model, jobs=jobs, use_cache=use_cache, checkpoint=checkpoint
+            )
+        else:
+            transcript = transcribe_audio(audio.path, model, use_cache=use_cache)
+    finally:
+        # Remove the trimmed and re-encoded copies, if any were made
+        for temp_path in {trimmed.path, audio.path} - {path}:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    _cache_put(key, transcript, file_model, source=Path(path).name)
+    if checkpoint is not None:
+        checkpoint.remove()
+    return transcript
+
+
 def main():
+    parser = argparse.ArgumentParser(
+        description="Transcribe audio files using OpenAI's Whisper API",
+        epilog="Examples:\n"
+               "  python .aura/scripts/transcribe.py memo.m4a\n"
+               "  python .aura/scripts/transcribe.py meeting.wav --jobs 8\n"
+               "  python .aura/scripts/transcribe.py memo.wav --trim-silence\n",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("audio_path", help="Path to the audio file")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of chunks to transcribe concurrently (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--fixed-chunks",
+        action="store_true",
+        help="Cut chunks at fixed offsets instead of moving boundaries into silence"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and don't update the transcript cache in .aura/cache/"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Record per-chunk progress in <audio>.chunks/ and resume from it on the next run"
+    )
+    parser.add_argument(
+        "--trim-silence",
+        action="store_true",
+        default=None,  # Resolved from AURA_TRIM_SILENCE once .aura/.env is loaded
+        help="Cut long pauses and leading/trailing silence before upload (needs ffmpeg)"
+    )
+
+    args = parser.parse_args()
+
     # Load environment variables from .env file
     # Check .aura/.env first (standard location), then .env in current dir
     try:
@@ -127,12 +833,12 @@ def main():
     except ImportError:
         pass  # dotenv not installed, rely on environment variables
 
-    if len(sys.argv) < 2:
-        print("Error: No audio file path provided", file=sys.stderr)
-        print(f"Usage: python .aura/scripts/transcribe.py <audio-file-path>", file=sys.stderr)
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
         sys.exit(1)
 
-    audio_path = sys.argv[1]
+    audio_path = args.audio_path
+    fake_backend = os.environ.get("AURA_TRANSCRIPTION_BACKEND") == "fake"
 
     # Check if file exists
     if not os.path.exists(audio_path):
@@ -146,15 +852,15 @@ def main():
         print(f"Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}", file=sys.stderr)
         sys.exit(1)
 
-    # Check file size
+    # Files over the upload limit are re-encoded automatically, which needs ffmpeg
     file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-    if file_size_mb > MAX_FILE_SIZE_MB:
+    if file_size_mb > MAX_FILE_SIZE_MB and shutil.which("ffmpeg") is None:
         print(f"Error: File too large ({file_size_mb:.1f}MB). Maximum is {MAX_FILE_SIZE_MB}MB.", file=sys.stderr)
-        print("Tip: Compress with ffmpeg: ffmpeg -i input.m4a -vn -ac 1 -ar 16000 -b:a 48k output.m4a", file=sys.stderr)
+        print("Install ffmpeg to re-encode large files automatically (brew install ffmpeg / apt install ffmpeg)", file=sys.stderr)
         sys.exit(1)
 
     # Check for API key
-    if not os.environ.get("OPENAI_API_KEY"):
+    if not fake_backend and not os.environ.get("OPENAI_API_KEY"):
         print("Error: OPENAI_API_KEY environment variable not set", file=sys.stderr)
         print("Set it in .aura/.env or export it: export OPENAI_API_KEY=your-key", file=sys.stderr)
         sys.exit(1)
@@ -167,26 +873,26 @@ def main():
         print("Install dependencies: pip install -r .aura/scripts/requirements.txt", file=sys.stderr)
         sys.exit(1)
 
-    try:
-        from openai import OpenAI
-    except ImportError:
-        print("Error: openai not installed", file=sys.stderr)
-        print("Install dependencies: pip install -r .aura/scripts/requirements.txt", file=sys.stderr)
-        sys.exit(1)
+    if not fake_backend:
+        try:
+            from openai import OpenAI
+        except ImportError:
+            print("Error: openai not installed", file=sys.stderr)
+            print("Install dependencies: pip install -r .aura/scripts/requirements.txt", file=sys.stderr)
+            sys.exit(1)
 
     # Check duration and split into chunks if needed
-    try:
-        duration_ms = get_audio_duration_ms(audio_path)
-        duration_min = duration_ms / 1000 / 60
-
-        if duration_ms > CHUNK_THRESHOLD_MS:
-            num_chunks = (duration_ms + CHUNK_DURATION_MS - 1) // CHUNK_DURATION_MS
-            print(f"Audio is {duration_min:.1f} minutes, splitting into {num_chunks} chunks...", file=sys.stderr)
-            chunk_paths = split_audio_into_chunks(audio_path)
-            transcript = transcribe_chunks(chunk_paths, audio_path)
-        else:
-            transcript = transcribe_audio(audio_path)
+    from checkpoint import checkpoint_dir_for
 
+    try:
+        transcript = transcribe_file(
+            audio_path,
+            jobs=args.jobs,
+            silence_aware=not args.fixed_chunks,
+            use_cache=not args.no_cache,
+            checkpoint_dir=str(checkpoint_dir_for(audio_path)) if args.checkpoint else None,
+            trim=args.trim_silence,
+        )
         print(transcript)
     except Exception as e:
         print(f"Error during transcription: {e}", file=sys.stderr)
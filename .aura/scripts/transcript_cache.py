@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Content-addressed on-disk cache of transcripts (and generated titles).
+
+Transcripts live under .aura/cache/transcripts/ and are keyed by a
+streaming SHA-256 of the audio bytes plus the transcription model, so
+re-running a transcription (or retrying a failed memo) never re-uploads
+audio that has already been transcribed. Chunks are cached individually,
+which lets a partially failed long recording resume where it stopped.
+generate_title.py stores titles the same way under .aura/cache/titles/.
+
+The cache is bounded by size with least-recently-used eviction: every hit
+refreshes the entry's mtime, and the oldest entries are dropped first.
+The bound covers the whole of .aura/cache (every section together), as
+it does for `aura cache stats` / `aura cache prune`, which inspect or trim
+it; src/aura/cache.py mirrors list_entries() and evict() for the CLI, and
+tests/test_cache.py checks that the two agree. Listing a large cache is
+slow (stat per entry), so .aura/cache/.usage keeps a running total and
+put() only rescans when that total says the bound may be exceeded.
+
+Environment:
+    AURA_CACHE_MAX_MB - Optional. Size bound for the cache (default: 100)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_MAX_MB = 100
+HASH_BLOCK_SIZE = 1 << 20  # Bytes read per hash update
+USAGE_FILE = ".usage"  # Under the cache root: bytes in use as of the last put, an upper bound
+
+_usage_lock = threading.Lock()  # Chunks are cached from several threads at once
+
+
+def get_cache_root() -> Path:
+    """Get the .aura/cache directory path (not created)."""
+    # Try to find .aura directory by walking up from cwd
+    cwd = Path.cwd()
+    for parent in [cwd] + list(cwd.parents):
+        aura_dir = parent / ".aura"
+        if aura_dir.exists():
+            return aura_dir / "cache"
+
+    # Fallback to cwd/.aura/cache
+    return cwd / ".aura" / "cache"
+
+
+def get_cache_dir(section: str = "transcripts") -> Path:
+    """Get the .aura/cache/<section> directory path (not created)."""
+    return get_cache_root() / section
+
+
+def get_max_bytes() -> int:
+    """Get the cache size bound in bytes from AURA_CACHE_MAX_MB."""
+    return int(float(os.environ.get("AURA_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+
+
+def hash_file(path: str, prefix: bytes = b"") -> str:
+    """SHA-256 of `prefix` followed by a file's bytes (streamed, constant memory)."""
+    digest = hashlib.sha256()
+    digest.update(prefix)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def audio_cache_key(path: str, model: str) -> str:
+    """Hash an audio file's bytes together with the model."""
+    return hash_file(path, model.encode("utf-8") + b"\0")
+
+
+def _entry_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def get(key: str, cache_dir: Path | None = None) -> str | None:
+    """Look up a cached transcript or title, refreshing its LRU position on a hit."""
+    entry = _entry_path(cache_dir or get_cache_dir(), key)
+    try:
+        data = json.loads(entry.read_text(encoding="utf-8"))
+        os.utime(entry)
+    except (OSError, ValueError):
+        return None
+    return data.get("text", data.get("transcript"))
+
+
+def put(key: str, text: str, model: str, source: str = "", cache_dir: Path | None = None) -> None:
+    """Store a transcript or title atomically, then evict old entries if over the size bound.
+
+    `cache_dir` is a section of the cache (see get_cache_dir); the bound
+    is applied to the cache root above it, across all sections.
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    entry = _entry_path(cache_dir, key)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+
+    data = {
+        "key": key,
+        "model": model,
+        "source": source,
+        "created": time.time(),
+        "text": text,
+    }
+    fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        size = os.path.getsize(tmp)
+        os.replace(tmp, entry)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+    cache_root = cache_dir.parent
+    max_bytes = get_max_bytes()
+    with _usage_lock:
+        used = _read_usage(cache_root)
+        if used is None or used + size > max_bytes:
+            evict(max_bytes, cache_root)
+        else:
+            _write_usage(cache_root, used + size)
+
+
+def list_entries(cache_root: Path | None = None) -> list[tuple[float, int, Path]]:
+    """Return (mtime, size, path) for every entry in every section, oldest first."""
+    cache_root = cache_root or get_cache_root()
+    entries = []
+    for entry in cache_root.glob("*/*/*.json"):
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, entry))
+    entries.sort()
+    return entries
+
+
+def _read_usage(cache_root: Path) -> int | None:
+    try:
+        return int((cache_root / USAGE_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_usage(cache_root: Path, used: int) -> None:
+    try:
+        (cache_root / USAGE_FILE).write_text(str(used))
+    except OSError:
+        pass  # The next put() rescans
+
+
+def evict(max_bytes: int, cache_root: Path | None = None) -> int:
+    """Delete least-recently-used entries until the whole cache fits in max_bytes.
+
+    Lists and stats every entry (about 10 ms per thousand), then records
+    the remaining total in the usage file.
+
+    Returns:
+        Number of entries removed
+    """
+    cache_root = cache_root or get_cache_root()
+    entries = list_entries(cache_root)
+    total = sum(size for _, size, _ in entries)
+
+    removed = 0
+    for _, size, entry in entries:
+        if total <= max_bytes:
+            break
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    _write_usage(cache_root, total)
+    return removed
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark decode count and peak RSS of the transcription pre-processing.
+
+Compares the old pipeline (decode for the duration, decode again to split)
+against AudioHandle on synthetic 10/30/60-minute WAVs. Each run happens in a
+fresh subprocess so peak RSS is measured in isolation. No API calls are made.
+
+Usage:
+    python benchmarks/bench_audio_decode.py [--minutes 10 30 60]
+
+Requirements:
+    pip install -r .aura/scripts/requirements.txt  (pydub, plus ffmpeg on PATH)
+"""
+
+import argparse
+import array
+import json
+import math
+import subprocess
+import sys
+import tempfile
+import wave
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / ".aura" / "scripts"
+SAMPLE_RATE = 16000
+
+# Runs inside the child process. Prints one JSON line with the results.
+CHILD_CODE = """
+import json, resource, sys, time
+sys.path.insert(0, {scripts_dir!r})
+import transcribe
+from pydub import AudioSegment
+
+decodes = 0
+_from_file = AudioSegment.from_file
+
+def counting_from_file(*args, **kwargs):
+    global decodes
+    decodes += 1
+    return _from_file(*args, **kwargs)
+
+AudioSegment.from_file = counting_from_file
+
+path, mode = sys.argv[1], sys.argv[2]
+start = time.perf_counter()
+if mode == "legacy":
+    duration_ms = len(AudioSegment.from_file(path))
+    audio = AudioSegment.from_file(path)
+    chunks = transcribe.export_chunks(audio, path) if duration_ms > transcribe.CHUNK_THRESHOLD_MS else [path]
+elif mode == "handle-decode":
+    handle = transcribe.AudioHandle(path)
+    handle.segment  # Force the no-ffmpeg path: one decode, reused for splitting
+    duration_ms = handle.duration_ms
+    chunks = handle.split()
+else:
+    handle = transcribe.AudioHandle(path)
+    duration_ms = handle.duration_ms
+    chunks = handle.split()
+elapsed = time.perf_counter() - start
+transcribe.cleanup_chunks(chunks, path)
+
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    peak_kb //= 1024
+print(json.dumps({{"decodes": decodes, "chunks": len(chunks), "peak_mb": peak_kb / 1024, "seconds": elapsed}}))
+"""
+
+
+def write_synthetic_wav(path: Path, minutes: int) -> None:
+    """Write a 16 kHz mono 16-bit WAV of a slowly warbling tone."""
+    block_seconds = 10
+    block = array.array("h", (
+        int(8000 * math.sin(2 * math.pi * (220 + 40 * math.sin(t / SAMPLE_RATE)) * t / SAMPLE_RATE))
+        for t in range(SAMPLE_RATE * block_seconds)
+    )).tobytes()
+
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        for _ in range(minutes * 60 // block_seconds):
+            wav.writeframes(block)
+
+
+def run_mode(path: Path, mode: str) -> dict:
+    """Run one pipeline variant in a fresh interpreter and return its stats."""
+    code = CHILD_CODE.format(scripts_dir=str(SCRIPTS_DIR))
+    result = subprocess.run(
+        [sys.executable, "-c", code, str(path), mode],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{mode} failed: {result.stderr.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark audio decode count and peak RSS")
+    parser.add_argument("--minutes", type=int, nargs="+", default=[10, 30, 60])
+    args = parser.parse_args()
+
+    modes = ["legacy", "handle-decode", "handle"]
+    print(f"{'input':>8}  {'mode':<14} {'decodes':>7} {'chunks':>6} {'peak RSS':>10} {'time':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for minutes in args.minutes:
+            path = Path(tmp) / f"synthetic-{minutes}m.wav"
+            write_synthetic_wav(path, minutes)
+            for mode in modes:
+                stats = run_mode(path, mode)
+                print(
+                    f"{minutes:>6}m  {mode:<14} {stats['decodes']:>7} {stats['chunks']:>6} "
+                    f"{stats['peak_mb']:>8.1f}MB {stats['seconds']:>7.2f}s"
+                )
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
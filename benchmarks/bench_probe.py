@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark per-file duration probe latency: header parsing vs ffprobe vs pydub.
+
+Encodes a synthetic tone with ffmpeg into each format the scripts read
+(WAV, FLAC, MP3, M4A, Ogg/Opus) and times how long each approach takes to
+get its duration: audio_probe.read_duration_ms (a few small reads),
+ffprobe (one subprocess) and pydub (a full decode). Durations are checked
+against the generated length. No API calls are made.
+
+Usage:
+    python benchmarks/bench_probe.py [--minutes 5] [--repeat 20]
+
+Requirements:
+    ffmpeg on PATH (to create the files); ffprobe and pydub are timed if installed
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / ".aura" / "scripts"
+
+# (file name, ffmpeg codec args)
+FORMATS = [
+    ("memo.wav", ["-ar", "16000", "-c:a", "pcm_s16le"]),
+    ("memo.flac", ["-ar", "16000", "-c:a", "flac"]),
+    ("memo.mp3", ["-ar", "44100", "-c:a", "libmp3lame", "-q:a", "4"]),
+    ("memo.m4a", ["-ar", "44100", "-c:a", "aac", "-b:a", "64k"]),
+    ("memo.ogg", ["-ar", "48000", "-c:a", "libopus", "-b:a", "24k"]),
+]
+
+
+def make_files(directory: Path, seconds: int) -> list[Path]:
+    paths = []
+    for name, codec_args in FORMATS:
+        path = directory / name
+        result = subprocess.run(
+            ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", f"sine=frequency=300:duration={seconds}",
+             "-ac", "1", *codec_args, str(path)],
+            stderr=subprocess.PIPE, text=True,
+        )
+        if result.returncode != 0:
+            print(f"Skipping {name}: {result.stderr.strip().splitlines()[-1:]}", file=sys.stderr)
+            continue
+        paths.append(path)
+    return paths
+
+
+def pydub_duration_ms(path: str) -> int | None:
+    from pydub import AudioSegment
+
+    return len(AudioSegment.from_file(path))
+
+
+def time_probe(probe, path: Path, repeat: int) -> tuple[float, int | None]:
+    """Median milliseconds per call, and the duration the probe returned."""
+    timings = []
+    duration_ms = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        duration_ms = probe(str(path))
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), duration_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Duration probe latency: headers vs ffprobe vs pydub")
+    parser.add_argument("--minutes", type=float, default=5, help="Length of the synthetic audio (default: 5)")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls per approach and file (default: 20)")
+    args = parser.parse_args()
+
+    if shutil.which("ffmpeg") is None:
+        print("Error: ffmpeg is required to create the test files", file=sys.stderr)
+        sys.exit(1)
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import audio_probe
+
+    warnings.filterwarnings("ignore", module="pydub")  # "Couldn't find ffprobe" on every call
+
+    approaches = [("headers", audio_probe.read_duration_ms, args.repeat)]
+    if shutil.which("ffprobe"):
+        approaches.append(("ffprobe", audio_probe.ffprobe_duration_ms, args.repeat))
+    else:
+        print("ffprobe not on PATH; skipping it", file=sys.stderr)
+    try:
+        import pydub  # noqa: F401
+        approaches.append(("pydub", pydub_duration_ms, max(1, args.repeat // 10)))  # Full decodes are slow
+    except ImportError:
+        print("pydub not installed; skipping it", file=sys.stderr)
+
+    seconds = int(args.minutes * 60)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_files(Path(tmp), seconds)
+        print(f"{args.minutes:g} min of audio per file; median ms per probe (duration error in ms)\n")
+        print(f"{'file':<12}" + "".join(f"{name:>22}" for name, _, _ in approaches))
+        for path in paths:
+            cells = []
+            for _, probe, repeat in approaches:
+                try:
+                    ms, duration_ms = time_probe(probe, path, repeat)
+                except Exception as e:
+                    cells.append(e.__class__.__name__[:20])
+                    continue
+                error = "n/a" if duration_ms is None else f"{duration_ms - seconds * 1000:+d}"
+                cells.append(f"{ms:>12.3f} ({error:>6})")
+            print(f"{path.name:<12}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Exercise the rate-limit scheduler against the stub OpenAI server.
+
+Starts benchmarks/stub_openai_server.py in-process with a small concurrency
+quota and random 429s, then pushes transcription and title requests through
+transcribe.py / generate_title.py from many threads, once with the AIMD
+scheduler retrying and once with retries disabled (what the scripts did
+before). Reports successes, 429s seen, the concurrency the
+scheduler settled on and wall time.
+
+Usage:
+    python benchmarks/bench_rate_limit.py [--requests 80] [--threads 16] [--capacity 4]
+
+Requirements:
+    pip install -r .aura/scripts/requirements.txt  (openai, httpx)
+"""
+
+import argparse
+import math
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent / ".aura" / "scripts"
+
+
+def write_clip(path: Path, index: int) -> None:
+    """Write a short, distinct 16 kHz tone so transcript cache keys differ."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        freq = 200 + index
+        wav.writeframes(b"".join(
+            struct.pack("<h", int(3000 * math.sin(2 * math.pi * freq * i / 16000))) for i in range(1600)
+        ))
+
+
+def run(mode: str, clips: list[Path], threads: int, args) -> dict:
+    import rate_limit
+    import transcribe
+    import generate_title
+    from stub_openai_server import make_server
+
+    server, stub = make_server(capacity=args.capacity, fail_rate=args.fail_rate,
+                               latency=args.latency, retry_after=args.retry_after)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    # "no-retry" fails on the first 429, like the scripts did before the scheduler
+    scheduler = rate_limit.configure(max_concurrency=threads, max_retries=8 if mode == "scheduler" else 0)
+
+    import openai_client
+    openai_client.close_client()  # New base URL for this run
+
+    ok = errors = 0
+    lock = threading.Lock()
+
+    def one(index: int) -> None:
+        nonlocal ok, errors
+        try:
+            if index % 4 == 3:
+                title = generate_title.generate_title(f"stub memo number {index} about rate limits",
+                                                      use_cache=False)
+                success = not title.startswith("transcription-")  # Timestamp fallback = failure
+            else:
+                transcribe.transcribe_audio(str(clips[index % len(clips)]), use_cache=False)
+                success = True
+        except Exception:
+            success = False
+        with lock:
+            if success:
+                ok += 1
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one, range(args.requests)))
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    state = scheduler.state()
+    return {
+        "mode": mode,
+        "ok": ok,
+        "errors": errors,
+        "server_429s": stub.throttled,
+        "peak_in_flight": stub.peak_in_flight,
+        "final_limit": state["limit"],
+        "min_limit": int(state["min_limit"]),
+        "retries": state["retries"],
+        "elapsed": elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate-limit scheduler benchmark against a stub server")
+    parser.add_argument("--requests", type=int, default=80, help="Requests per run (default: 80)")
+    parser.add_argument("--threads", type=int, default=16, help="Caller threads (default: 16)")
+    parser.add_argument("--capacity", type=int, default=4, help="Stub concurrency quota (default: 4)")
+    parser.add_argument("--fail-rate", type=float, default=0.05, help="Stub random 429 rate (default: 0.05)")
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub max latency in seconds (default: 0.3)")
+    parser.add_argument("--retry-after", type=float, help="Stub Retry-After seconds")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    sys.path.insert(0, str(BENCH_DIR))
+    os.environ["OPENAI_API_KEY"] = "stub"
+    os.environ.pop("AURA_TRANSCRIPTION_BACKEND", None)
+    os.environ["AURA_TITLE_LOCAL_MAX_WORDS"] = "0"
+
+    import rate_limit
+    rate_limit.BASE_DELAY_S = 0.2  # Keep the benchmark short; same shape of backoff
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clips = []
+        for i in range(8):
+            clip = Path(tmp) / f"clip{i}.wav"
+            write_clip(clip, i)
+            clips.append(clip)
+
+        print(f"{args.requests} requests from {args.threads} threads; stub quota {args.capacity} in flight, "
+              f"{args.fail_rate:.0%} random 429s\n")
+        print(f"{'mode':<10} {'ok':>4} {'errors':>6} {'429s':>5} {'peak':>5} {'limit':>6} {'min':>4} "
+              f"{'retries':>7} {'time':>7}")
+        for mode in ("no-retry", "scheduler"):
+            r = run(mode, clips, args.threads, args)
+            print(f"{r['mode']:<10} {r['ok']:>4} {r['errors']:>6} {r['server_429s']:>5} {r['peak_in_flight']:>5} "
+                  f"{r['final_limit']:>6} {r['min_limit']:>4} {r['retries']:>7} {r['elapsed']:>6.1f}s")
+
+
+if __name__ == "__main__":
+    main()
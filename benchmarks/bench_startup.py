@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Check the `aura` CLI's cold-start cost against a budget.
+
+Starts a fresh interpreter with `python -X importtime -c "import aura.cli"`
+several times and reads the cumulative import time of aura.cli from the
+report (the median across runs, so one slow run doesn't fail the check).
+It also times `aura --version` end to end, next to a bare interpreter
+start for scale, and lists the slowest imports pulled in at load time.
+
+Fails (exit status 1) if the import time exceeds --budget-ms, or if any
+subcommand module (aura.init, aura.worker, ...) is imported at load time:
+those belong inside the command that uses them.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 10] [--budget-ms 60]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+DEFAULT_BUDGET_MS = 60  # click is most of it (about 35 ms); importing aura.init too took about 65 ms
+# Loaded only by the commands that need them
+LAZY_MODULES = ("aura.init", "aura.fleet", "aura.bundle", "aura.cache", "aura.check", "aura.queue",
+                "aura.worker", "aura.ingest", "aura.scripts")
+
+
+def run(args: list[str]) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    return subprocess.run([sys.executable, *args], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          text=True, check=True)
+
+
+def parse_importtime(report: str) -> list[tuple[str, int, int, int]]:
+    """(module, depth, self us, cumulative us) for each line of an -X importtime report."""
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, raw_name = line[len("import time:"):].split("|")
+        # Nesting is two spaces per level after the separator's own space
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        imports.append((raw_name.strip(), depth, int(self_us), int(cumulative_us)))
+    return imports
+
+
+def wall_ms(args: list[str], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(args)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="aura CLI cold-start time against a budget")
+    parser.add_argument("--repeat", type=int, default=10, help="Interpreter starts per measurement (default: 10)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Allowed import time of aura.cli in ms (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports to list (default: 8)")
+    args = parser.parse_args()
+
+    run(["-c", "import aura.cli"])  # Write bytecode first, so compiling isn't timed
+
+    import_ms = []
+    imports = []
+    for _ in range(args.repeat):
+        imports = parse_importtime(run(["-X", "importtime", "-c", "import aura.cli"]).stderr)
+        import_ms.append(next(cumulative for name, depth, _, cumulative in imports
+                              if name == "aura.cli" and depth == 0) / 1000)
+    median_ms = statistics.median(import_ms)
+
+    print(f"import aura.cli:   {median_ms:6.1f} ms median, {min(import_ms):.1f} ms best "
+          f"(budget {args.budget_ms:g} ms)")
+    print(f"aura --version:    {wall_ms(['-m', 'aura.cli', '--version'], args.repeat):6.1f} ms wall")
+    print(f"python -c pass:    {wall_ms(['-c', 'pass'], args.repeat):6.1f} ms wall\n")
+
+    # Everything nested under aura.cli in the last report, slowest first
+    start = max(i for i, (name, depth, _, _) in enumerate(imports) if name == "aura.cli" and depth == 0)
+    end = start
+    while end > 0 and imports[end - 1][1] > 0:
+        end -= 1
+    loaded = imports[end:start]
+    print("Slowest imports under aura.cli (cumulative):")
+    for name, depth, _, cumulative in sorted((i for i in loaded if i[1] == 1), key=lambda i: -i[3])[:args.top]:
+        print(f"  {name:<30}{cumulative / 1000:8.1f} ms")
+
+    eager = sorted({name for name, *_ in loaded if name in LAZY_MODULES})
+    failures = 0
+    if eager:
+        print(f"\nImported at startup but should be lazy: {', '.join(eager)}")
+        failures += 1
+    if median_ms > args.budget_ms:
+        print(f"\nOver budget: {median_ms:.1f} ms > {args.budget_ms:g} ms")
+        failures += 1
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Check and time voice-activity trimming on a corpus of synthetic speech.
+
+Each case is a recording with known speech spans: voiced "syllables"
+(harmonic tones with a wandering pitch, amplitude-modulated at about 4 Hz)
+and noise-burst consonants, separated by pauses from 0.2 s to several
+seconds, over a background of noise and optionally mains hum. The cases
+cover clean and noisy rooms, a quiet speaker, talk with no long pauses and
+a recording with no speech at all.
+
+For every case the real pipeline runs on a WAV file: the ffmpeg envelope
+(audio_energy.rms_envelope_from_file), find_speech_regions, and the ffmpeg
+filter transcribe.trim_silence uploads (decoded back to PCM here). It
+reports:
+
+- speech kept: share of the known speech samples inside the kept regions
+  (anything below 100% means words would be lost)
+- saved: seconds removed, against the removable silence (pauses of at least
+  the minimum length, less the padding kept around speech)
+- map error: largest difference between the trimmed audio and the original
+  samples TimestampMap.to_original points at, and the length difference
+
+No API calls are made.
+
+Usage:
+    python benchmarks/bench_vad.py [--seed 0] [--minutes 3]
+
+Requirements:
+    ffmpeg on PATH, numpy
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / ".aura" / "scripts"
+SAMPLE_RATE = 16000  # Same as the trimmed upload, so the PCM compares sample for sample
+
+# name: (speech level dBFS, noise level dBFS, hum, longest pause in s)
+CASES = {
+    "clean": (-20, -65, False, 6.0),
+    "noisy-room": (-20, -42, False, 6.0),
+    "hum": (-20, -50, True, 6.0),
+    "quiet-speaker": (-36, -60, False, 6.0),
+    "no-long-pauses": (-20, -55, False, 1.0),
+    "no-speech": (None, -55, True, 0.0),
+}
+
+
+def db_to_amplitude(db: float) -> float:
+    return 32767 * 10 ** (db / 20)
+
+
+def syllable(np, rng, seconds: float):
+    """One voiced syllable: harmonics of a gliding pitch under a smooth envelope."""
+    n = int(seconds * SAMPLE_RATE)
+    t = np.arange(n) / SAMPLE_RATE
+    f0 = rng.uniform(100, 220) * (1 + 0.08 * np.sin(2 * np.pi * rng.uniform(1, 3) * t))
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+    signal = sum(np.sin(k * phase) / k for k in range(1, 10))
+    return signal * np.hanning(n) / 2
+
+
+def consonant(np, rng, seconds: float):
+    """A fricative-like burst: high-passed noise, quieter than vowels."""
+    n = int(seconds * SAMPLE_RATE)
+    noise = rng.normal(0, 0.3, n)
+    return np.diff(noise, prepend=0) * np.hanning(n)
+
+
+def make_case(np, rng, minutes: float, speech_db, noise_db, hum: bool, longest_pause: float):
+    """Return (samples, speech spans in samples)."""
+    total = int(minutes * 60 * SAMPLE_RATE)
+    pieces = []
+    spans = []
+    position = 0
+    if speech_db is not None:
+        level = db_to_amplitude(speech_db)
+        position = int(rng.uniform(0.5, 3) * SAMPLE_RATE)  # Leading silence
+        pieces.append(np.zeros(position))
+        while position < total - 15 * SAMPLE_RATE:
+            # An utterance of a few syllables, then a pause
+            utterance = []
+            for _ in range(rng.integers(3, 25)):
+                if rng.random() < 0.3:
+                    utterance.append(consonant(np, rng, rng.uniform(0.05, 0.12)))
+                utterance.append(syllable(np, rng, rng.uniform(0.12, 0.35)))
+                utterance.append(np.zeros(int(rng.uniform(0.0, 0.12) * SAMPLE_RATE)))
+            words = np.concatenate(utterance) * level
+            spans.append((position, position + len(words)))
+            pieces.append(words)
+            position += len(words)
+            pause = int(rng.uniform(0.2, longest_pause) * SAMPLE_RATE)
+            pieces.append(np.zeros(pause))
+            position += pause
+    pieces.append(np.zeros(max(0, total - position)))
+    x = np.concatenate(pieces)[:total]
+
+    x = x + rng.normal(0, db_to_amplitude(noise_db), len(x))
+    if hum:
+        t = np.arange(len(x)) / SAMPLE_RATE
+        x = x + db_to_amplitude(noise_db + 6) * np.sin(2 * np.pi * 50 * t)
+    return np.clip(np.round(x), -32768, 32767).astype("<i2"), spans
+
+
+def write_wav(path: Path, samples) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes(samples.tobytes())
+
+
+def decode_trimmed(np, path: Path, audio_filter: str):
+    """Apply the upload filter and return the result as 16 kHz PCM (no lossy encode)."""
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(path), "-af", audio_filter, "-ac", "1",
+         "-ar", str(SAMPLE_RATE), "-f", "s16le", "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True,
+    )
+    return np.frombuffer(result.stdout, dtype="<i2")
+
+
+def removable_ms(spans, total_samples: int, min_silence_ms: int, pad_ms: int) -> float:
+    """Silence find_speech_regions would ideally drop, given the true speech spans."""
+    min_gap = min_silence_ms * SAMPLE_RATE // 1000
+    pad = pad_ms * SAMPLE_RATE // 1000
+    if not spans:
+        return 0.0
+    gaps = [spans[0][0] - pad, total_samples - spans[-1][1] - pad]
+    gaps += [b[0] - a[1] - 2 * pad for a, b in zip(spans, spans[1:]) if b[0] - a[1] >= min_gap]
+    return sum(max(0, gap) for gap in gaps) * 1000 / SAMPLE_RATE
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Voice-activity trimming on synthetic speech")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed (default: 0)")
+    parser.add_argument("--minutes", type=float, default=3, help="Length of each recording (default: 3)")
+    args = parser.parse_args()
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("Error: numpy is required to generate the corpus", file=sys.stderr)
+        sys.exit(1)
+    if shutil.which("ffmpeg") is None:
+        print("Error: ffmpeg is required", file=sys.stderr)
+        sys.exit(1)
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import audio_energy
+    from transcribe import speech_filter
+
+    rng = np.random.default_rng(args.seed)
+    failures = 0
+    print(f"{args.minutes:g} min per recording, seed {args.seed}\n")
+    print(f"{'case':<16}{'speech kept':>12}{'saved s':>9}{'removable s':>13}{'map err':>9}"
+          f"{'len diff ms':>13}{'detect ms':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, (speech_db, noise_db, hum, longest_pause) in CASES.items():
+            samples, spans = make_case(np, rng, args.minutes, speech_db, noise_db, hum, longest_pause)
+            path = Path(tmp) / f"{name}.wav"
+            write_wav(path, samples)
+            duration_ms = len(samples) * 1000 // SAMPLE_RATE
+
+            start = time.perf_counter()
+            envelope = audio_energy.rms_envelope_from_file(str(path))
+            regions = audio_energy.find_speech_regions(envelope, duration_ms)
+            detect_ms = (time.perf_counter() - start) * 1000
+            timestamps = audio_energy.TimestampMap(regions, duration_ms)
+
+            kept = np.zeros(len(samples), dtype=bool)
+            for region_start, region_end in regions:
+                kept[region_start * SAMPLE_RATE // 1000:region_end * SAMPLE_RATE // 1000] = True
+            speech_samples = sum(end - begin for begin, end in spans)
+            speech_kept = (sum(int(kept[begin:end].sum()) for begin, end in spans) / speech_samples
+                           if speech_samples else 1.0)
+
+            # Every trimmed sample must be the original sample the map points at
+            trimmed = decode_trimmed(np, path, speech_filter(regions))
+            positions = np.arange(len(trimmed)) * 1000 / SAMPLE_RATE
+            originals = np.array([timestamps.to_original(ms) for ms in positions.tolist()])
+            source = np.minimum((originals * SAMPLE_RATE / 1000).round().astype(int), len(samples) - 1)
+            map_error = int(np.abs(trimmed.astype(int) - samples[source].astype(int)).max()) if len(trimmed) else 0
+            length_diff = len(trimmed) * 1000 / SAMPLE_RATE - timestamps.kept_ms
+
+            removable = removable_ms(spans, len(samples), audio_energy.DEFAULT_MIN_SILENCE_MS,
+                                     audio_energy.DEFAULT_SPEECH_PAD_MS)
+            print(f"{name:<16}{speech_kept:>11.2%}{timestamps.removed_ms / 1000:>9.1f}{removable / 1000:>13.1f}"
+                  f"{map_error:>9d}{length_diff:>13.1f}{detect_ms:>11.1f}")
+            if speech_kept < 1.0 or map_error or abs(length_diff) >= 1 or (not spans and timestamps.removed_ms):
+                failures += 1
+
+    print("\nspeech kept must be 100%, map err 0 (sample values) and len diff under 1 ms;")
+    print("a recording without speech must be left whole. saved can exceed removable a")
+    print("little: the known spans include the faded edges of the first and last syllables.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
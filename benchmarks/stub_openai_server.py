@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Local stand-in for the OpenAI transcription and chat endpoints.
+
+Serves POST /v1/audio/transcriptions and POST /v1/chat/completions with
+injected latency and throttling, so the rate-limit scheduler can be
+exercised without network access or API spend:
+
+- requests beyond --capacity in flight get a 429 (like a concurrency quota)
+- another --fail-rate fraction of requests get a 429 at random
+- the first --throttle-first requests all get a 429
+- every request sleeps for a random latency up to --latency seconds
+
+Point the scripts at it with OPENAI_BASE_URL:
+
+    python benchmarks/stub_openai_server.py --port 8808 --capacity 4 &
+    OPENAI_BASE_URL=http://127.0.0.1:8808/v1 OPENAI_API_KEY=stub \\
+        python .aura/scripts/transcribe.py memo.wav
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubState:
+    """Injection settings plus counters shared by all handler threads."""
+
+    def __init__(self, capacity: int = 4, fail_rate: float = 0.0, latency: float = 0.2,
+                 retry_after: float | None = None, throttle_first: int = 0):
+        self.capacity = capacity
+        self.fail_rate = fail_rate
+        self.throttle_first = throttle_first
+        self.latency = latency
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.served = 0
+        self.throttled = 0
+        self.received = 0
+        self.arrivals = []  # time.monotonic() of every request, in arrival order
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state: StubState = None  # Set by make_server()
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+
+    def _send_json(self, status: int, body: dict, headers: dict | None = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        state = self.state
+
+        with state.lock:
+            state.received += 1
+            state.arrivals.append(time.monotonic())
+            state.in_flight += 1
+            over_capacity = state.in_flight > state.capacity
+            throttle = (over_capacity or state.received <= state.throttle_first
+                        or random.random() < state.fail_rate)
+            if throttle:
+                state.throttled += 1
+            else:
+                state.peak_in_flight = max(state.peak_in_flight, state.in_flight)
+        try:
+            if throttle:
+                headers = {"Retry-After": f"{state.retry_after:g}"} if state.retry_after else {}
+                self._send_json(429, {"error": {
+                    "message": "Rate limit reached (stub)", "type": "requests", "code": "rate_limit_exceeded",
+                }}, headers)
+                return
+
+            time.sleep(random.uniform(0, state.latency))
+            if self.path.endswith("/audio/transcriptions"):
+                self._send_json(200, {"text": f"stub transcript of {len(body)} bytes"})
+            elif self.path.endswith("/chat/completions"):
+                self._send_json(200, self._chat_response(body))
+            else:
+                self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+                return
+            with state.lock:
+                state.served += 1
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _chat_response(self, body: bytes) -> dict:
+        request = json.loads(body or b"{}")
+        prompt = request.get("messages", [{}])[-1].get("content", "")
+        if request.get("response_format", {}).get("type") == "json_object":
+            match = re.search(r"each of the (\d+)", prompt)
+            count = int(match.group(1)) if match else 1
+            content = json.dumps({"titles": [f"stub title {i}" for i in range(1, count + 1)]})
+        else:
+            content = "stub title"
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": 5, "total_tokens": len(prompt) // 4 + 5},
+        }
+
+
+def make_server(port: int = 0, **settings) -> tuple[ThreadingHTTPServer, StubState]:
+    """Create (but don't start) a stub server; port 0 picks a free port."""
+    state = StubState(**settings)
+    handler = type("BoundStubHandler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    return server, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub OpenAI server that injects 429s and latency")
+    parser.add_argument("--port", type=int, default=8808)
+    parser.add_argument("--capacity", type=int, default=4, help="Requests in flight before 429s (default: 4)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of random 429s (default: 0)")
+    parser.add_argument("--latency", type=float, default=0.2, help="Max seconds of latency per request (default: 0.2)")
+    parser.add_argument("--retry-after", type=float, help="Send Retry-After with 429s (seconds)")
+    parser.add_argument("--throttle-first", type=int, default=0, help="Answer the first N requests with 429s")
+    args = parser.parse_args()
+
+    server, _ = make_server(args.port, capacity=args.capacity, fail_rate=args.fail_rate,
+                            latency=args.latency, retry_after=args.retry_after, throttle_first=args.throttle_first)
+    print(f"Stub OpenAI server on http://127.0.0.1:{server.server_address[1]}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
-"""Display status of audio files in the queue directory."""
+"""Display status of audio files in the queue directory.
 
+Durations are probed concurrently and remembered in queue/.durations.json,
+keyed by file path, size and modification time, so repeated status calls
+only probe files that are new or changed.
+"""
+
+import json
 import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Supported audio formats
 SUPPORTED_FORMATS = {"mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"}
 QUEUE_DIR = Path("queue")
+DURATION_CACHE_FILE = ".durations.json"
+PARALLEL_WORKERS = 3  # Parallel transcriptions assumed by the processing-time estimate
+PROBE_JOBS = min(16, (os.cpu_count() or 4) * 2)  # Probes mostly wait on ffprobe subprocesses
 
 
 def format_size(bytes_size: int) -> str:
@@ -25,30 +36,16 @@ def get_audio_duration_ms(path: str) -> int | None:
     """Get the duration of an audio file in milliseconds.
 
     Returns None if duration extraction fails.
-    Tries ffprobe first (faster), falls back to pydub.
+    Reads the container headers in-process first (WAV, FLAC, MP3, M4A, Ogg),
+    then tries ffprobe, and only decodes with pydub as a last resort.
     """
-    # Try ffprobe first (more reliable and faster)
-    try:
-        import subprocess
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1:nokey=1",
-                path
-            ],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            duration_seconds = float(result.stdout.strip())
-            return int(duration_seconds * 1000)
-    except Exception:
-        pass
+    from audio_probe import probe_duration_ms
 
-    # Fall back to pydub if ffprobe not available
+    duration_ms = probe_duration_ms(path)
+    if duration_ms is not None:
+        return duration_ms
+
+    # Fall back to pydub if the headers are unreadable and ffprobe is not available
     try:
         from pydub import AudioSegment
         audio = AudioSegment.from_file(path)
@@ -74,30 +71,114 @@ def format_duration(milliseconds: int) -> str:
         return f"{hours}h {remaining_minutes}m"
 
 
-def find_queue_files() -> list[Path]:
+def find_queue_files() -> list[tuple[Path, os.stat_result]]:
     """Find all audio files in the queue directory.
 
-    Returns a list of Path objects, sorted by modification time (newest first).
+    Scans the directory once and stats each file once.
+
+    Returns a list of (path, stat) tuples, sorted by modification time (newest first).
     """
     if not QUEUE_DIR.exists():
         return []
 
     files = []
-    for ext in SUPPORTED_FORMATS:
-        files.extend(QUEUE_DIR.glob(f"*.{ext}"))
+    with os.scandir(QUEUE_DIR) as entries:
+        for entry in entries:
+            ext = entry.name.rsplit(".", 1)[-1] if "." in entry.name else ""
+            if ext not in SUPPORTED_FORMATS:
+                continue
+            try:
+                if entry.is_file():
+                    files.append((Path(entry.path), entry.stat()))
+            except OSError:
+                continue  # Removed while scanning
 
     # Sort by modification time, newest first
-    files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    files.sort(key=lambda item: item[1].st_mtime, reverse=True)
     return files
 
 
-def estimate_processing_time(total_duration_ms: int) -> str:
+def load_duration_cache() -> dict:
+    """Load the duration index from the queue directory (empty if missing or corrupt)."""
+    try:
+        with open(QUEUE_DIR / DURATION_CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_duration_cache(cache: dict) -> None:
+    """Write the duration index atomically; failures only cost a re-probe next time."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=QUEUE_DIR, prefix=f"{DURATION_CACHE_FILE}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, QUEUE_DIR / DURATION_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def get_durations(files: list[tuple[Path, os.stat_result]]) -> list[int | None]:
+    """Get the duration of each file, probing only files not in the index.
+
+    Index entries are keyed by path and only trusted while size and mtime
+    still match. Misses are probed concurrently, and entries for files no
+    longer in the queue are dropped.
+
+    Returns durations in milliseconds (None where probing failed), in the order of `files`.
+    """
+    cache = load_duration_cache()
+    durations: dict[str, int | None] = {}
+    misses = []
+    for path, st in files:
+        entry = cache.get(str(path))
+        if entry and entry.get("size") == st.st_size and entry.get("mtime") == st.st_mtime:
+            durations[str(path)] = entry.get("duration_ms")
+        else:
+            misses.append((path, st))
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=PROBE_JOBS) as pool:
+            probed = pool.map(lambda item: get_audio_duration_ms(str(item[0])), misses)
+            for (path, _), duration_ms in zip(misses, probed):
+                durations[str(path)] = duration_ms
+
+    # Failed probes aren't stored, so they are retried (e.g. after installing ffmpeg)
+    fresh = {
+        str(path): {"size": st.st_size, "mtime": st.st_mtime, "duration_ms": durations[str(path)]}
+        for path, st in files
+        if durations[str(path)] is not None
+    }
+    if fresh != cache:
+        save_duration_cache(fresh)
+
+    return [durations[str(path)] for path, _ in files]
+
+
+def estimate_processing_time(durations_ms: list[int]) -> str:
     """Estimate transcription processing time.
 
-    Based on typical Whisper performance: ~25-35% of audio duration for serial processing,
-    or ~10-20% with parallelization (2-4 parallel processes).
+    With at least a few recorded transcriptions (see throughput.py), this is
+    a p50/p90 estimate fitted to their measured speed. Otherwise it falls
+    back to typical Whisper performance: ~25-35% of audio duration for
+    serial processing, or ~10-20% with parallelization (2-4 parallel processes).
     """
-    total_seconds = total_duration_ms / 1000
+    try:
+        from throughput import estimate_eta, format_eta, load_records
+        from transcribe import METRICS_PATH
+    except ImportError:
+        estimate_eta = None
+    if estimate_eta is not None:
+        records = load_records(METRICS_PATH)
+        parallel = estimate_eta(durations_ms, workers=PARALLEL_WORKERS, records=records)
+        serial = estimate_eta(durations_ms, workers=1, records=records)
+        if parallel is not None and serial is not None:
+            return (f"~{format_eta(parallel['p50_s'])} (p90 {format_eta(parallel['p90_s'])}) "
+                    f"with {PARALLEL_WORKERS} parallel processes or ~{format_eta(serial['p50_s'])} "
+                    f"(p90 {format_eta(serial['p90_s'])}) serial, from {serial['records']} past transcriptions")
+
+    total_seconds = sum(durations_ms) / 1000
 
     # Serial processing estimate (25-35% of audio duration)
     serial_min_seconds = int(total_seconds * 0.25)
@@ -135,30 +216,22 @@ def display_empty_queue():
     print("Supported formats: m4a, mp3, wav, mp4, mpeg, mpga, webm")
 
 
-def display_queue_status(files: list[Path]):
+def display_queue_status(files: list[tuple[Path, os.stat_result]]):
     """Display the queue status with file details."""
     print("Queue Status")
     print("=" * 50 + "\n")
 
     # Calculate statistics
-    total_size = sum(f.stat().st_size for f in files)
+    total_size = sum(st.st_size for _, st in files)
     file_count = len(files)
 
     print(f"Files queued: {file_count}")
     print(f"Total size: {format_size(total_size)}")
 
     # Try to calculate duration
-    total_duration_ms = 0
-    duration_available = True
-    file_durations = []
-
-    for file_path in files:
-        duration_ms = get_audio_duration_ms(str(file_path))
-        file_durations.append(duration_ms)
-        if duration_ms is not None:
-            total_duration_ms += duration_ms
-        else:
-            duration_available = False
+    file_durations = get_durations(files)
+    total_duration_ms = sum(d for d in file_durations if d is not None)
+    duration_available = all(d is not None for d in file_durations)
 
     if duration_available and total_duration_ms > 0:
         print(f"Total duration: ~{format_duration(total_duration_ms)}")
@@ -169,9 +242,8 @@ def display_queue_status(files: list[Path]):
 
     # Display file list
     print(f"\nFiles:")
-    for i, file_path in enumerate(files, 1):
-        file_size = file_path.stat().st_size
-        size_str = format_size(file_size)
+    for i, (file_path, st) in enumerate(files, 1):
+        size_str = format_size(st.st_size)
 
         duration_ms = file_durations[i - 1]
         if duration_ms is not None:
@@ -182,7 +254,7 @@ def display_queue_status(files: list[Path]):
 
     # Display processing time estimate
     if duration_available and total_duration_ms > 0:
-        print(f"\nEstimated processing time: {estimate_processing_time(total_duration_ms)}")
+        print(f"\nEstimated processing time: {estimate_processing_time(file_durations)}")
 
     # Display helpful tips
     print("\n" + "=" * 50)
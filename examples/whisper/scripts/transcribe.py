@@ -4,6 +4,7 @@
 import os
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 SUPPORTED_FORMATS = {"mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"}
@@ -11,6 +12,9 @@ MAX_FILE_SIZE_MB = 25
 CHUNK_DURATION_MS = 5 * 60 * 1000  # 5 minutes in milliseconds
 CHUNK_THRESHOLD_MS = 8 * 60 * 1000  # Only chunk files longer than 8 minutes
 
+# Timing history for queue_status.py's processing-time estimate (see throughput.py)
+METRICS_PATH = Path(__file__).resolve().parent / ".transcriptions.jsonl"
+
 # Map file extensions to ffmpeg export format names (some differ from extension)
 EXPORT_FORMAT_MAP = {"m4a": "ipod", "mpga": "mp3"}
 
@@ -69,14 +73,27 @@ def transcribe_audio(path: str, model: str = "gpt-4o-mini-transcribe") -> str:
     from openai import OpenAI
 
     client = OpenAI()
+    start = time.perf_counter()
     with open(path, "rb") as f:
         tx = client.audio.transcriptions.create(
             model=model,
             file=f,
         )
+    record_timing(path, model, time.perf_counter() - start)
     return tx.text
 
 
+def record_timing(path: str, model: str, wall_s: float) -> None:
+    """Add a request's timing to the throughput history, if throughput.py is alongside."""
+    try:
+        from audio_probe import read_duration_ms
+        from throughput import record_transcription
+    except ImportError:
+        return
+    record_transcription(read_duration_ms(path), os.path.getsize(path), model, wall_s,
+                         concurrency=1, path=METRICS_PATH)
+
+
 def transcribe_chunks(chunk_paths: list[str], original_path: str, model: str = "gpt-4o-mini-transcribe") -> str:
     """Transcribe multiple audio chunks and concatenate the results.
 
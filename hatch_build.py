@@ -0,0 +1,38 @@
+"""Hatch build hook: pack the templates into aura/templates.zip inside the wheel.
+
+Editable installs skip it and keep reading the template files from the
+checkout (see aura.bundle). The checkout's .aura/.env and other local state
+are left out (aura.bundle.bundle_sources); a .env that slips through fails
+the build.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class TemplateBundleHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        if self.target_name != "wheel" or version == "editable":
+            return
+
+        sys.path.insert(0, str(Path(self.root) / "src"))
+        try:
+            from aura.bundle import build_bundle, bundle_sources
+
+            self._tmp = tempfile.TemporaryDirectory(prefix="aura-bundle-")
+            bundle_path = Path(self._tmp.name) / "templates.zip"
+            index = build_bundle(bundle_sources(), bundle_path)
+        finally:
+            sys.path.pop(0)
+
+        build_data["force_include"][str(bundle_path)] = "aura/templates.zip"
+        self.app.display_info(f"Bundled {len(index)} template files")
+
+    def finalize(self, version, build_data, artifact_path):
+        if getattr(self, "_tmp", None) is not None:
+            self._tmp.cleanup()
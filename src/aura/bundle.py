@@ -0,0 +1,258 @@
+"""Packaged template bundle: every template file `aura init` installs, in one archive.
+
+The bundle is a zip of stored (uncompressed) entries named by their
+install path (".aura/scripts/transcribe.py", ...). The archive comment
+holds an index with each entry's SHA-256, size and file mode, so listing
+and diffing templates needs no directory walk and no hashing. The archive
+is mapped read-only with mmap, and an entry's contents are a memoryview
+slice of that map: nothing is decompressed or copied until it is written
+into a repository.
+
+It is built when the wheel is built (hatch_build.py) from the files
+aura.init.get_template_files() lists, less anything local to the checkout
+(see bundle_sources()), and shipped as aura/templates.zip. Secrets never
+go in: the bundle carries .aura/.env.example, not .aura/.env.
+A checkout (editable install) has no bundle and reads the template files
+directly, so edits show up immediately.
+
+Usage:
+    python -m aura.bundle [OUTPUT]      # Build (default: src/aura/templates.zip)
+    python -m aura.bundle --verify      # Check every entry against its recorded hash
+"""
+
+import fnmatch
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import zipfile
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+
+BUNDLE_PATH = Path(__file__).resolve().parent / "templates.zip"
+INDEX_VERSION = 1
+LOCAL_HEADER = struct.Struct("<4s22xHH")  # Signature, then file name and extra field lengths at offset 26
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)  # Fixed entry timestamps, so identical templates give an identical bundle
+# Never bundled, whatever .aura/.gitignore says (gitignore syntax)
+ALWAYS_EXCLUDED = (".env", ".venv/", "__pycache__/", "*.pyc", "*.pyo")
+SECRET_FILES = (".env",)  # build_bundle refuses these outright
+
+
+class BundleError(Exception):
+    """Raised when a bundle is missing, damaged or of an unknown version."""
+
+    pass
+
+
+def read_ignore_patterns(path: Path) -> list[tuple[bool, str]]:
+    """(negated, pattern) for each rule in a .gitignore file; empty if there is none."""
+    try:
+        lines = Path(path).read_text().splitlines()
+    except OSError:
+        return []
+    patterns = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        patterns.append((negated, line[1:] if negated else line))
+    return patterns
+
+
+def _matches(rel: PurePosixPath, pattern: str) -> bool:
+    """Whether a gitignore pattern matches the file `rel` or one of its directories."""
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern  # Otherwise it matches a name at any depth
+    pattern = pattern.lstrip("/")
+    candidates = [PurePosixPath(*rel.parts[:i]) for i in range(1, len(rel.parts))]
+    if not dir_only:
+        candidates.append(rel)
+    return any(fnmatch.fnmatchcase(path.as_posix() if anchored else path.name, pattern) for path in candidates)
+
+
+def is_ignored(rel: PurePosixPath, patterns: list[tuple[bool, str]]) -> bool:
+    """Apply gitignore rules in order: the last matching rule wins, and `!` re-includes."""
+    ignored = False
+    for negated, pattern in patterns:
+        if _matches(rel, pattern):
+            ignored = not negated
+    return ignored
+
+
+def bundle_sources() -> list[tuple[Path, Path]]:
+    """The template files that may go in a bundle.
+
+    aura.init.get_template_files() lists what `aura init` copies from this
+    checkout, which includes the checkout's own .aura/.env and other local
+    state (copy_env). A bundle is published, so files under .aura matching
+    .aura/.gitignore are dropped, as is anything in ALWAYS_EXCLUDED.
+    """
+    from aura.init import get_aura_root, get_template_files
+
+    local_state = read_ignore_patterns(get_aura_root() / ".aura" / ".gitignore")
+    always = [(False, pattern) for pattern in ALWAYS_EXCLUDED]
+    sources = []
+    for src, dst in get_template_files():
+        rel = PurePosixPath(dst.as_posix())
+        if is_ignored(rel, always):
+            continue
+        if rel.parts[0] == ".aura" and is_ignored(PurePosixPath(*rel.parts[1:]), local_state):
+            continue
+        sources.append((src, dst))
+    return sources
+
+
+def build_bundle(files: list[tuple[Path, Path]], out_path: Path = BUNDLE_PATH) -> dict:
+    """Write the template files into a bundle.
+
+    Args:
+        files: (src, dst) pairs, as from bundle_sources()
+        out_path: Archive to write (replaced atomically)
+
+    Returns:
+        The index: install path -> {'sha256', 'size', 'mode'}
+
+    Raises:
+        BundleError: If a secrets file (.env) is among `files`
+    """
+    secrets = sorted(dst.as_posix() for _, dst in files if Path(dst).name in SECRET_FILES)
+    if secrets:
+        raise BundleError(f"refusing to bundle secrets: {', '.join(secrets)}")
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    index = {}
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_STORED) as bundle:
+        for src, dst in sorted(files, key=lambda pair: pair[1].as_posix()):
+            data = Path(src).read_bytes()
+            mode = os.stat(src).st_mode & 0o777
+            name = dst.as_posix()
+            info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+            info.external_attr = mode << 16
+            bundle.writestr(info, data)
+            index[name] = {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data), "mode": mode}
+        bundle.comment = json.dumps({"version": INDEX_VERSION, "entries": index}, separators=(",", ":")).encode()
+    os.replace(tmp, out_path)
+    return index
+
+
+class BundleEntry:
+    """One template in a bundle: its install path, hash, mode and contents."""
+
+    __slots__ = ("name", "sha256", "size", "mode", "_bundle", "_offset")
+
+    def __init__(self, bundle: "TemplateBundle", name: str, sha256: str, size: int, mode: int, offset: int):
+        self._bundle = bundle
+        self.name = name
+        self.sha256 = sha256
+        self.size = size
+        self.mode = mode
+        self._offset = offset
+
+    def read(self) -> memoryview:
+        """The file's bytes, as a zero-copy view into the mapped archive."""
+        return self._bundle.view[self._offset:self._offset + self.size]
+
+    def install(self, dst: Path) -> None:
+        """Write the file to `dst` with its recorded permission bits."""
+        with open(dst, "wb") as f:
+            f.write(self.read())
+        os.chmod(dst, self.mode)
+
+    def __repr__(self) -> str:
+        return f"<BundleEntry {self.name}>"
+
+
+class TemplateBundle:
+    """A template bundle mapped into memory.
+
+    Example:
+        bundle = TemplateBundle(BUNDLE_PATH)
+        entry = bundle.entries[".aura/scripts/transcribe.py"]
+        entry.sha256, bytes(entry.read()[:20])
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise BundleError(f"cannot open {self.path}: {e}") from e
+        self.view = memoryview(self._map)
+
+        try:
+            with zipfile.ZipFile(self._map) as archive:
+                index = json.loads(archive.comment)
+                infos = archive.infolist()
+        except (zipfile.BadZipFile, ValueError) as e:
+            raise BundleError(f"{self.path} is not a template bundle: {e}") from e
+        if index.get("version") != INDEX_VERSION:
+            raise BundleError(f"{self.path}: unsupported bundle version {index.get('version')}")
+
+        recorded = index["entries"]
+        self.entries = {}
+        for info in infos:
+            meta = recorded.get(info.filename)
+            if meta is None or info.compress_type != zipfile.ZIP_STORED:
+                raise BundleError(f"{self.path}: unexpected entry {info.filename}")
+            signature, name_len, extra_len = LOCAL_HEADER.unpack_from(self._map, info.header_offset)
+            if signature != b"PK\x03\x04":
+                raise BundleError(f"{self.path}: bad local header for {info.filename}")
+            offset = info.header_offset + 30 + name_len + extra_len
+            self.entries[info.filename] = BundleEntry(
+                self, info.filename, meta["sha256"], meta["size"], meta["mode"], offset
+            )
+
+    def verify(self) -> list[str]:
+        """Return the names of entries whose contents don't match their recorded hash."""
+        return [name for name, entry in self.entries.items()
+                if hashlib.sha256(entry.read()).hexdigest() != entry.sha256]
+
+
+@lru_cache(maxsize=1)
+def load_bundle(path: Path = BUNDLE_PATH) -> TemplateBundle | None:
+    """The packaged bundle, or None if there isn't a usable one."""
+    if not Path(path).is_file():
+        return None
+    try:
+        return TemplateBundle(path)
+    except BundleError as e:
+        print(f"Warning: ignoring template bundle ({e})", file=sys.stderr)
+        return None
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or verify the aura template bundle")
+    parser.add_argument("output", nargs="?", type=Path, default=BUNDLE_PATH, help="Bundle path")
+    parser.add_argument("--verify", action="store_true", help="Check an existing bundle instead of building")
+    args = parser.parse_args()
+
+    if args.verify:
+        try:
+            bad = TemplateBundle(args.output).verify()
+        except BundleError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        for name in bad:
+            print(f"Hash mismatch: {name}", file=sys.stderr)
+        sys.exit(1 if bad else 0)
+
+    try:
+        index = build_bundle(bundle_sources(), args.output)
+    except BundleError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    size = sum(meta["size"] for meta in index.values())
+    print(f"Wrote {args.output} ({len(index)} templates, {size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Inspection and pruning of the .aura/cache directory.
+
+The bound and the LRU order are those of .aura/scripts/transcript_cache.py,
+which evicts on every write: list_entries(), get_max_bytes() and the usage
+file mirror it (the scripts run in .aura/.venv, without this package), and
+tests/test_cache.py checks that the two agree.
+"""
+
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(".aura/cache")
+DEFAULT_MAX_MB = 100
+USAGE_FILE = ".usage"  # Running total kept by transcript_cache.put()
+
+
+def get_max_bytes() -> int:
+    """Return the configured cache bound in bytes (AURA_CACHE_MAX_MB)."""
+    return int(float(os.environ.get("AURA_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+
+
+def list_entries(cache_dir: Path = CACHE_DIR) -> list[tuple[float, int, Path]]:
+    """Return (mtime, size, path) for every cache entry, oldest first."""
+    entries = []
+    if not cache_dir.exists():
+        return entries
+    for path in cache_dir.glob("*/*/*.json"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    entries.sort()
+    return entries
+
+
+def cache_stats(cache_dir: Path = CACHE_DIR) -> dict:
+    """Summarize the cache per section (e.g. transcripts).
+
+    Returns dict with 'sections' ({name: {'entries', 'bytes'}}), 'entries',
+    'bytes', 'max_bytes', 'oldest' and 'newest' (mtimes, or None).
+    """
+    stats = {"sections": {}, "entries": 0, "bytes": 0, "max_bytes": get_max_bytes(), "oldest": None, "newest": None}
+    entries = list_entries(cache_dir)
+
+    for mtime, size, path in entries:
+        section = path.relative_to(cache_dir).parts[0]
+        counts = stats["sections"].setdefault(section, {"entries": 0, "bytes": 0})
+        counts["entries"] += 1
+        counts["bytes"] += size
+        stats["entries"] += 1
+        stats["bytes"] += size
+
+    if entries:
+        stats["oldest"] = entries[0][0]
+        stats["newest"] = entries[-1][0]
+    return stats
+
+
+def prune_cache(max_bytes: int, cache_dir: Path = CACHE_DIR, dry_run: bool = False) -> dict:
+    """Remove least-recently-used entries until the cache fits in max_bytes.
+
+    Returns dict with 'removed' (list of paths) and 'freed' (bytes).
+    """
+    results = {"removed": [], "freed": 0}
+    entries = list_entries(cache_dir)
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        if not dry_run:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+        results["removed"].append(path)
+        results["freed"] += size
+        total -= size
+
+    if not dry_run and cache_dir.exists():
+        try:
+            (cache_dir / USAGE_FILE).write_text(str(total))
+        except OSError:
+            pass
+
+    # Drop shard directories left empty
+    if not dry_run and cache_dir.exists():
+        for shard in cache_dir.glob("*/*"):
+            if shard.is_dir():
+                try:
+                    shard.rmdir()
+                except OSError:
+                    pass
+
+    return results
@@ -0,0 +1,210 @@
+"""Prerequisite probes behind `aura check`.
+
+The probes run on a thread pool: the version of each tool (`ffmpeg
+-version`, `bd --version`, ...), the packages installed in .aura/.venv,
+the API key, and write access to the visions directories. Tool and package
+results are cached in .aura/.check-cache, keyed by PATH and the mtime and
+size of the binary (or site-packages directory) they came from, so a
+repeat run only stats a few files. Failed probes are not cached, and the
+environment and write-access checks are cheap and always run.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+CACHE_FILE = ".check-cache"
+CACHE_VERSION = 1
+PROBE_TIMEOUT_S = 10
+VISIONS_DIRS = ["visions/queue", "visions/processed", "visions/failed"]
+
+# (check name, executable, arguments that print its version)
+TOOLS = [
+    ("Claude Code", "claude", ["--version"]),
+    ("ffmpeg", "ffmpeg", ["-version"]),
+    ("beads (bd)", "bd", ["--version"]),
+    ("sox", "sox", ["--version"]),
+]
+
+VERSION_RE = re.compile(r"\d+\.\d+[\w.+-]*")
+
+
+def result(name: str, ok: bool, detail: str = "") -> dict:
+    return {"name": name, "ok": ok, "detail": detail, "cached": False}
+
+
+def stat_key(path: Path | str) -> list:
+    """Identify a file's current contents by path, mtime and size."""
+    st = os.stat(path)
+    return [str(path), st.st_mtime_ns, st.st_size]
+
+
+def probe_tool(name: str, exe_path: str, args: list[str]) -> dict:
+    """Run a tool's version command and report the version it prints."""
+    try:
+        proc = subprocess.run([exe_path, *args], stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              stdin=subprocess.DEVNULL, text=True, errors="replace", timeout=PROBE_TIMEOUT_S)
+    except subprocess.TimeoutExpired:
+        return result(name, False, f"{exe_path} did not answer within {PROBE_TIMEOUT_S}s")
+    except OSError as e:
+        return result(name, False, f"cannot run {exe_path}: {e.strerror or e}")
+    first_line = proc.stdout.strip().splitlines()[0] if proc.stdout.strip() else ""
+    if proc.returncode != 0:
+        return result(name, False, f"{exe_path} exited with status {proc.returncode}")
+    match = VERSION_RE.search(first_line)
+    return result(name, True, match.group(0) if match else first_line[:60])
+
+
+def read_requirements(path: Path) -> list[str]:
+    """Distribution names listed in a requirements file, normalized."""
+    names = []
+    for line in path.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line and not line.startswith("-"):
+            names.append(normalize_name(re.split(r"[\s<>=!~;\[]", line, maxsplit=1)[0]))
+    return names
+
+
+def normalize_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def find_site_packages(venv: Path) -> list[Path]:
+    return sorted(venv.glob("lib/python*/site-packages")) + sorted(venv.glob("Lib/site-packages"))
+
+
+def probe_venv_packages(name: str, site_dirs: list[Path], requirements: Path) -> dict:
+    """Check every requirement has an installed distribution in the venv.
+
+    Reads the *.dist-info directory names rather than starting the venv's
+    interpreter.
+    """
+    installed = {}
+    for site in site_dirs:
+        for dist_info in site.glob("*.dist-info"):
+            dist, _, version = dist_info.name[:-len(".dist-info")].partition("-")
+            installed[normalize_name(dist)] = version
+    wanted = read_requirements(requirements)
+    missing = [req for req in wanted if req not in installed]
+    if missing:
+        return result(name, False, f"missing {', '.join(missing)} (uv pip install -r .aura/scripts/requirements.txt)")
+    return result(name, True, ", ".join(f"{req} {installed[req]}" for req in wanted))
+
+
+def check_writable(name: str, aura_dir: Path) -> dict:
+    """Create and remove a file in each visions directory."""
+    problems = []
+    for rel in VISIONS_DIRS:
+        directory = aura_dir / rel
+        if not directory.is_dir():
+            problems.append(f"{rel} missing")
+            continue
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=".aura-check-", dir=directory)
+            os.close(fd)
+            os.unlink(tmp)
+        except OSError as e:
+            problems.append(f"{rel}: {e.strerror or e}")
+    return result(name, not problems, "; ".join(problems) or "queue, processed, failed")
+
+
+def load_cache(path: Path) -> dict:
+    """Cached probe results, or an empty dict if absent, unreadable or for another PATH."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION or data.get("path") != os.environ.get("PATH"):
+        return {}
+    return data.get("probes", {})
+
+
+def save_cache(path: Path, probes: dict) -> None:
+    data = {"version": CACHE_VERSION, "path": os.environ.get("PATH"), "probes": probes}
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(data, indent=2) + "\n")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # The cache only saves time
+
+
+def run_checks(aura_dir: Path, use_cache: bool = True, jobs: int = 8) -> list[dict]:
+    """Run every prerequisite check, in parallel where it costs anything.
+
+    Args:
+        aura_dir: The project's .aura directory (holds the cache)
+        use_cache: Reuse cached tool and package results whose key still matches
+        jobs: Probes run at once
+
+    Returns:
+        One dict per check, in a fixed order: 'name', 'ok', 'detail' and
+        'cached' (whether the result came from .aura/.check-cache)
+    """
+    cache_path = aura_dir / CACHE_FILE
+    cached = load_cache(cache_path) if use_cache else {}
+
+    results = {}
+    probes = {}  # name -> (cache key or None, callable)
+    order = ["Python 3.12+"]
+    version = ".".join(map(str, sys.version_info[:3]))
+    results["Python 3.12+"] = result("Python 3.12+", sys.version_info >= (3, 12), version)
+
+    for name, exe, args in TOOLS:
+        order.append(name)
+        exe_path = shutil.which(exe)
+        if exe_path is None:
+            results[name] = result(name, False, "not found on PATH")
+            continue
+        try:
+            key = stat_key(os.path.realpath(exe_path))
+        except OSError:
+            key = None
+        probes[name] = (key, lambda name=name, exe_path=exe_path, args=args: probe_tool(name, exe_path, args))
+
+    name = "Script packages (.aura/.venv)"
+    order.append(name)
+    venv = aura_dir / ".venv"
+    requirements = aura_dir / "scripts" / "requirements.txt"
+    site_dirs = find_site_packages(venv)
+    if not site_dirs:
+        results[name] = result(name, False, "no .aura/.venv (uv venv .aura/.venv)")
+    elif not requirements.is_file():
+        results[name] = result(name, False, "no .aura/scripts/requirements.txt (aura init restores it)")
+    else:
+        # Installing or removing a package adds or removes a *.dist-info directory
+        key = [stat_key(requirements)] + [stat_key(site) for site in site_dirs]
+        probes[name] = (key, lambda name=name: probe_venv_packages(name, site_dirs, requirements))
+
+    order.append("OPENAI_API_KEY")
+    results["OPENAI_API_KEY"] = result("OPENAI_API_KEY", bool(os.environ.get("OPENAI_API_KEY")))
+
+    order.append("Visions writable")
+    probes["Visions writable"] = (None, lambda: check_writable("Visions writable", aura_dir))
+
+    pending = {}
+    for name, (key, _) in probes.items():
+        entry = cached.get(name)
+        if key is not None and entry and entry.get("key") == key:
+            results[name] = {**entry["result"], "cached": True}
+        else:
+            pending[name] = probes[name]
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(pending)))) as pool:
+            futures = {name: pool.submit(fn) for name, (_, fn) in pending.items()}
+        for name, future in futures.items():
+            results[name] = future.result()
+
+    # Failures (a timeout, a half-finished install) are probed again next time
+    fresh = {name: {"key": key, "result": {k: v for k, v in results[name].items() if k != "cached"}}
+             for name, (key, _) in probes.items() if key is not None and results[name]["ok"]}
+    if fresh != cached:
+        save_cache(cache_path, fresh)
+
+    return [results[name] for name in order]
@@ -2,21 +2,29 @@
 
 import click
 
-from aura.init import init_aura, BeadsNotFoundError
+from aura import __version__
 
 
 @click.group()
-@click.version_option()
+@click.version_option(__version__, prog_name="aura")  # Not looked up in package metadata at startup
 def main():
     """Aura - Agentic workflow layer for codebases."""
     pass
 
 
 @main.command()
-@click.option("--force", is_flag=True, help="Overwrite existing files")
+@click.option("--force", is_flag=True, help="Update files whose template changed (locally edited files are kept)")
 @click.option("--dry-run", is_flag=True, help="Show what would be created")
-def init(force, dry_run):
+@click.option("--repos", metavar="FILE|GLOB", help="Initialize every repository listed in FILE or matching GLOB")
+@click.option("--jobs", "-j", type=int, default=8, show_default=True, help="Repositories initialized at once (with --repos)")
+def init(force, dry_run, repos, jobs):
     """Initialize Aura in current directory."""
+    from aura.init import BeadsNotFoundError, init_aura
+
+    if repos:
+        init_repos(repos, force, dry_run, jobs)
+        return
+
     if dry_run:
         click.echo("Dry run - no files will be created:\n")
     else:
@@ -35,29 +43,87 @@ def init(force, dry_run):
         prefix = "Would create" if dry_run else "Created"
         click.echo(f"  {prefix} {path}")
 
+    for path in results["updated"]:
+        prefix = "Would update" if dry_run else "Updated"
+        click.echo(f"  {prefix} {path}")
+
     for path in results["skipped"]:
-        click.echo(f"  Skipped {path} (already exists)")
+        click.echo(f"  Skipped {path} (differs from template; --force updates it)")
+
+    for path in results["modified"]:
+        click.echo(f"  Kept {path} (modified locally; delete it and re-run to get the new template)")
 
     for error in results["errors"]:
         click.echo(f"  Error: {error}", err=True)
 
     if not dry_run:
-        created = len(results["created"])
-        skipped = len(results["skipped"])
-        click.echo(f"\nAura initialized! ({created} created, {skipped} skipped)")
+        counts = ", ".join(f"{len(results[key])} {key}" for key in ("created", "updated", "unchanged", "skipped", "modified")
+                           if results[key] or key in ("created", "unchanged"))
+        click.echo(f"\nAura initialized! ({counts})")
         click.echo("Start Claude Code - aura context loads automatically via SessionStart hook.")
 
 
+def init_repos(spec, force, dry_run, jobs):
+    """`aura init --repos`: initialize many repositories and print a summary table."""
+    import os
+    from pathlib import Path
+
+    from aura.fleet import COUNT_KEYS, init_fleet, resolve_repos, summarize
+    from aura.init import BeadsNotFoundError
+
+    repos = resolve_repos(spec)
+    if not repos:
+        click.echo(f"Error: no directories match {spec}", err=True)
+        raise SystemExit(1)
+
+    click.echo(f"{'Dry run for' if dry_run else 'Initializing'} {len(repos)} repositories ({jobs} at a time)...\n")
+    try:
+        outcomes = init_fleet(repos, force=force, dry_run=dry_run, jobs=jobs)
+    except BeadsNotFoundError as e:
+        click.echo(str(e), err=True)
+        raise SystemExit(1)
+
+    # Show paths relative to the common parent when that keeps them short
+    parent = Path(os.path.commonpath(repos)) if len(repos) > 1 else repos[0].parent
+    names = [str(outcome["repo"].relative_to(parent)) or "." for outcome in outcomes]
+    width = max(len(name) for name in names + ["repository"])
+    click.echo(f"{'repository':<{width}}  " + "".join(f"{key:>10}" for key in COUNT_KEYS) + f"{'seconds':>9}")
+    totals = dict.fromkeys(COUNT_KEYS, 0)
+    for name, outcome in zip(names, outcomes):
+        counts = summarize(outcome)
+        for key in COUNT_KEYS:
+            totals[key] += counts[key]
+        click.echo(f"{name:<{width}}  " + "".join(f"{counts[key]:>10}" for key in COUNT_KEYS)
+                   + f"{outcome['seconds']:>9.2f}")
+    click.echo(f"{'total':<{width}}  " + "".join(f"{totals[key]:>10}" for key in COUNT_KEYS))
+
+    for name, outcome in zip(names, outcomes):
+        results = outcome["results"] or {}
+        problems = ([outcome["error"]] if outcome["error"] else []) + results.get("errors", [])
+        for problem in problems:
+            click.echo(f"  {name}: Error: {problem}", err=True)
+        for path in results.get("modified", []):
+            click.echo(f"  {name}: Kept {path} (modified locally)")
+
+    if any(summarize(outcome)["errors"] for outcome in outcomes):
+        raise SystemExit(1)
+
+
 @main.command()
-def check():
+@click.option("--json", "as_json", is_flag=True, help="Print machine-readable JSON")
+@click.option("--no-cache", is_flag=True, help="Probe every tool again instead of reusing .aura/.check-cache")
+def check(as_json, no_cache):
     """Verify prerequisites are installed."""
-    import os
-    import shutil
+    import json
     from pathlib import Path
 
+    from aura.check import run_checks
+
     # Verify .aura directory exists first
     aura_dir = Path(".aura")
     if not aura_dir.exists():
+        if as_json:
+            click.echo(json.dumps({"ok": False, "error": ".aura directory not found", "checks": []}, indent=2))
         click.echo("Error: .aura directory not found.", err=True)
         click.echo("Run 'aura init' to initialize Aura in this directory.", err=True)
         raise SystemExit(1)
@@ -68,27 +134,18 @@ def check():
         from dotenv import load_dotenv
         load_dotenv(env_file)
 
-    checks = [
-        ("Python 3.12+", lambda: True),  # We're running, so yes
-        ("Claude Code", lambda: shutil.which("claude") is not None),
-        ("OPENAI_API_KEY", lambda: os.environ.get("OPENAI_API_KEY") is not None),
-        ("ffmpeg", lambda: shutil.which("ffmpeg") is not None),
-        ("beads (bd)", lambda: shutil.which("bd") is not None),
-    ]
+    if not as_json:
+        click.echo("Checking prerequisites...\n")
+    results = run_checks(aura_dir, use_cache=not no_cache)
+    issues = sum(1 for result in results if not result["ok"])
 
-    click.echo("Checking prerequisites...\n")
-    issues = 0
+    if as_json:
+        click.echo(json.dumps({"ok": not issues, "issues": issues, "checks": results}, indent=2))
+        raise SystemExit(1 if issues else 0)
 
-    for name, check_fn in checks:
-        try:
-            if check_fn():
-                click.echo(f"  + {name}")
-            else:
-                click.echo(f"  - {name}")
-                issues += 1
-        except Exception:
-            click.echo(f"  - {name}")
-            issues += 1
+    for result in results:
+        detail = f" ({result['detail']})" if result["detail"] else ""
+        click.echo(f"  {'+' if result['ok'] else '-'} {result['name']}{detail}")
 
     if issues:
         click.echo(f"\n{issues} issues found. Some features may not work.")
@@ -191,5 +248,229 @@ def remove(force, dry_run, keep_memos):
         click.echo("\nAura removed successfully!")
 
 
+@main.group()
+def cache():
+    """Inspect or trim the transcript cache in .aura/cache."""
+    pass
+
+
+@cache.command()
+def stats():
+    """Show cache size and entry counts."""
+    from datetime import datetime
+
+    from aura.cache import cache_stats
+
+    results = cache_stats()
+    if not results["entries"]:
+        click.echo("Cache is empty.")
+        return
+
+    for section, counts in sorted(results["sections"].items()):
+        click.echo(f"  {section}: {counts['entries']} entries, {format_size(counts['bytes'])}")
+
+    click.echo(f"\nTotal: {results['entries']} entries, {format_size(results['bytes'])} "
+               f"(limit {format_size(results['max_bytes'])})")
+    oldest = datetime.fromtimestamp(results["oldest"]).strftime("%Y-%m-%d %H:%M")
+    newest = datetime.fromtimestamp(results["newest"]).strftime("%Y-%m-%d %H:%M")
+    click.echo(f"Last used: {oldest} (oldest) to {newest} (newest)")
+
+
+@cache.command()
+@click.option("--max-size", type=float, help="Target size in MB (default: AURA_CACHE_MAX_MB or 100)")
+@click.option("--all", "prune_all", is_flag=True, help="Remove every entry")
+@click.option("--dry-run", is_flag=True, help="Show what would be removed")
+def prune(max_size, prune_all, dry_run):
+    """Evict least-recently-used entries until the cache fits."""
+    from aura.cache import get_max_bytes, prune_cache
+
+    if prune_all:
+        max_bytes = 0
+    elif max_size is not None:
+        max_bytes = int(max_size * 1024 * 1024)
+    else:
+        max_bytes = get_max_bytes()
+
+    results = prune_cache(max_bytes, dry_run=dry_run)
+    prefix = "Would remove" if dry_run else "Removed"
+    click.echo(f"{prefix} {len(results['removed'])} entries ({format_size(results['freed'])})")
+
+
+@main.command()
+@click.option("--json", "as_json", is_flag=True, help="Print machine-readable JSON")
+@click.option("--limit", type=int, default=20, show_default=True, help="Items listed per section (0 for all)")
+@click.option("--no-durations", is_flag=True, help="Skip reading audio durations")
+@click.option("--workers", type=int, default=2, show_default=True, help="Concurrent transcriptions to estimate for")
+def queue(as_json, limit, no_durations, workers):
+    """Show queued, failed and in-progress visions and queued plans."""
+    import json
+
+    from aura.queue import format_age, format_duration, queue_eta, queue_status
+    from aura.scripts import find_aura_dir
+
+    aura_dir = find_aura_dir()
+    if aura_dir is None:
+        click.echo("Error: .aura directory not found.", err=True)
+        click.echo("Run 'aura init' to initialize Aura in this directory.", err=True)
+        raise SystemExit(1)
+
+    status = queue_status(aura_dir, durations=not no_durations)
+    status["eta"] = None if no_durations else queue_eta(aura_dir, status, workers=max(1, workers))
+    if as_json:
+        click.echo(json.dumps(status, indent=2))
+        return
+
+    def show(items, extra=None):
+        shown = items if limit <= 0 else items[:limit]
+        width = max([len(item["name"]) + 1 for item in shown] + [10])
+        for item in shown:
+            name = item["name"] + ("/" if item["is_dir"] else "")
+            length = format_duration(item["duration_ms"]) if item["duration_ms"] is not None else ""
+            line = (f"  {item['kind']:<5}  {name:<{width}}  {format_size(item['bytes']):>8}  {length:>7}  "
+                    f"{format_age(item['age_s']):>4}")
+            note = extra(item) if extra else ""
+            click.echo(f"{line}  {note}".rstrip())
+        if len(items) > len(shown):
+            click.echo(f"  ... and {len(items) - len(shown)} more")
+
+    totals = status["totals"]
+    summary = f"{totals['text']} text, {totals['audio']} audio"
+    if totals["untranscribed"]:
+        summary += f" ({totals['untranscribed']} awaiting transcription)"
+    summary += f", {format_size(totals['bytes'])}"
+    if totals["duration_ms"]:
+        summary += f", {format_duration(totals['duration_ms'])} of audio"
+        if totals["unknown_durations"]:
+            summary += f" (+{totals['unknown_durations']} of unknown length)"
+    click.echo(f"Visions queue: {summary}")
+    eta = status["eta"]
+    if eta:
+        click.echo(f"Transcription ETA at {eta['workers']} worker(s): {format_duration(eta['p50_s'] * 1000)} "
+                   f"(p50), {format_duration(eta['p90_s'] * 1000)} (p90), from {eta['records']} past requests")
+    show(status["queue"], lambda item: "" if item["kind"] == "text" or item["transcribed"] else "untranscribed")
+
+    if status["in_progress"]:
+        click.echo(f"\nIn progress (aura worker): {len(status['in_progress'])}")
+        show(status["in_progress"])
+
+    if status["failed"]:
+        click.echo(f"\nFailed: {len(status['failed'])}")
+        show(status["failed"], lambda item: (f"{item['attempts']} attempt(s): {item['last_error']}"
+                                             if item["last_error"] else ""))
+
+    click.echo(f"\nPlans queue: {len(status['plans'])}")
+    show(status["plans"])
+
+    click.echo(f"\nProcessed visions: {status['processed']}")
+
+
+@main.command()
+@click.option("--jobs", "-j", type=int, default=2, show_default=True, help="Items transcribed concurrently")
+@click.option("--poll-interval", type=float, default=5.0, show_default=True,
+              help="Seconds between queue scans when inotify is unavailable")
+@click.option("--max-attempts", type=int, default=3, show_default=True, help="Give up on a failed item after this many tries")
+@click.option("--no-retry", is_flag=True, help="Leave items in visions/failed/ alone")
+@click.option("--once", is_flag=True, help="Process what is queued now, then exit")
+def worker(jobs, poll_interval, max_attempts, no_retry, once):
+    """Transcribe audio dropped into .aura/visions/queue in the background."""
+    import signal
+
+    from aura.scripts import find_aura_dir, load_env, missing_dependencies
+    from aura.worker import Worker, WorkerLockedError, log_line
+
+    aura_dir = find_aura_dir()
+    if aura_dir is None:
+        click.echo("Error: .aura directory not found.", err=True)
+        click.echo("Run 'aura init' to initialize Aura in this directory.", err=True)
+        raise SystemExit(1)
+
+    load_env(aura_dir)
+    missing = missing_dependencies()
+    if missing:
+        click.echo(f"Error: missing script dependencies: {', '.join(missing)}", err=True)
+        click.echo("Run the worker from .aura/.venv (uv pip install -r .aura/scripts/requirements.txt).", err=True)
+        raise SystemExit(1)
+
+    # Stop the same way on SIGTERM (e.g. from a service manager) as on Ctrl+C
+    def on_sigterm(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+
+    runner = Worker(aura_dir, jobs=jobs, poll_interval=poll_interval, max_attempts=max_attempts,
+                    retry_failed=not no_retry, log=log_line)
+    if not once:
+        log_line(f"Watching {runner.queue_dir} with {runner.jobs} worker(s). Press Ctrl+C to stop.")
+    try:
+        stats = runner.run(once=once)
+    except WorkerLockedError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise SystemExit(1)
+    except KeyboardInterrupt:
+        stats = runner.stats
+        click.echo()
+
+    click.echo(f"{stats['done']} transcribed, {stats['failed']} failed")
+    if stats["failed"]:
+        raise SystemExit(2)
+
+
+@main.command()
+@click.argument("sources", nargs=-1, required=True)
+@click.option("--jobs", "-j", type=int, default=8, show_default=True, help="API requests in flight across all files")
+@click.option("--files", "file_jobs", type=int, default=4, show_default=True, help="Files processed concurrently")
+@click.option("--rpm", type=float, help="Cap on API requests per minute")
+@click.option("--recursive", "-r", is_flag=True, help="Descend into subdirectories of directory sources")
+@click.option("--move", is_flag=True, help="Move source files into the queue instead of copying")
+@click.option("--force", is_flag=True, help="Re-ingest files that were ingested before")
+@click.option("--dry-run", is_flag=True, help="List the files that would be ingested")
+def ingest(sources, jobs, file_jobs, rpm, recursive, move, force, dry_run):
+    """Transcribe a directory or glob of audio files into the visions queue."""
+    from aura.ingest import expand_sources, format_minutes, run_ingest
+    from aura.scripts import find_aura_dir, load_env, missing_dependencies
+
+    aura_dir = find_aura_dir()
+    if aura_dir is None:
+        click.echo("Error: .aura directory not found.", err=True)
+        click.echo("Run 'aura init' to initialize Aura in this directory.", err=True)
+        raise SystemExit(1)
+
+    paths = expand_sources(list(sources), recursive=recursive)
+    if not paths:
+        click.echo("No audio files found.", err=True)
+        raise SystemExit(1)
+
+    if dry_run:
+        for path in paths:
+            click.echo(f"  Would ingest {path}")
+        click.echo(f"\n{len(paths)} file(s)")
+        return
+
+    load_env(aura_dir)
+    missing = missing_dependencies()
+    if missing:
+        click.echo(f"Error: missing script dependencies: {', '.join(missing)}", err=True)
+        click.echo("Run ingest from .aura/.venv (uv pip install -r .aura/scripts/requirements.txt).", err=True)
+        raise SystemExit(1)
+
+    try:
+        results = run_ingest(paths, aura_dir, jobs=jobs, file_jobs=file_jobs, requests_per_minute=rpm,
+                             move=move, force=force, log=click.echo)
+    except KeyboardInterrupt:
+        click.echo("\nAborted.", err=True)
+        raise SystemExit(130)
+
+    if results["skipped"]:
+        click.echo(f"Skipped {len(results['skipped'])} file(s) ingested before (use --force to redo)")
+    wall_min = results["elapsed"] / 60
+    speed = results["audio_ms"] / 60000 / wall_min if wall_min > 0 else 0.0
+    click.echo(f"\n{len(results['queued'])} queued, {len(results['failed'])} failed: "
+               f"{format_minutes(results['audio_ms'])} of audio in {wall_min:.1f} min ({speed:.1f}x)")
+    if results.get("scheduler"):
+        click.echo(f"API: {results['scheduler']}")
+    if results["failed"]:
+        raise SystemExit(2)
+
+
 if __name__ == "__main__":
     main()
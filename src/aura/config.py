@@ -2,6 +2,8 @@ DOT_AURA_CFG = {
     "blacklist": [
         "visions",  # visions/queue, visions/processed, visions/failed are created empty
         "plans",  # plans/queue, plans/processed are created empty
+        "cache",  # Per-project transcript cache, never copied
+        "metrics",  # Per-project transcription timings, never copied
     ],
     "copy_env": True,
 }
@@ -0,0 +1,85 @@
+"""Initialize or update Aura in many repositories at once (`aura init --repos`).
+
+The template set is listed and hashed once and shared by every
+repository; each repository is then synced by init_aura (manifest diff,
+settings merge, `bd init`) on a bounded thread pool, so file I/O and the
+`bd` subprocesses of different repositories overlap.
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from aura.init import BEADS_INSTALL_MSG, BeadsNotFoundError, check_beads_available, get_template_set, init_aura
+
+DEFAULT_JOBS = 8  # Repositories synced at once
+COUNT_KEYS = ("created", "updated", "unchanged", "skipped", "modified", "errors")
+
+
+def resolve_repos(spec: str) -> list[Path]:
+    """Resolve a repository list file or a glob to existing directories.
+
+    A file lists one directory or glob per line; blank lines and lines
+    starting with '#' are ignored, and relative entries are relative to the
+    file. Anything else is treated as a glob itself.
+
+    Returns:
+        Resolved directories, sorted and without duplicates
+    """
+    path = Path(spec).expanduser()
+    if path.is_file():
+        patterns = []
+        for line in path.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                entry = Path(line).expanduser()
+                patterns.append(str(entry if entry.is_absolute() else path.parent / entry))
+    else:
+        patterns = [spec]
+
+    found = set()
+    for pattern in patterns:
+        for match in glob.glob(os.path.expanduser(pattern), recursive=True):
+            if os.path.isdir(match):
+                found.add(Path(match).resolve())
+    return sorted(found)
+
+
+def _init_one(repo: Path, force: bool, dry_run: bool, templates) -> dict:
+    start = time.perf_counter()
+    try:
+        results = init_aura(force=force, dry_run=dry_run, root=repo, templates=templates)
+        error = None
+    except Exception as e:  # One broken repository shouldn't stop the others
+        results = None
+        error = str(e)
+    return {"repo": repo, "results": results, "error": error, "seconds": time.perf_counter() - start}
+
+
+def init_fleet(repos: list[Path], force: bool = False, dry_run: bool = False, jobs: int = DEFAULT_JOBS) -> list[dict]:
+    """Run init_aura in every repository, `jobs` at a time.
+
+    Returns:
+        One dict per repository, in input order: 'repo', 'results'
+        (init_aura's result, or None on failure), 'error' and 'seconds'
+
+    Raises:
+        BeadsNotFoundError: If beads CLI not available.
+    """
+    if not check_beads_available():
+        raise BeadsNotFoundError(BEADS_INSTALL_MSG)
+
+    templates = get_template_set()
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return list(pool.map(lambda repo: _init_one(repo, force, dry_run, templates), repos))
+
+
+def summarize(outcome: dict) -> dict:
+    """Counts per result category for one repository's outcome."""
+    results = outcome["results"] or {}
+    counts = {key: len(results.get(key, [])) for key in COUNT_KEYS}
+    if outcome["error"]:
+        counts["errors"] += 1
+    return counts
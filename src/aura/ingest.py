@@ -0,0 +1,255 @@
+"""Bulk import of audio files into the visions queue (`aura ingest`).
+
+All files are handled in one process: durations are probed up front in
+parallel, files are transcribed longest-first through one pool, and every
+API request goes through the process-wide scheduler (see
+.aura/scripts/rate_limit.py), so concurrency and requests per minute are
+bounded globally rather than per file, and throttling slows everyone
+down. Finished transcripts are titled in batches and written as
+queue/<title>/ with audio + transcript.txt, the layout record_memo.py's
+save_memo produces.
+
+Sources already ingested (same path, size and mtime) are recorded in
+visions/.ingested.json and skipped on later runs.
+"""
+
+import glob
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from aura.scripts import import_script
+from aura.worker import AUDIO_EXTENSIONS, unique_path
+
+INDEX_FILE_NAME = ".ingested.json"
+STAGING_DIR_NAME = ".ingest"
+DEFAULT_JOBS = 8  # API requests in flight across all files
+DEFAULT_FILE_JOBS = 4  # Files being split/transcribed at once
+PROBE_JOBS = 16
+TITLE_BATCH_SIZE = 20  # Write memos to the queue every this many transcripts
+
+
+def expand_sources(sources: list[str], recursive: bool = False) -> list[Path]:
+    """Resolve directories, globs and file paths to a sorted list of audio files."""
+    found = set()
+    for source in sources:
+        path = Path(source).expanduser()
+        if path.is_dir():
+            candidates = path.rglob("*") if recursive else path.iterdir()
+        elif path.is_file():
+            candidates = [path]
+        else:
+            candidates = (Path(match) for match in glob.glob(os.path.expanduser(source), recursive=True))
+        for candidate in candidates:
+            if candidate.is_file() and candidate.suffix.lower() in AUDIO_EXTENSIONS:
+                found.add(candidate.resolve())
+    return sorted(found)
+
+
+def probe_all(paths: list[Path], probe) -> dict[Path, int | None]:
+    """Probe every file's duration concurrently (header reads, no decoding)."""
+    with ThreadPoolExecutor(max_workers=PROBE_JOBS) as pool:
+        return dict(zip(paths, pool.map(lambda p: probe(str(p)), paths)))
+
+
+def load_index(visions_dir: Path) -> dict:
+    try:
+        return json.loads((visions_dir / INDEX_FILE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(visions_dir: Path, index: dict) -> None:
+    fd, tmp = tempfile.mkstemp(dir=visions_dir, prefix=f"{INDEX_FILE_NAME}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp, visions_dir / INDEX_FILE_NAME)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def source_signature(path: Path) -> dict:
+    st = path.stat()
+    return {"size": st.st_size, "mtime": st.st_mtime}
+
+
+def already_ingested(index: dict, path: Path) -> bool:
+    entry = index.get(str(path))
+    return entry is not None and {k: entry.get(k) for k in ("size", "mtime")} == source_signature(path)
+
+
+def format_minutes(ms: int) -> str:
+    return f"{ms / 60000:.1f} min"
+
+
+class Progress:
+    """Per-file progress lines with running throughput (audio-minutes per wall-minute)."""
+
+    def __init__(self, total: int, log, scheduler=None):
+        self.total = total
+        self.log = log
+        self.scheduler = scheduler
+        self.finished = 0
+        self.audio_ms = 0
+        self.start = time.monotonic()
+
+    def throughput(self) -> tuple[float, float, float]:
+        """Return (audio minutes, wall minutes, speed factor)."""
+        audio_min = self.audio_ms / 60000
+        wall_min = (time.monotonic() - self.start) / 60
+        return audio_min, wall_min, audio_min / wall_min if wall_min > 0 else 0.0
+
+    def file_done(self, path: Path, duration_ms: int | None, elapsed: float, error: Exception | None = None) -> None:
+        self.finished += 1
+        if error is None:
+            self.audio_ms += duration_ms or 0
+        audio_min, wall_min, speed = self.throughput()
+        counter = f"[{self.finished:>{len(str(self.total))}}/{self.total}]"
+        if error is not None:
+            self.log(f"{counter} FAILED {path.name}: {error}")
+            return
+        length = format_minutes(duration_ms) if duration_ms else "? min"
+        line = (f"{counter} {path.name}  {length} in {elapsed:.1f}s  |  "
+                f"{audio_min:.1f} audio-min in {wall_min:.1f} wall-min ({speed:.1f}x)")
+        if self.scheduler is not None:
+            state = self.scheduler.state()
+            line += f"  |  {state['limit']} concurrent"
+            if state["throttled"]:
+                line += f", {state['throttled']} throttled"
+        self.log(line)
+
+
+def run_ingest(
+    paths: list[Path],
+    aura_dir: Path,
+    jobs: int = DEFAULT_JOBS,
+    file_jobs: int = DEFAULT_FILE_JOBS,
+    requests_per_minute: float | None = None,
+    move: bool = False,
+    force: bool = False,
+    log=print,
+) -> dict:
+    """Transcribe, title and queue a batch of audio files.
+
+    Args:
+        paths: Audio files to ingest (see expand_sources)
+        aura_dir: The project's .aura directory
+        jobs: Maximum API requests in flight across all files
+        file_jobs: Files processed concurrently
+        requests_per_minute: Optional cap on API requests per minute
+        move: Move source files into the queue instead of copying them
+        force: Ingest files even if the index says they were done before
+        log: Called with each progress line
+
+    Returns:
+        Dict with 'queued' (list of queue dirs), 'failed' (list of (path, error)),
+        'skipped' (list of paths), 'audio_ms', 'elapsed' (seconds) and
+        'scheduler' (summary of API throttling and retries)
+    """
+    transcribe = import_script("transcribe", aura_dir)
+    titles = import_script("generate_title", aura_dir)
+    rate_limit = import_script("rate_limit", aura_dir)
+
+    visions_dir = aura_dir / "visions"
+    queue_dir = visions_dir / "queue"
+    staging_dir = visions_dir / STAGING_DIR_NAME
+    queue_dir.mkdir(parents=True, exist_ok=True)
+    staging_dir.mkdir(parents=True, exist_ok=True)
+
+    results = {"queued": [], "failed": [], "skipped": [], "audio_ms": 0, "elapsed": 0.0}
+    index = load_index(visions_dir)
+    if not force:
+        results["skipped"] = [p for p in paths if already_ingested(index, p)]
+        skipped = set(results["skipped"])
+        paths = [p for p in paths if p not in skipped]
+    if not paths:
+        return results
+
+    log(f"Probing {len(paths)} file(s)...")
+    durations = probe_all(paths, transcribe.probe_duration_ms)
+    known = [ms for ms in durations.values() if ms]
+    log(f"{format_minutes(sum(known))} of audio"
+        + (f" ({len(paths) - len(known)} file(s) of unknown length)" if len(known) < len(paths) else ""))
+
+    # Longest first keeps the pool busy at the end instead of waiting on one big file
+    paths = sorted(paths, key=lambda p: durations[p] or 0, reverse=True)
+
+    scheduler = rate_limit.configure(max_concurrency=jobs, requests_per_minute=requests_per_minute)
+    progress = Progress(len(paths), log, scheduler)
+    taken = titles.existing_queue_titles(queue_dir)
+    finished: list[tuple[Path, str]] = []  # Transcribed, waiting to be titled and queued
+    handled: set[Path] = set()
+
+    def transcribe_one(path: Path) -> tuple[str, float]:
+        start = time.monotonic()
+        text = transcribe.transcribe_file(str(path), jobs=jobs)
+        return text, time.monotonic() - start
+
+    def write_memos() -> None:
+        """Title the finished transcripts in one batch and move them into the queue."""
+        if not finished:
+            return
+        batch = list(finished)
+        finished.clear()
+        named = titles.generate_titles_batch([(str(p), text) for p, text in batch], taken=taken)
+        for (path, text), entry in zip(batch, named):
+            staged = unique_path(staging_dir, path.stem)
+            staged.mkdir()
+            audio = staged / f"audio{path.suffix.lower()}"
+            if move:
+                shutil.move(str(path), str(audio))
+            else:
+                shutil.copy2(path, audio)
+            (staged / "transcript.txt").write_text(text, encoding="utf-8")
+            signature = source_signature(audio)  # Copy and move both keep size and mtime
+            target = unique_path(queue_dir, entry["title"])
+            os.rename(staged, target)
+            results["queued"].append(target)
+            index[str(path)] = {**signature, "queue": target.name}
+        save_index(visions_dir, index)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, file_jobs))
+    futures = {pool.submit(transcribe_one, path): path for path in paths}
+    try:
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = futures[future]
+                handled.add(path)
+                try:
+                    text, elapsed = future.result()
+                except Exception as e:
+                    results["failed"].append((path, str(e)))
+                    progress.file_done(path, durations[path], 0.0, error=e)
+                    continue
+                progress.file_done(path, durations[path], elapsed)
+                finished.append((path, text))
+            if len(finished) >= TITLE_BATCH_SIZE:
+                write_memos()
+    except KeyboardInterrupt:
+        log("Interrupted: finishing files in progress and queueing what is done...")
+        pool.shutdown(wait=True, cancel_futures=True)
+        for future, path in futures.items():
+            if path not in handled and future.done() and not future.cancelled() and future.exception() is None:
+                finished.append((path, future.result()[0]))
+        raise
+    finally:
+        pool.shutdown(wait=True)
+        write_memos()
+        try:
+            staging_dir.rmdir()  # Only if empty: a failed write may have left moved audio there
+        except OSError:
+            pass
+        results["audio_ms"] = progress.audio_ms
+        results["elapsed"] = time.monotonic() - progress.start
+        results["scheduler"] = scheduler.format_state()
+
+    return results
@@ -1,12 +1,26 @@
-"""Aura initialization logic."""
+"""Aura initialization logic.
 
+Installed template files are recorded in .aura/.manifest.json (content
+hash, size and mtime per file). Re-running init compares each template with
+the installed copy: identical files are left alone (no write, no mtime
+change), files still matching what was installed are updated with --force,
+and files edited since they were installed are reported, never overwritten.
+"""
+
+import hashlib
 import json
+import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 from aura.config import DOT_AURA_CFG, DOT_AURA_FOLDERS
 
+MANIFEST_PATH = Path(".aura") / ".manifest.json"
+MANIFEST_VERSION = 1
+LOCAL_STATE_FILES = (MANIFEST_PATH.name, ".check-cache")  # Per-checkout files under .aura, never installed
+
 BEADS_INSTALL_MSG = """
 Beads CLI (bd) is required but not installed.
 
@@ -26,6 +40,7 @@ def check_beads_available() -> bool:
     return shutil.which("bd") is not None
 
 
+@lru_cache(maxsize=1)
 def get_aura_root() -> Path:
     """Find aura package root directory.
 
@@ -37,15 +52,13 @@ def get_aura_root() -> Path:
     return init_path.parent.parent.parent
 
 
-AURA_ROOT = get_aura_root()
-
-
 def get_template_files():
     """Return list of (src, dst) tuples for all template files."""
     files = []
+    aura_root = get_aura_root()
 
     # .aura/ contents (except visions/, plans/ which are created empty)
-    aura_source = AURA_ROOT / ".aura"
+    aura_source = aura_root / ".aura"
     if aura_source.exists():
         for src in aura_source.glob("**/*"):
             if src.is_file() and src.name != ".gitkeep":
@@ -56,11 +69,14 @@ def get_template_files():
                 # Skip .env file (contains secrets)
                 if rel.name == ".env" and not DOT_AURA_CFG["copy_env"]:
                     continue
+                # Skip bytecode and this checkout's own install manifest and check cache
+                if "__pycache__" in rel.parts or rel.as_posix() in LOCAL_STATE_FILES:
+                    continue
                 dst = Path(".aura") / rel
                 files.append((src, dst))
 
     # .claude/templates/ contents
-    templates_source = AURA_ROOT / ".claude" / "templates"
+    templates_source = aura_root / ".claude" / "templates"
     if templates_source.exists():
         for src in templates_source.glob("**/*"):
             if src.is_file():
@@ -69,7 +85,7 @@ def get_template_files():
                 files.append((src, dst))
 
     # .claude/skills/ contents (subdirectories with SKILL.md)
-    skills_source = AURA_ROOT / ".claude" / "skills"
+    skills_source = aura_root / ".claude" / "skills"
     if skills_source.exists():
         for src in skills_source.glob("**/*"):
             if src.is_file():
@@ -83,6 +99,147 @@ def get_template_files():
     return files
 
 
+def use_template_bundle() -> bool:
+    """Whether templates come from the packaged bundle rather than the files.
+
+    AURA_TEMPLATES=bundle or =files decides; by default the bundle is used
+    unless the template sources are present (a checkout / editable install),
+    so local edits to the templates always take effect.
+    """
+    choice = os.environ.get("AURA_TEMPLATES")
+    if choice in ("bundle", "files"):
+        return choice == "bundle"
+    return not (get_aura_root() / ".aura").is_dir()
+
+
+def get_template_set() -> list[tuple["Path | BundleEntry", Path, str]]:
+    """Return (src, dst, sha256) for every template file.
+
+    From the packaged bundle (see aura.bundle), `src` is a BundleEntry and
+    the hashes come from its index: no directory walk and no hashing.
+    Otherwise the template files are listed and hashed here, once, so
+    callers initializing many repositories (see aura.fleet) share the work.
+    """
+    if use_template_bundle():
+        from aura.bundle import load_bundle
+
+        bundle = load_bundle()
+        if bundle is not None:
+            return [(entry, Path(name), entry.sha256) for name, entry in bundle.entries.items()]
+    return [(src, dst, file_sha256(src)) for src, dst in get_template_files()]
+
+
+def install_template(src, dst: Path) -> None:
+    """Copy a template file (a path or a bundle entry) to `dst`."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(src, Path):
+        shutil.copy(src, dst)
+    else:
+        src.install(dst)
+
+
+def file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict | None:
+    """Load the install manifest's file entries, or None if there is no (valid) manifest."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return None
+    return data.get("files", {})
+
+
+def save_manifest(files: dict, path: Path = MANIFEST_PATH) -> bool:
+    """Write the install manifest atomically if its contents changed.
+
+    Returns:
+        True if the file was written
+    """
+    content = json.dumps({"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}, indent=2) + "\n"
+    try:
+        if path.read_text() == content:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(content)
+    os.replace(tmp, path)
+    return True
+
+
+def manifest_entry(path: Path, sha256: str) -> dict:
+    """Manifest record for an installed file whose contents hash to `sha256`."""
+    st = path.stat()
+    return {"sha256": sha256, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def installed_hash(dst: Path, entry: dict | None) -> str:
+    """Hash of the installed file, trusting the manifest if size and mtime are unchanged."""
+    if entry is not None:
+        st = dst.stat()
+        if st.st_size == entry.get("size") and st.st_mtime_ns == entry.get("mtime_ns"):
+            return entry["sha256"]
+    return file_sha256(dst)
+
+
+def sync_template_file(
+    src,
+    dst: Path,
+    entry: dict | None,
+    force: bool,
+    dry_run: bool,
+    src_hash: str | None = None,
+) -> tuple[str, dict | None]:
+    """Bring one installed template file in line with its source.
+
+    A file with no manifest record was installed before manifests existed,
+    so a difference can't be told apart from a local edit; with `force` it
+    is overwritten, as it always was.
+
+    Args:
+        src: Template file in the aura checkout, or a bundle entry
+        dst: Installed path
+        entry: dst's manifest record, if any
+        force: Update installed files whose template changed
+        dry_run: Decide, but don't write
+        src_hash: src's SHA-256, if already known
+
+    Returns:
+        (action, manifest entry) where action is 'created', 'updated',
+        'unchanged', 'skipped' (differs; no force) or 'modified' (edited
+        locally; left alone)
+    """
+    if src_hash is None:
+        src_hash = file_sha256(src) if isinstance(src, Path) else src.sha256
+    if not dst.exists():
+        action = "created"
+    else:
+        dst_hash = installed_hash(dst, entry)
+        if dst_hash == src_hash:
+            return "unchanged", None if dry_run else manifest_entry(dst, dst_hash)
+        if not force:
+            return "skipped", entry
+        if entry is None or dst_hash == entry.get("sha256"):
+            action = "updated"
+        else:
+            return "modified", entry
+
+    if dry_run:
+        return action, None
+    install_template(src, dst)
+    return action, manifest_entry(dst, src_hash)
+
+
 def get_session_start_hook():
     """Return the SessionStart hook configuration for aura.md injection."""
     return {
@@ -150,80 +307,107 @@ def merge_settings_json(target_path: Path, force: bool = False) -> dict:
     return result
 
 
-def init_aura(force: bool = False, dry_run: bool = False):
-    """Initialize Aura in current directory.
+def init_aura(
+    force: bool = False,
+    dry_run: bool = False,
+    root: Path | None = None,
+    templates: list[tuple[Path, Path, str]] | None = None,
+):
+    """Initialize Aura in a directory (default: the current one).
+
+    Template files are synced against .aura/.manifest.json: new files are
+    created, identical ones are left untouched, and with `force` files whose
+    template changed are updated unless they were edited locally.
+
+    Args:
+        force: Update changed templates and re-run `bd init`
+        dry_run: Report what would happen without writing
+        root: Directory to initialize; reported paths stay relative to it
+        templates: Result of get_template_set(), to reuse across repositories
+
+    Returns:
+        Dict of path lists: 'created', 'updated', 'unchanged', 'skipped'
+        (exists and differs; no force), 'modified' (edited locally, kept),
+        plus 'errors' and 'warnings'
 
     Raises:
         BeadsNotFoundError: If beads CLI not available.
     """
-    results = {"created": [], "skipped": [], "errors": [], "warnings": []}
+    results = {"created": [], "updated": [], "unchanged": [], "skipped": [], "modified": [],
+               "errors": [], "warnings": []}
 
     # Check beads availability upfront
     if not check_beads_available():
         raise BeadsNotFoundError(BEADS_INSTALL_MSG)
 
+    root = Path(root) if root is not None else Path(".")
+    if templates is None:
+        templates = get_template_set()
+
     # Create folder structure
     for folder in DOT_AURA_FOLDERS:
         folder_path = Path(".aura") / folder
-        gitkeep_path = folder_path / ".gitkeep"
+        gitkeep_path = root / folder_path / ".gitkeep"
 
         if dry_run:
-            if not folder_path.exists():
+            if not (root / folder_path).exists():
                 results["created"].append(str(folder_path) + "/")
             continue
 
         try:
-            folder_path.mkdir(parents=True, exist_ok=True)
+            (root / folder_path).mkdir(parents=True, exist_ok=True)
             if not gitkeep_path.exists():
                 gitkeep_path.touch()
                 results["created"].append(str(folder_path) + "/")
         except Exception as e:
             results["errors"].append(f"{folder_path}: {e}")
 
-    # Copy template files
-    for src, dst in get_template_files():
-        if dry_run:
-            if dst.exists() and not force:
-                results["skipped"].append(str(dst))
-            else:
-                results["created"].append(str(dst))
-            continue
-
+    # Sync template files against the install manifest
+    manifest = load_manifest(root / MANIFEST_PATH) or {}
+    installed = {}
+    for src, dst, src_hash in templates:
+        key = dst.as_posix()
+        entry = manifest.get(key)
         try:
-            if dst.exists() and not force:
-                results["skipped"].append(str(dst))
-                continue
-
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(src, dst)
-            results["created"].append(str(dst))
+            action, new_entry = sync_template_file(src, root / dst, entry, force, dry_run, src_hash)
         except Exception as e:
             results["errors"].append(f"{dst}: {e}")
+            new_entry = entry
+        else:
+            results[action].append(str(dst))
+        if new_entry is not None:
+            installed[key] = new_entry
+
+    if not dry_run:
+        try:
+            save_manifest(installed, root / MANIFEST_PATH)
+        except OSError as e:
+            results["warnings"].append(f"{MANIFEST_PATH}: could not write manifest: {e}")
 
     # Merge settings.json with SessionStart hook
     settings_path = Path(".claude/settings.json")
     if dry_run:
-        if settings_path.exists():
+        if (root / settings_path).exists():
             results["created"].append(f"{settings_path} (merge hook)")
         else:
             results["created"].append(str(settings_path))
     else:
-        merge_result = merge_settings_json(settings_path, force)
+        merge_result = merge_settings_json(root / settings_path, force)
         if merge_result["action"] == "created":
             results["created"].append(str(settings_path))
         elif merge_result["action"] == "merged":
             results["created"].append(f"{settings_path} (merged hook)")
         elif merge_result["action"] == "skipped":
-            results["skipped"].append(str(settings_path))
+            results["unchanged"].append(str(settings_path))
         elif merge_result["action"] == "error":
             results["errors"].append(f"{settings_path}: {merge_result.get('message', 'unknown error')}")
 
     # Initialize beads
     if not dry_run:
-        beads_dir = Path(".beads")
+        beads_dir = root / ".beads"
         if not beads_dir.exists() or force:
             try:
-                subprocess.run(["bd", "init"], check=True, capture_output=True)
+                subprocess.run(["bd", "init"], check=True, capture_output=True, cwd=root)
                 results["created"].append(".beads/ (via bd init)")
             except subprocess.CalledProcessError as e:
                 results["errors"].append(f".beads/: bd init failed: {e}")
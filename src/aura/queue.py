@@ -0,0 +1,213 @@
+"""Status of the visions and plans queues (`aura queue`).
+
+Each directory is listed with a single os.scandir pass, reusing the stat
+results it yields; audio vision directories get one more scandir of their
+own contents. Durations come from the audio headers (audio_probe.py in
+.aura/scripts) when the project has it, so no audio is decoded and no
+process is spawned, even for queues with thousands of entries.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from aura.worker import AUDIO_EXTENSIONS, STATE_FILE_NAME, WORK_DIR_NAME
+
+TEXT_EXTENSIONS = {".txt", ".md"}
+
+
+def _scan_item(entry: os.DirEntry, now: float) -> dict | None:
+    """Describe one queue entry, or None for hidden files and unknown file types."""
+    if entry.name.startswith("."):
+        return None
+    try:
+        st = entry.stat()
+        is_dir = entry.is_dir()
+    except OSError:
+        return None  # Removed while scanning
+
+    item = {
+        "name": entry.name,
+        "path": entry.path,
+        "kind": None,
+        "is_dir": is_dir,
+        "bytes": 0 if is_dir else st.st_size,
+        "age_s": max(0.0, now - st.st_mtime),
+        "audio": None,
+        "duration_ms": None,
+        "transcribed": None,
+    }
+
+    if not is_dir:
+        suffix = os.path.splitext(entry.name)[1].lower()
+        if suffix in AUDIO_EXTENSIONS:
+            item.update(kind="audio", audio=entry.path, transcribed=False)
+        elif suffix in TEXT_EXTENSIONS:
+            item["kind"] = "text"
+        else:
+            return None
+        return item
+
+    # A vision directory: audio.* plus transcript.txt, or text files only
+    has_transcript = False
+    newest = st.st_mtime
+    try:
+        with os.scandir(entry.path) as children:
+            for child in children:
+                try:
+                    child_st = child.stat()
+                except OSError:
+                    continue
+                if not child.is_file():
+                    continue
+                item["bytes"] += child_st.st_size
+                newest = max(newest, child_st.st_mtime)
+                if child.name == "transcript.txt":
+                    has_transcript = True
+                elif child.name.startswith("audio.") and os.path.splitext(child.name)[1].lower() in AUDIO_EXTENSIONS:
+                    item["audio"] = child.path
+                elif child.name == STATE_FILE_NAME:
+                    item["state"] = child.path
+    except OSError:
+        return None
+    item["age_s"] = max(0.0, now - newest)
+    if item["audio"]:
+        item.update(kind="audio", transcribed=has_transcript)
+    else:
+        item["kind"] = "text"
+    return item
+
+
+def scan_dir(directory: Path, now: float | None = None) -> list[dict]:
+    """Describe every vision or plan in `directory`, oldest first."""
+    now = time.time() if now is None else now
+    items = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                item = _scan_item(entry, now)
+                if item is not None:
+                    items.append(item)
+    except FileNotFoundError:
+        return []
+    items.sort(key=lambda item: -item["age_s"])
+    return items
+
+
+def _load_probe(aura_dir: Path):
+    """The project's header-only duration probe, or None for projects without audio_probe.py."""
+    try:
+        from aura.scripts import import_script
+
+        return import_script("audio_probe", aura_dir).read_duration_ms
+    except (ImportError, AttributeError):
+        return None
+
+
+def queue_eta(aura_dir: Path, status: dict, workers: int = 2) -> dict | None:
+    """Estimate how long transcribing the queue's untranscribed audio takes.
+
+    Uses the throughput history in .aura/metrics (see throughput.py in
+    .aura/scripts) and the durations queue_status() read.
+
+    Returns:
+        Dict with 'p50_s', 'p90_s', 'workers', 'records' and 'files', or
+        None without durations, throughput.py or enough history
+    """
+    pending = [item["duration_ms"] for item in status["queue"]
+               if item["kind"] == "audio" and not item["transcribed"] and item["duration_ms"]]
+    if not pending:
+        return None
+    try:
+        from aura.scripts import import_script
+
+        throughput = import_script("throughput", aura_dir)
+        records = throughput.load_records(aura_dir / "metrics" / throughput.METRICS_FILE)
+        eta = throughput.estimate_eta(pending, workers=workers, records=records)
+    except (ImportError, AttributeError):
+        return None
+    if eta is None:
+        return None
+    return {"p50_s": eta["p50_s"], "p90_s": eta["p90_s"], "workers": workers,
+            "records": eta["records"], "files": len(pending)}
+
+
+def queue_status(aura_dir: Path, durations: bool = True) -> dict:
+    """Summarize queued, in-progress and failed visions and queued plans.
+
+    Args:
+        aura_dir: The project's .aura directory
+        durations: Read audio durations from file headers
+
+    Returns:
+        Dict with 'queue', 'in_progress', 'failed' and 'plans' (lists of
+        item dicts with 'name', 'path', 'kind' ("text", "audio" or "plan"),
+        'is_dir', 'bytes', 'age_s', 'audio', 'duration_ms' and
+        'transcribed'; failed items also carry 'attempts' and
+        'last_error'), 'processed' (count) and 'totals'
+    """
+    now = time.time()
+    visions_dir = aura_dir / "visions"
+    status = {
+        "queue": scan_dir(visions_dir / "queue", now),
+        "in_progress": scan_dir(visions_dir / WORK_DIR_NAME, now),
+        "failed": scan_dir(visions_dir / "failed", now),
+        "plans": scan_dir(aura_dir / "plans" / "queue", now),
+    }
+    for item in status["plans"]:
+        item["kind"] = "plan"
+
+    probe = _load_probe(aura_dir) if durations else None
+    for section in ("queue", "in_progress", "failed"):
+        for item in status[section]:
+            if probe is not None and item["audio"]:
+                item["duration_ms"] = probe(item["audio"])
+            state_path = item.pop("state", None)
+            if section == "failed":
+                state = {}
+                if state_path:
+                    try:
+                        with open(state_path, encoding="utf-8") as f:
+                            state = json.load(f)
+                    except (OSError, ValueError):
+                        pass
+                item["attempts"] = state.get("attempts", 0)
+                item["last_error"] = state.get("last_error")
+
+    try:
+        with os.scandir(visions_dir / "processed") as entries:
+            status["processed"] = sum(1 for entry in entries if not entry.name.startswith("."))
+    except FileNotFoundError:
+        status["processed"] = 0
+
+    queue = status["queue"]
+    audio = [item for item in queue if item["kind"] == "audio"]
+    status["totals"] = {
+        "text": sum(1 for item in queue if item["kind"] == "text"),
+        "audio": len(audio),
+        "untranscribed": sum(1 for item in audio if not item["transcribed"]),
+        "in_progress": len(status["in_progress"]),
+        "failed": len(status["failed"]),
+        "plans": len(status["plans"]),
+        "bytes": sum(item["bytes"] for item in queue),
+        "duration_ms": sum(item["duration_ms"] or 0 for item in audio),
+        "unknown_durations": sum(1 for item in audio if item["duration_ms"] is None),
+    }
+    return status
+
+
+def format_age(seconds: float) -> str:
+    """Compact age such as 45s, 12m, 3h or 5d."""
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
+
+
+def format_duration(ms: int) -> str:
+    """Duration as m:ss, or h:mm:ss from an hour up."""
+    seconds = int(ms // 1000)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
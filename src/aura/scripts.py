@@ -0,0 +1,55 @@
+"""Access to a project's .aura/scripts modules from the aura CLI.
+
+The transcription scripts are standalone files copied into each project by
+`aura init`, and their dependencies (openai, pydub) live in .aura/.venv.
+Long-running commands such as `aura worker` import them in-process instead
+of spawning one interpreter per file.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+SCRIPT_DEPENDENCIES = ["openai", "pydub", "httpx"]
+
+
+def find_aura_dir(start: Path | None = None) -> Path | None:
+    """Find the nearest .aura directory walking up from `start` (default: cwd)."""
+    start = (start or Path.cwd()).resolve()
+    for parent in [start] + list(start.parents):
+        aura_dir = parent / ".aura"
+        if aura_dir.is_dir():
+            return aura_dir
+    return None
+
+
+def load_env(aura_dir: Path) -> None:
+    """Load .aura/.env into the environment if python-dotenv can find it."""
+    env_file = aura_dir / ".env"
+    if env_file.exists():
+        from dotenv import load_dotenv
+        load_dotenv(env_file)
+
+
+def missing_dependencies() -> list[str]:
+    """Script dependencies that can't be imported from this interpreter.
+
+    The fake transcription backend needs none of them.
+    """
+    if os.environ.get("AURA_TRANSCRIPTION_BACKEND") == "fake":
+        return []
+    return [name for name in SCRIPT_DEPENDENCIES if importlib.util.find_spec(name) is None]
+
+
+def import_script(name: str, aura_dir: Path):
+    """Import .aura/scripts/<name>.py as a module.
+
+    The scripts directory stays on sys.path because the scripts import their
+    siblings lazily (e.g. transcribe imports transcript_cache on first use).
+    """
+    scripts_dir = str(aura_dir / "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    return importlib.import_module(name)
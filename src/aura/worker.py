@@ -0,0 +1,432 @@
+"""Background transcription worker for the visions queue (`aura worker`).
+
+Audio dropped into .aura/visions/queue/ (a bare audio file, or a directory
+holding audio.* without a transcript.txt) is transcribed and titled, then
+renamed into queue/<title>/ with audio + transcript.txt, the same layout
+record_memo.py produces, ready for /aura.process_visions. Items that fail
+go to visions/failed/ and are retried later with exponential backoff.
+
+Every transition is an atomic rename on the same filesystem:
+
+    queue/<item>  ->  visions/.worker/<name>/  ->  queue/<title>/
+                                               ->  failed/<name>/  ->  .worker/ (retry)
+
+A claimed item lives in visions/.worker/ while it is processed. If the
+worker dies, the next start picks those up again; per-chunk checkpoints and
+the transcript cache mean finished chunks are never re-sent.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+from aura.scripts import import_script
+
+AUDIO_EXTENSIONS = {".flac", ".mp3", ".mp4", ".mpeg", ".mpga", ".m4a", ".ogg", ".wav", ".webm"}
+WORK_DIR_NAME = ".worker"
+LOCK_FILE_NAME = ".worker.lock"
+STATE_FILE_NAME = ".worker.json"
+PARTIAL_TRANSCRIPT_NAME = ".transcript.txt"  # Becomes transcript.txt once the item is titled
+
+DEFAULT_JOBS = 2
+DEFAULT_POLL_INTERVAL = 5.0  # Seconds between scans without inotify
+DEFAULT_MAX_ATTEMPTS = 3
+SETTLE_SECONDS = 2.0  # Items modified more recently than this may still be copying
+RETRY_BACKOFF_SECONDS = 60.0  # Doubles with each failed attempt
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+
+class WorkerLockedError(Exception):
+    """Raised when another worker already serves the visions directory."""
+    pass
+
+
+class PollingWatcher:
+    """Wakes up every poll interval (or early when a job finishes)."""
+
+    def __init__(self, poll_interval: float):
+        self.poll_interval = poll_interval
+        self._wake_r, self._wake_w = os.pipe()
+
+    def wake(self) -> None:
+        """Interrupt a pending wait() (safe to call from any thread)."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def _fds(self) -> list[int]:
+        return [self._wake_r]
+
+    def _drain(self, fd: int) -> None:
+        try:
+            while os.read(fd, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def wait(self, timeout: float) -> None:
+        """Block until something may have changed or `timeout` seconds pass."""
+        os.set_blocking(self._wake_r, False)
+        ready, _, _ = select.select(self._fds(), [], [], max(0.0, min(timeout, self.poll_interval)))
+        for fd in ready:
+            self._drain(fd)
+
+    def close(self) -> None:
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+
+class InotifyWatcher(PollingWatcher):
+    """Wakes up as soon as something is created or moved into the directory (Linux)."""
+
+    def __init__(self, directory: Path, poll_interval: float):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+        super().__init__(poll_interval)
+        self._inotify_fd = fd
+
+    def _fds(self) -> list[int]:
+        return [self._wake_r, self._inotify_fd]
+
+    def wait(self, timeout: float) -> None:
+        os.set_blocking(self._wake_r, False)
+        # Events make this return early; the timeout still bounds it for settle/retry checks
+        ready, _, _ = select.select(self._fds(), [], [], max(0.0, timeout))
+        for fd in ready:
+            self._drain(fd)
+
+    def close(self) -> None:
+        os.close(self._inotify_fd)
+        super().close()
+
+
+def make_watcher(directory: Path, poll_interval: float) -> PollingWatcher:
+    """Use inotify where available, polling everywhere else."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory, poll_interval)
+        except (OSError, AttributeError, TypeError):
+            pass
+    return PollingWatcher(poll_interval)
+
+
+def find_audio(item_dir: Path) -> Path | None:
+    """Return the memo's audio file (audio.wav, audio.flac, ...), if any."""
+    for path in sorted(item_dir.glob("audio.*")):
+        if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS:
+            return path
+    return None
+
+
+def needs_transcription(item: Path) -> bool:
+    """True for a bare audio file or an audio directory without transcript.txt."""
+    if item.name.startswith("."):
+        return False
+    if item.is_file():
+        return item.suffix.lower() in AUDIO_EXTENSIONS
+    if item.is_dir():
+        return find_audio(item) is not None and not (item / "transcript.txt").exists()
+    return False
+
+
+def last_modified(item: Path) -> float:
+    """Newest mtime of a file, or of a directory and the files directly in it."""
+    newest = item.stat().st_mtime
+    if item.is_dir():
+        for child in item.iterdir():
+            try:
+                newest = max(newest, child.stat().st_mtime)
+            except OSError:
+                continue
+    return newest
+
+
+def read_state(item_dir: Path) -> dict:
+    """Return the worker's retry bookkeeping for an item ({} if none)."""
+    try:
+        return json.loads((item_dir / STATE_FILE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def retry_due_at(state: dict) -> float:
+    """Time at which a failed item may be retried, with exponential backoff."""
+    attempts = state.get("attempts", 0)
+    if attempts == 0:
+        return 0.0
+    return state.get("updated", 0.0) + RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+
+
+def unique_path(parent: Path, name: str) -> Path:
+    """`parent/name`, or `parent/name-2`, `-3`, ... if taken."""
+    candidate = parent / name
+    n = 2
+    while candidate.exists():
+        candidate = parent / f"{name}-{n}"
+        n += 1
+    return candidate
+
+
+class Worker:
+    """Transcribes and titles queued audio through a bounded pool.
+
+    Example:
+        worker = Worker(Path(".aura"), jobs=2)
+        worker.run()             # until Ctrl+C
+        worker.run(once=True)    # drain the current queue and return
+    """
+
+    def __init__(
+        self,
+        aura_dir: Path,
+        jobs: int = DEFAULT_JOBS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_failed: bool = True,
+        log=print,
+    ):
+        self.aura_dir = aura_dir
+        self.visions_dir = aura_dir / "visions"
+        self.queue_dir = self.visions_dir / "queue"
+        self.failed_dir = self.visions_dir / "failed"
+        self.work_dir = self.visions_dir / WORK_DIR_NAME
+        self.jobs = max(1, jobs)
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_failed = retry_failed
+        self.log = log
+
+        self.inflight: dict[Future, Path] = {}
+        self.stats = {"done": 0, "failed": 0}
+        self._rename_lock = threading.Lock()
+        self._lock_file = None
+        self._watcher = None
+
+        self._transcribe = import_script("transcribe", aura_dir)
+        self._titles = import_script("generate_title", aura_dir)
+
+    def acquire_lock(self) -> None:
+        """Ensure a single worker per visions directory.
+
+        Raises:
+            WorkerLockedError: If another worker holds the lock
+        """
+        try:
+            import fcntl
+        except ImportError:
+            return  # No advisory locks on this platform
+
+        self._lock_file = open(self.visions_dir / LOCK_FILE_NAME, "a+")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._lock_file.close()
+            self._lock_file = None
+            raise WorkerLockedError(f"Another aura worker is already running for {self.visions_dir}")
+
+    def scan(self, now: float) -> tuple[list[Path], float | None, float | None]:
+        """Find items that can be claimed now.
+
+        Returns:
+            Tuple of (ready items, seconds until a queued item settles,
+            seconds until a failed item is due for retry); None when there is none
+        """
+        ready = []
+        next_settle = None
+        next_retry = None
+
+        for item in sorted(self.queue_dir.iterdir()):
+            try:
+                if not needs_transcription(item):
+                    continue
+                wait_s = last_modified(item) + SETTLE_SECONDS - now
+            except OSError:
+                continue  # Vanished mid-scan
+            if wait_s <= 0:
+                ready.append(item)
+            else:
+                next_settle = wait_s if next_settle is None else min(next_settle, wait_s)
+
+        if self.retry_failed:
+            for item in sorted(self.failed_dir.iterdir()):
+                if not item.is_dir() or not needs_transcription(item):
+                    continue
+                state = read_state(item)
+                if state.get("attempts", 0) >= self.max_attempts:
+                    continue
+                wait_s = retry_due_at(state) - now
+                if wait_s <= 0:
+                    ready.append(item)
+                else:
+                    next_retry = wait_s if next_retry is None else min(next_retry, wait_s)
+
+        return ready, next_settle, next_retry
+
+    def claim(self, item: Path) -> Path | None:
+        """Atomically move an item into the work directory.
+
+        Returns:
+            The claimed work directory, or None if the item vanished
+        """
+        is_file = item.is_file()
+        target = unique_path(self.work_dir, item.stem if is_file else item.name)
+        try:
+            if is_file:
+                target.mkdir()
+                os.rename(item, target / f"audio{item.suffix.lower()}")
+            else:
+                os.rename(item, target)
+        except FileNotFoundError:
+            if is_file:
+                target.rmdir()
+            return None
+        return target
+
+    def recover(self) -> list[Path]:
+        """Return items a previous worker claimed but never finished."""
+        if not self.work_dir.exists():
+            return []
+        return sorted(item for item in self.work_dir.iterdir() if item.is_dir() and find_audio(item) is not None)
+
+    def title(self, transcript: str) -> str:
+        """Generate a title, falling back to a timestamp like record_memo.py does."""
+        try:
+            return self._titles.generate_title(transcript)
+        except Exception as e:
+            self.log(f"Title generation error: {e}")
+            return f"memo-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+
+    def process(self, work_item: Path) -> tuple[Path, bool]:
+        """Transcribe and title one claimed item, then move it out of the work directory.
+
+        Returns:
+            Tuple of (final directory, success)
+        """
+        audio = find_audio(work_item)
+        partial_path = work_item / PARTIAL_TRANSCRIPT_NAME
+        checkpoint_dir = work_item / f"{audio.name}.chunks"
+
+        try:
+            if partial_path.exists():
+                transcript = partial_path.read_text(encoding="utf-8")  # Finished before a restart
+            else:
+                transcript = self._transcribe.transcribe_file(str(audio), checkpoint_dir=str(checkpoint_dir))
+                partial_path.write_text(transcript, encoding="utf-8")
+        except Exception as e:
+            state = read_state(work_item)
+            state = {"attempts": state.get("attempts", 0) + 1, "last_error": str(e), "updated": time.time()}
+            (work_item / STATE_FILE_NAME).write_text(json.dumps(state, indent=2), encoding="utf-8")
+            with self._rename_lock:
+                target = unique_path(self.failed_dir, work_item.name)
+                os.rename(work_item, target)
+            return target, False
+
+        title = self.title(transcript)
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        (work_item / STATE_FILE_NAME).unlink(missing_ok=True)
+        os.replace(partial_path, work_item / "transcript.txt")
+        with self._rename_lock:
+            taken = self._titles.existing_queue_titles(self.queue_dir)
+            target = self.queue_dir / self._titles.unique_title(title, taken)
+            os.rename(work_item, target)
+        return target, True
+
+    def _submit(self, pool: ThreadPoolExecutor, work_item: Path) -> None:
+        self.log(f"Processing {work_item.name}")
+        future = pool.submit(self.process, work_item)
+        future.add_done_callback(lambda _: self._watcher.wake())
+        self.inflight[future] = work_item
+
+    def _reap(self) -> None:
+        for future in [f for f in self.inflight if f.done()]:
+            work_item = self.inflight.pop(future)
+            try:
+                target, ok = future.result()
+            except Exception as e:
+                self.stats["failed"] += 1
+                self.log(f"Error processing {work_item.name}: {e}")
+                continue
+            if ok:
+                self.stats["done"] += 1
+                self.log(f"Done {work_item.name} -> {target.relative_to(self.visions_dir)}")
+            else:
+                self.stats["failed"] += 1
+                state = read_state(target)
+                self.log(f"Failed {work_item.name} (attempt {state.get('attempts')}/{self.max_attempts}): "
+                         f"{state.get('last_error')}")
+
+    def run(self, once: bool = False) -> dict:
+        """Serve the queue until interrupted (or, with `once`, until it is empty).
+
+        Returns:
+            Dict with 'done' and 'failed' counts
+        """
+        for directory in (self.queue_dir, self.failed_dir, self.work_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        self.acquire_lock()
+
+        self._watcher = make_watcher(self.queue_dir, self.poll_interval)
+        pool = ThreadPoolExecutor(max_workers=self.jobs)
+        backlog = self.recover()
+        if backlog:
+            self.log(f"Resuming {len(backlog)} item(s) claimed by a previous worker")
+
+        try:
+            while True:
+                self._reap()
+                ready, next_settle, next_retry = self.scan(time.time())
+                while len(self.inflight) < self.jobs and (backlog or ready):
+                    work_item = backlog.pop(0) if backlog else self.claim(ready.pop(0))
+                    if work_item is not None:
+                        self._submit(pool, work_item)
+
+                # --once doesn't wait out retry backoff, only files still being copied in
+                if once and not self.inflight and not backlog and not ready and next_settle is None:
+                    return self.stats
+
+                timeout = min(t for t in (self.poll_interval, next_settle, next_retry) if t is not None)
+                if once and self.inflight:
+                    wait(list(self.inflight), timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    self._watcher.wait(timeout)
+        except KeyboardInterrupt:
+            if self.inflight:
+                self.log(f"Finishing {len(self.inflight)} in-flight item(s)... (Ctrl+C again to abort)")
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            self._reap()
+            self._watcher.close()
+            if self._lock_file is not None:
+                self._lock_file.close()
+
+
+_log_lock = threading.Lock()
+
+
+def log_line(message: str) -> None:
+    """Default worker log format: timestamped lines on stdout (thread-safe)."""
+    with _log_lock:
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", flush=True)
@@ -0,0 +1,26 @@
+"""Shared test setup.
+
+The transcription scripts are standalone files that import their siblings
+by module name, so .aura/scripts goes on sys.path like it is when a script
+runs; benchmarks/ provides the stub OpenAI server, and src/ the aura package.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = ROOT / ".aura" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+sys.path.insert(0, str(ROOT / "src"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run every test in an empty directory, so caches and metrics land there."""
+    monkeypatch.chdir(tmp_path)
+    for name in ("AURA_TRANSCRIPTION_BACKEND", "AURA_FAKE_LATENCY", "AURA_FAKE_FAIL_RATE", "AURA_TRIM_SILENCE"):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path
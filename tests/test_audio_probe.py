@@ -0,0 +1,173 @@
+"""Header-only duration parsers, on small synthetic files of each container."""
+
+import random
+import struct
+
+import pytest
+
+import audio_probe
+from audio_probe import probe_duration_ms, read_duration_ms
+
+
+def write(tmp_path, name: str, data: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def chunk(chunk_id: bytes, payload: bytes) -> bytes:
+    return chunk_id + struct.pack("<I", len(payload)) + payload + b"\0" * (len(payload) & 1)
+
+
+def wav(data_size: int | None = None, pcm_bytes: int = 32_000, extra: bytes = b"", rate: int = 16_000) -> bytes:
+    """Mono 16-bit PCM WAV; `data_size` overrides the data chunk's recorded size."""
+    fmt = struct.pack("<HHIIHH", 1, 1, rate, rate * 2, 2, 16)
+    data = b"data" + struct.pack("<I", pcm_bytes if data_size is None else data_size) + b"\0" * pcm_bytes
+    body = b"WAVE" + chunk(b"fmt ", fmt) + extra + data
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def test_wav(tmp_path):
+    assert read_duration_ms(write(tmp_path, "a.wav", wav())) == 1000
+
+
+@pytest.mark.parametrize("data_size", [0, 0xFFFFFFFF])
+def test_wav_with_unfinished_data_size_uses_file_size(tmp_path, data_size):
+    # What a recorder that was cut off (or writes to a pipe) leaves behind
+    assert read_duration_ms(write(tmp_path, "a.wav", wav(data_size))) == 1000
+
+
+def test_wav_skips_odd_sized_chunks(tmp_path):
+    extra = chunk(b"LIST", b"INFOISFT\x05\0\0\0aura\0")  # 17 bytes, padded to 18
+    assert read_duration_ms(write(tmp_path, "a.wav", wav(extra=extra))) == 1000
+
+
+def test_compressed_wav_uses_fact_samples(tmp_path):
+    extra = chunk(b"fact", struct.pack("<I", 40_000))  # 2.5 s at 16 kHz, whatever the data size
+    assert read_duration_ms(write(tmp_path, "a.wav", wav(extra=extra))) == 2500
+
+
+def flac(sample_rate: int, total_samples: int) -> bytes:
+    packed = (sample_rate << 44) | (0 << 41) | (15 << 36) | total_samples  # Mono, 16-bit
+    streaminfo = struct.pack(">HH", 4096, 4096) + b"\0" * 6 + packed.to_bytes(8, "big") + b"\0" * 16
+    return b"fLaC" + bytes([0x80]) + len(streaminfo).to_bytes(3, "big") + streaminfo
+
+
+def test_flac(tmp_path):
+    assert read_duration_ms(write(tmp_path, "a.flac", flac(44_100, 88_200))) == 2000
+
+
+def test_flac_without_total_samples_is_unknown(tmp_path):
+    assert read_duration_ms(write(tmp_path, "a.flac", flac(44_100, 0))) is None
+
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, joint stereo: 417-byte frames of 1152 samples
+MP3_HEADER = bytes([0xFF, 0xFB, 0x90, 0x44])
+MP3_FRAME = MP3_HEADER + b"\0" * 413
+
+
+def id3v2(payload_size: int) -> bytes:
+    syncsafe = bytes((payload_size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + syncsafe + b"\0" * payload_size
+
+
+def test_cbr_mp3_from_bitrate_and_size(tmp_path):
+    audio = MP3_FRAME * 100
+
+    expected = len(audio) * 8 * 1000 // 128_000
+    assert read_duration_ms(write(tmp_path, "a.mp3", audio)) == expected
+    # Tags on either side are not audio
+    tagged = id3v2(1000) + audio + b"TAG" + b"\0" * 125
+    assert read_duration_ms(write(tmp_path, "b.mp3", tagged)) == expected
+
+
+@pytest.mark.parametrize("tag", [b"Xing", b"Info"])
+def test_mp3_frame_count_header(tmp_path, tag):
+    # Side info is 32 bytes for MPEG-1 stereo, so the tag sits at offset 36
+    frames = 500
+    first = MP3_HEADER + b"\0" * 32 + tag + struct.pack(">II", 1, frames)
+    audio = first + b"\0" * (417 - len(first)) + MP3_FRAME * 3  # The file itself is much shorter
+
+    assert read_duration_ms(write(tmp_path, "a.mp3", audio)) == frames * 1152 * 1000 // 44_100
+
+
+def atom(atom_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", 8 + len(payload)) + atom_type + payload
+
+
+def mvhd(timescale: int, duration: int, version: int = 0) -> bytes:
+    if version == 1:
+        body = b"\x01\0\0\0" + b"\0" * 16 + struct.pack(">IQ", timescale, duration)
+    else:
+        body = b"\0\0\0\0" + b"\0" * 8 + struct.pack(">II", timescale, duration)
+    return atom(b"mvhd", body + b"\0" * 80)
+
+
+FTYP = atom(b"ftyp", b"M4A \0\0\0\0isomM4A ")
+
+
+@pytest.mark.parametrize("moov_last", [False, True])
+def test_m4a_moov_before_or_after_mdat(tmp_path, moov_last):
+    moov = atom(b"moov", atom(b"udta", b"\0" * 20) + mvhd(44_100, 44_100 * 7))
+    mdat = atom(b"mdat", b"\0" * 5000)
+    data = FTYP + (mdat + moov if moov_last else moov + mdat)
+
+    assert read_duration_ms(write(tmp_path, "a.m4a", data)) == 7000
+
+
+def test_m4a_64_bit_sizes(tmp_path):
+    mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + 3000) + b"\0" * 3000
+    data = FTYP + mdat + atom(b"moov", mvhd(1000, 90 * 60 * 1000, version=1))
+
+    assert read_duration_ms(write(tmp_path, "a.m4a", data)) == 90 * 60 * 1000
+
+
+def test_fragmented_m4a_without_duration_is_unknown(tmp_path):
+    data = FTYP + atom(b"moov", mvhd(1000, 0)) + atom(b"moof", b"\0" * 16)
+
+    assert read_duration_ms(write(tmp_path, "a.m4a", data)) is None
+
+
+def ogg_page(granule: int, packet: bytes, sequence: int) -> bytes:
+    header = b"OggS\0\0" + struct.pack("<qIIIB", granule, 1, sequence, 0, 1)
+    return header + bytes([len(packet)]) + packet
+
+
+def test_opus_subtracts_pre_skip(tmp_path):
+    head = b"OpusHead" + bytes([1, 1]) + struct.pack("<HIHB", 312, 16_000, 0, 0)
+    data = ogg_page(0, head, 0) + ogg_page(0, b"OpusTags", 1) + ogg_page(48_000 * 3 + 312, b"\0" * 100, 2)
+
+    assert read_duration_ms(write(tmp_path, "a.ogg", data)) == 3000
+
+
+def test_vorbis(tmp_path):
+    head = b"\x01vorbis" + struct.pack("<IBIiii", 0, 1, 22_050, 0, 64_000, 0) + b"\xb8\x01"
+    data = ogg_page(0, head, 0) + ogg_page(22_050 * 4, b"\0" * 100, 1)
+
+    assert read_duration_ms(write(tmp_path, "a.ogg", data)) == 4000
+
+
+@pytest.mark.parametrize("name, data", [
+    ("empty.wav", b""),
+    ("header-only.wav", wav()[:30]),
+    ("truncated.flac", flac(44_100, 88_200)[:20]),
+    ("truncated.mp3", id3v2(1000)[:40]),
+    ("truncated.m4a", FTYP + struct.pack(">I4s", 5000, b"moov") + mvhd(1000, 5000)[:12]),
+    ("truncated.ogg", b"OggS\0\0\0"),
+    ("garbage.mp3", bytes(random.Random(3).randrange(256) for _ in range(4096))),
+])
+def test_damaged_files_fall_back_to_ffprobe(tmp_path, monkeypatch, name, data):
+    path = write(tmp_path, name, data)
+    fallback = []
+    monkeypatch.setattr(audio_probe, "ffprobe_duration_ms", lambda p: fallback.append(p) or None)
+
+    assert read_duration_ms(path) is None
+    assert probe_duration_ms(path) is None
+    assert fallback == [path]
+
+
+def test_probe_prefers_headers(tmp_path, monkeypatch):
+    path = write(tmp_path, "a.wav", wav())
+    monkeypatch.setattr(audio_probe, "ffprobe_duration_ms", lambda p: pytest.fail("ffprobe should not run"))
+
+    assert probe_duration_ms(path) == 1000
@@ -0,0 +1,54 @@
+"""The wheel's template bundle leaves out secrets and checkout-local state."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+import aura.init
+from aura.bundle import BundleError, TemplateBundle, build_bundle, bundle_sources
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def checkout(tmp_path, monkeypatch):
+    """A copy of this checkout's templates, plus the local files a developer's checkout has."""
+    root = tmp_path / "aura"
+    shutil.copytree(ROOT / ".aura", root / ".aura",
+                    ignore=shutil.ignore_patterns("__pycache__", ".env", ".venv"))
+    aura_dir = root / ".aura"
+    (aura_dir / ".env").write_text("OPENAI_API_KEY=sk-secret\n")
+    (aura_dir / ".venv" / "bin").mkdir(parents=True)
+    (aura_dir / ".venv" / "bin" / "python").write_text("")
+    (aura_dir / "scripts" / "__pycache__").mkdir(exist_ok=True)
+    (aura_dir / "scripts" / "__pycache__" / "transcribe.cpython-311.pyc").write_bytes(b"\0")
+    (aura_dir / "cache").mkdir()
+    (aura_dir / "cache" / "ab12.json").write_text("{}")
+    (aura_dir / ".check-cache").write_text("{}")
+    monkeypatch.setattr(aura.init, "get_aura_root", lambda: root)
+    return root
+
+
+def test_bundle_leaves_out_secrets_and_local_state(checkout, tmp_path):
+    installed = {dst.as_posix() for _, dst in aura.init.get_template_files()}
+    assert ".aura/.env" in installed  # What `aura init` copies from a checkout (copy_env)
+
+    index = build_bundle(bundle_sources(), tmp_path / "templates.zip")
+
+    names = set(TemplateBundle(tmp_path / "templates.zip").entries)
+    assert names == set(index)
+    assert ".aura/.env.example" in names and ".aura/scripts/transcribe.py" in names
+    assert not any(Path(name).name == ".env" or ".venv" in name or "__pycache__" in name
+                   or name.startswith(".aura/cache/") or name == ".aura/.check-cache"
+                   for name in names), sorted(names)
+    assert b"sk-secret" not in (tmp_path / "templates.zip").read_bytes()
+
+
+def test_build_bundle_refuses_env_files(checkout, tmp_path):
+    files = [(checkout / ".aura" / ".env", Path(".aura/.env"))]
+
+    with pytest.raises(BundleError, match=r"\.aura/\.env"):
+        build_bundle(files, tmp_path / "templates.zip")
+
+    assert not (tmp_path / "templates.zip").exists()
@@ -0,0 +1,88 @@
+"""The cache size bound, as the scripts apply it and as `aura cache` reports it."""
+
+import os
+
+import pytest
+
+import transcript_cache
+from aura import cache
+
+KB = 1024
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    (tmp_path / ".aura").mkdir()
+    monkeypatch.setenv("AURA_CACHE_MAX_MB", str(20 * KB / (1024 * 1024)))  # 20 KB
+    return tmp_path / ".aura" / "cache"
+
+
+def put(key: str, section: str, size: int = 4 * KB, age: int = 0) -> None:
+    """Store an entry of about `size` bytes, `age` seconds old."""
+    cache_dir = transcript_cache.get_cache_dir(section)
+    transcript_cache.put(key * 64, "x" * size, "model", cache_dir=cache_dir)
+    if age:
+        entry = cache_dir / key[:2] / f"{key * 64}.json"
+        mtime = entry.stat().st_mtime - age
+        os.utime(entry, (mtime, mtime))
+
+
+def test_bound_covers_all_sections(cache_root):
+    for i in range(4):
+        put(f"a{i}", "transcripts")
+        put(f"b{i}", "titles")
+
+    stats = cache.cache_stats(cache_root)
+
+    assert stats["bytes"] <= stats["max_bytes"] == transcript_cache.get_max_bytes()
+    assert set(stats["sections"]) == {"transcripts", "titles"}
+
+
+def test_oldest_entry_goes_first_whatever_its_section(cache_root):
+    put("c0", "titles", age=100)
+    for i in range(3):
+        put(f"d{i}", "transcripts", age=10)
+
+    put("d9", "transcripts")
+
+    names = {path.name[:2] for _, _, path in transcript_cache.list_entries(cache_root)}
+    assert "c0" not in names and {"d0", "d9"} <= names
+
+
+def test_put_skips_the_scan_while_under_the_bound(cache_root, monkeypatch):
+    put("e0", "transcripts")  # No usage file yet: scans once
+    scans = []
+    list_entries = transcript_cache.list_entries
+    monkeypatch.setattr(transcript_cache, "list_entries", lambda root=None: scans.append(root) or list_entries(root))
+
+    put("e1", "transcripts")
+    put("e2", "titles")
+    assert scans == []
+
+    for i in range(3, 6):
+        put(f"e{i}", "transcripts")
+    assert scans  # The running total reached the bound
+    assert sum(size for _, size, _ in list_entries(cache_root)) <= transcript_cache.get_max_bytes()
+
+
+def test_prune_updates_the_running_total(cache_root):
+    for i in range(4):
+        put(f"f{i}", "transcripts")
+
+    cache.prune_cache(0, cache_root)
+
+    assert (cache_root / cache.USAGE_FILE).read_text() == "0"
+
+
+def test_cli_and_scripts_agree(cache_root, monkeypatch):
+    for i in range(3):
+        put(f"g{i}", "transcripts", age=10 * i)
+        put(f"h{i}", "titles", age=10 * i + 5)
+
+    assert cache.DEFAULT_MAX_MB == transcript_cache.DEFAULT_MAX_MB
+    assert cache.USAGE_FILE == transcript_cache.USAGE_FILE
+    assert cache.list_entries(cache_root) == transcript_cache.list_entries(cache_root)
+    monkeypatch.setenv("AURA_CACHE_MAX_MB", "3.5")
+    assert cache.get_max_bytes() == transcript_cache.get_max_bytes()
+    monkeypatch.delenv("AURA_CACHE_MAX_MB")
+    assert cache.get_max_bytes() == transcript_cache.get_max_bytes()
@@ -0,0 +1,76 @@
+"""Resumable chunk checkpoints only resume the recording they were made for."""
+
+import json
+
+from checkpoint import ChunkCheckpoint, checkpoint_dir_for
+from transcript_cache import hash_file
+
+MODEL = "gpt-4o-mini-transcribe"
+
+
+def open_checkpoint(audio) -> ChunkCheckpoint:
+    return ChunkCheckpoint(checkpoint_dir_for(audio), audio.stat().st_size, hash_file(str(audio)), MODEL)
+
+
+def interrupted_run(audio) -> None:
+    """A first run that finished one of three chunks."""
+    checkpoint = open_checkpoint(audio)
+    checkpoint.start([300_000, 600_000], 900_000)
+    checkpoint.mark_done(0, 1234, "first chunk")
+    checkpoint.mark_failed(1, 1234, "timeout")
+
+
+def test_same_recording_resumes(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"take one" * 1000)
+    interrupted_run(audio)
+
+    checkpoint = open_checkpoint(audio)
+
+    assert checkpoint.cut_points_ms == [300_000, 600_000]
+    assert checkpoint.transcript(0) == "first chunk"
+    assert checkpoint.summary() == (1, 3)
+
+
+def test_re_recording_of_the_same_size_starts_over(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"take one" * 1000)
+    interrupted_run(audio)
+    audio.write_bytes(b"take two" * 1000)  # Same path, same length, different audio
+
+    checkpoint = open_checkpoint(audio)
+
+    assert checkpoint.cut_points_ms is None
+    checkpoint.start([450_000], 900_000)
+    assert checkpoint.transcript(0) is None  # Old chunk files were discarded
+
+
+def test_manifest_without_hash_starts_over(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"take one" * 1000)
+    interrupted_run(audio)
+    manifest_path = checkpoint_dir_for(audio) / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    del manifest["source_sha256"]  # Written before checkpoints recorded the hash
+    manifest_path.write_text(json.dumps(manifest))
+
+    assert open_checkpoint(audio).cut_points_ms is None
+
+
+def test_retry_reports_finished_chunks_only(tmp_path, monkeypatch, capsys):
+    import record_memo
+    import transcribe
+
+    memo = tmp_path / "visions" / "failed" / "memo"
+    memo.mkdir(parents=True)
+    audio = memo / "audio.wav"
+    audio.write_bytes(b"take one" * 1000)
+    checkpoint = transcribe.open_checkpoint(str(audio), memo / "audio.wav.chunks")
+    checkpoint.start([300_000, 600_000], 900_000)
+    checkpoint.mark_done(0, 1234, "first chunk")
+    checkpoint.mark_failed(1, 1234, "timeout")
+    monkeypatch.setattr(record_memo, "transcribe_audio", lambda *args: None)
+
+    assert record_memo.retry_failed_memo(memo, tmp_path / "visions") == (memo, False)
+
+    assert "1/3 chunks transcribed" in capsys.readouterr().err
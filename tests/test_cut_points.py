@@ -0,0 +1,151 @@
+"""Silence-aligned chunk boundaries on synthetic tone/silence audio."""
+
+import math
+import shutil
+import wave
+from array import array
+
+import pytest
+
+import audio_energy
+import transcribe
+from audio_energy import DEFAULT_FRAME_MS, find_quiet_boundaries, rms_envelope
+
+RATE = audio_energy.ANALYSIS_SAMPLE_RATE
+FRAME_LEN = RATE * DEFAULT_FRAME_MS // 1000
+CHUNK_MS = 20_000
+TOLERANCE_MS = 3_000
+
+
+def tone_with_gaps(duration_ms: int, gaps: list[tuple[int, int]], rate: int = RATE) -> array:
+    """A steady 400 Hz tone, with faint hiss instead of the tone inside each gap (ms)."""
+    period = array("h", (int(8000 * math.sin(2 * math.pi * 400 * k / rate)) for k in range(rate // 400)))
+    count = duration_ms * rate // 1000
+    samples = (period * (count // len(period) + 1))[:count]
+    hiss = array("h", [20, -20])
+    for start, end in gaps:
+        lo, hi = start * rate // 1000, end * rate // 1000
+        samples[lo:hi] = (hiss * ((hi - lo) // 2 + 1))[:hi - lo]
+    return samples
+
+
+def chunk_lengths(cuts: list[int], duration_ms: int) -> list[int]:
+    bounds = [0] + cuts + [duration_ms]
+    return [b - a for a, b in zip(bounds, bounds[1:])]
+
+
+def inside(cut: int, gaps: list[tuple[int, int]]) -> bool:
+    return any(start <= cut < end for start, end in gaps)
+
+
+def test_cuts_land_in_silent_gaps():
+    duration_ms = 100_000
+    # One 600 ms pause within reach of each cut (a chunk length after the previous one)
+    gaps = [(17_600, 18_200), (40_000, 40_600), (61_000, 61_600), (82_400, 83_000)]
+    envelope = rms_envelope(tone_with_gaps(duration_ms, gaps).tobytes(), FRAME_LEN)
+
+    cuts = find_quiet_boundaries(envelope, duration_ms, CHUNK_MS, tolerance_ms=TOLERANCE_MS)
+
+    assert len(cuts) == len(gaps)
+    assert all(inside(cut, gaps) for cut in cuts), cuts
+    assert max(chunk_lengths(cuts, duration_ms)) <= CHUNK_MS + TOLERANCE_MS
+
+
+def test_cut_follows_previous_cut_not_fixed_grid():
+    duration_ms = 60_000
+    gaps = [(17_200, 17_800), (37_000, 37_600)]  # Second gap is 20 s after the first, 3 s off the grid
+    envelope = rms_envelope(tone_with_gaps(duration_ms, gaps).tobytes(), FRAME_LEN)
+
+    cuts = find_quiet_boundaries(envelope, duration_ms, CHUNK_MS, tolerance_ms=TOLERANCE_MS)
+
+    assert all(inside(cut, gaps) for cut in cuts), cuts
+
+
+def test_size_bound_wins_over_silence():
+    duration_ms = 100_000
+    # The only pauses are beyond the size limit, so cuts must go through the tone
+    gaps = [(22_500, 23_000), (45_500, 46_000), (68_500, 69_000), (91_500, 92_000)]
+    envelope = rms_envelope(tone_with_gaps(duration_ms, gaps).tobytes(), FRAME_LEN)
+    max_chunk_ms = 19_000
+
+    cuts = find_quiet_boundaries(envelope, duration_ms, CHUNK_MS, tolerance_ms=TOLERANCE_MS,
+                                 max_chunk_ms=max_chunk_ms)
+
+    assert max(chunk_lengths(cuts, duration_ms)) <= max_chunk_ms
+    assert cuts == sorted(set(cuts)) and 0 < cuts[0] and cuts[-1] < duration_ms
+
+
+def test_no_quiet_window_keeps_the_fixed_grid():
+    duration_ms = 100_000
+    envelope = rms_envelope(tone_with_gaps(duration_ms, []).tobytes(), FRAME_LEN)
+
+    cuts = find_quiet_boundaries(envelope, duration_ms, CHUNK_MS, tolerance_ms=TOLERANCE_MS)
+
+    assert cuts == [20_000, 40_000, 60_000, 80_000]
+
+
+def test_short_envelope_falls_back_to_targets():
+    # Probed duration longer than the decoded audio: windows past the end are empty
+    envelope = rms_envelope(tone_with_gaps(30_000, []).tobytes(), FRAME_LEN)
+
+    cuts = find_quiet_boundaries(envelope, 100_000, CHUNK_MS, tolerance_ms=TOLERANCE_MS)
+
+    assert max(chunk_lengths(cuts, 100_000)) <= CHUNK_MS + TOLERANCE_MS
+    assert cuts[-2:] == [60_000, 80_000]
+
+
+def test_array_fallback_matches_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    pcm = tone_with_gaps(5_000, [(1_000, 2_500)]).tobytes() + b"\x10\x00" * 37  # Partial last frame
+    expected = rms_envelope(pcm, FRAME_LEN)
+    monkeypatch.setattr(audio_energy, "np", None)
+
+    assert rms_envelope(pcm, FRAME_LEN) == pytest.approx(expected)
+
+
+def write_wav(path, samples: array, rate: int) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="needs ffmpeg")
+def test_find_cut_points_respects_upload_size(tmp_path, monkeypatch):
+    rate = 16000  # 32 bytes per ms of WAV
+    duration_ms = 100_000
+    gaps = [(22_500, 23_000), (45_500, 46_000), (68_500, 69_000), (91_500, 92_000)]
+    path = tmp_path / "memo.wav"
+    write_wav(path, tone_with_gaps(duration_ms, gaps, rate), rate)
+    # Shrink the limit so a 20 s chunk (640 KB) would be too big
+    monkeypatch.setattr(transcribe, "MAX_FILE_SIZE_MB", 0.5)
+    limit_bytes = 0.5 * 1024 * 1024 * transcribe.CHUNK_SIZE_HEADROOM
+    bytes_per_ms = path.stat().st_size / duration_ms
+
+    cuts = transcribe.AudioHandle(str(path)).find_cut_points(CHUNK_MS)
+
+    assert max(chunk_lengths(cuts, duration_ms)) * bytes_per_ms <= limit_bytes
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="needs ffmpeg")
+def test_find_cut_points_on_a_file(tmp_path):
+    rate = 16000
+    duration_ms = 600_000
+    gaps = [(296_000, 296_800)]  # Default 5 min chunks: one cut, moved into the pause
+    path = tmp_path / "memo.wav"
+    write_wav(path, tone_with_gaps(duration_ms, gaps, rate), rate)
+
+    cuts = transcribe.AudioHandle(str(path)).find_cut_points()
+
+    assert len(cuts) == 1 and inside(cuts[0], gaps)
+
+
+def test_plan_cut_points_falls_back_when_detection_fails(tmp_path, monkeypatch):
+    def broken(self, chunk_duration_ms=transcribe.CHUNK_DURATION_MS):
+        raise RuntimeError("ffmpeg failed to decode audio")
+
+    monkeypatch.setattr(transcribe.AudioHandle, "find_cut_points", broken)
+    audio = transcribe.AudioHandle(str(tmp_path / "memo.wav"), duration_ms=17 * 60 * 1000)
+
+    assert audio.plan_cut_points() == [5 * 60 * 1000, 10 * 60 * 1000, 15 * 60 * 1000]
@@ -0,0 +1,127 @@
+"""The rate-limit scheduler against the stub OpenAI server (429s and latency, no network)."""
+
+import math
+import struct
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("openai")
+
+import openai_client  # noqa: E402
+import rate_limit  # noqa: E402
+import transcribe  # noqa: E402
+from stub_openai_server import make_server  # noqa: E402
+
+
+def write_clip(path, index: int = 0) -> str:
+    """A 0.1 s tone, different per index so uploads differ."""
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(b"".join(struct.pack("<h", int(3000 * math.sin(2 * math.pi * (200 + index) * i / 16000)))
+                               for i in range(1600)))
+    return str(path)
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """Start a stub server and point the shared OpenAI client at it; returns a configurer."""
+    servers = []
+
+    def start(**settings):
+        server, state = make_server(**settings)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+        openai_client.close_client()
+        return state
+
+    monkeypatch.setenv("OPENAI_API_KEY", "stub")
+    monkeypatch.setattr(rate_limit, "_scheduler", None)  # Tests configure() their own; don't leak it
+    # Keep backoff short; Retry-After still sets the floor
+    monkeypatch.setattr(rate_limit, "BASE_DELAY_S", 0.02)
+    monkeypatch.setattr(rate_limit, "MAX_DELAY_S", 0.2)
+    yield start
+    openai_client.close_client()
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def transcribe_many(clips: list[str], threads: int) -> list[str]:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(lambda clip: transcribe.transcribe_audio(clip, use_cache=False), clips))
+
+
+def test_concurrency_backs_off_on_429_then_recovers(tmp_path, stub):
+    state = stub(capacity=2, latency=0.2)
+    scheduler = rate_limit.configure(max_concurrency=8, max_retries=10)
+    clips = [write_clip(tmp_path / f"clip{i}.wav", i) for i in range(24)]
+
+    texts = transcribe_many(clips, threads=8)
+
+    assert all(text.startswith("stub transcript") for text in texts)
+    assert state.throttled > 0
+    assert scheduler.stats["throttled"] == state.throttled
+    assert scheduler.stats["min_limit"] <= 4  # Halved at least once from 8
+
+    # Quota lifted: successes grow the limit back to the maximum
+    state.capacity = 100
+    state.latency = 0.02
+    texts = transcribe_many(clips + clips, threads=8)
+
+    assert len(texts) == 48
+    assert scheduler.state()["limit"] == 8
+    assert scheduler.stats["failed"] == 0
+
+
+def test_retry_after_is_honored_by_every_caller(tmp_path, stub):
+    state = stub(capacity=100, latency=0, retry_after=0.5, throttle_first=1)
+    scheduler = rate_limit.configure(max_concurrency=8, max_retries=3)
+    first, second = write_clip(tmp_path / "a.wav", 1), write_clip(tmp_path / "b.wav", 2)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        retried = pool.submit(transcribe.transcribe_audio, first, use_cache=False)
+        while state.received < 1:  # Wait for the 429
+            time.sleep(0.005)
+        time.sleep(0.05)  # Let the scheduler record the pause
+        other = pool.submit(transcribe.transcribe_audio, second, use_cache=False)
+        retried.result()
+        other.result()
+
+    throttled_at = state.arrivals[0]
+    assert state.received == 3
+    assert scheduler.stats["throttled"] == 1 and scheduler.stats["retries"] == 1
+    # Neither the retry nor the unrelated request went out before Retry-After elapsed
+    assert min(state.arrivals[1:]) - throttled_at >= 0.5 - 0.02
+
+
+def test_throttled_chunks_are_not_retried_again_per_chunk(tmp_path, stub):
+    state = stub(capacity=100, latency=0, fail_rate=1.0)
+    rate_limit.configure(max_concurrency=4, max_retries=2)
+    chunks = [write_clip(tmp_path / f"chunk{i}.wav", i) for i in range(3)]
+
+    with pytest.raises(Exception) as raised:
+        transcribe.transcribe_chunks(chunks, str(tmp_path / "original.wav"), jobs=1, use_cache=False)
+
+    assert rate_limit.classify_error(raised.value) == "throttled"
+    # Each chunk: one attempt plus the scheduler's two retries, and nothing more
+    assert state.received == 3 * (1 + 2)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("abc", rate_limit.DEFAULT_MAX_RETRIES),
+    ("-1", rate_limit.DEFAULT_MAX_RETRIES),
+    ("0", 0),  # No retries
+    ("7", 7),
+])
+def test_max_retries_setting_falls_back_when_invalid(monkeypatch, value, expected):
+    monkeypatch.setattr(rate_limit, "_scheduler", None)
+    monkeypatch.setenv("AURA_API_MAX_RETRIES", value)
+
+    assert rate_limit.get_scheduler().max_retries == expected
@@ -0,0 +1,21 @@
+"""Modules shared by .aura/scripts and the standalone whisper example stay identical."""
+
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+EXAMPLE_DIR = ROOT / "examples" / "whisper" / "scripts"
+
+# Copied byte for byte into the example, which can't import from .aura/scripts
+SHARED_SCRIPTS = ["audio_probe.py", "throughput.py"]
+
+
+@pytest.mark.parametrize("name", SHARED_SCRIPTS)
+def test_example_copy_matches(name):
+    original = ROOT / ".aura" / "scripts" / name
+    copy = EXAMPLE_DIR / name
+    assert copy.read_bytes() == original.read_bytes(), (
+        f"{copy.relative_to(ROOT)} differs from {original.relative_to(ROOT)}; "
+        f"edit the .aura/scripts copy and copy it over"
+    )
@@ -0,0 +1,152 @@
+"""Streaming capture, fed by the replay harness instead of a microphone."""
+
+import math
+import random
+import re
+import threading
+import time
+import wave
+from array import array
+
+import pytest
+
+import stream_capture
+from stream_capture import MAX_SEGMENT_MS, SAMPLE_RATE, StreamingTranscriber, WavSink, replay_pcm, stream_record
+
+
+def voice(duration_ms: int, pauses: list[tuple[int, int]]) -> array:
+    """A 160 Hz voice with a 5 Hz syllable swell, with faint hiss inside each pause (ms)."""
+    cycle = array("h", (
+        int(3000 * (0.7 + 0.3 * math.sin(2 * math.pi * 5 * k / SAMPLE_RATE))
+            * sum(math.sin(2 * math.pi * 160 * h * k / SAMPLE_RATE) / h for h in (1, 2, 3)))
+        for k in range(SAMPLE_RATE // 5)
+    ))
+    count = duration_ms * SAMPLE_RATE // 1000
+    samples = (cycle * (count // len(cycle) + 1))[:count]
+    hiss = array("h", [20, -20])
+    for start, end in pauses:
+        lo, hi = start * SAMPLE_RATE // 1000, end * SAMPLE_RATE // 1000
+        samples[lo:hi] = (hiss * ((hi - lo) // 2 + 1))[:hi - lo]
+    return samples
+
+
+def write_wav(path, samples: array) -> str:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes(samples.tobytes())
+    return str(path)
+
+
+def read_frames(path) -> bytes:
+    with wave.open(str(path), "rb") as w:
+        return w.readframes(w.getnframes())
+
+
+class SegmentRecorder:
+    """Stand-in for transcribe_audio: records each segment's length, finishes out of order."""
+
+    def __init__(self, fail_index: int | None = None):
+        self.lengths_ms = {}
+        self.fail_index = fail_index
+        self.lock = threading.Lock()
+
+    def __call__(self, path: str) -> str:
+        index = int(path[-7:-4])  # segmentNNN.wav
+        with wave.open(path, "rb") as w:
+            length_ms = w.getnframes() * 1000 // w.getframerate()
+        time.sleep(random.uniform(0, 0.05))
+        with self.lock:
+            self.lengths_ms[index] = length_ms
+        if index == self.fail_index:
+            raise RuntimeError("segment failed")
+        return f"<{index}>"
+
+    def cuts_ms(self) -> list[int]:
+        lengths = [self.lengths_ms[i] for i in sorted(self.lengths_ms)]
+        return [sum(lengths[:i + 1]) for i in range(len(lengths) - 1)]
+
+
+PAUSES = [(25_000, 25_600), (50_300, 50_900), (75_700, 76_300)]  # Uneven, so no two segments are identical
+
+
+def run(tmp_path, samples: array, transcribe) -> tuple[StreamingTranscriber, str]:
+    source = write_wav(tmp_path / "source.wav", samples)
+    streamer = StreamingTranscriber(WavSink(tmp_path / "captured.wav"), jobs=3, transcribe=transcribe)
+    for block in replay_pcm(source, speed=0):
+        streamer.feed(block)
+    return streamer, streamer.finish()
+
+
+def test_segments_are_cut_in_pauses_and_joined_in_order(tmp_path):
+    samples = voice(90_000, PAUSES)
+    recorder = SegmentRecorder()
+
+    streamer, transcript = run(tmp_path, samples, recorder)
+
+    assert transcript == " ".join(f"<{i}>" for i in range(len(PAUSES) + 1))
+    cuts = recorder.cuts_ms()
+    assert len(cuts) == len(PAUSES)
+    assert all(start <= cut <= end for cut, (start, end) in zip(cuts, PAUSES)), cuts
+    assert read_frames(tmp_path / "captured.wav") == samples.tobytes()
+    assert not streamer.segment_dir.exists()
+
+
+def test_no_segment_exceeds_the_maximum(tmp_path):
+    samples = voice(150_000, [])  # Nowhere to pause: cuts are forced
+    recorder = SegmentRecorder()
+
+    run(tmp_path, samples, recorder)
+
+    assert len(recorder.lengths_ms) >= 3
+    assert max(recorder.lengths_ms.values()) <= MAX_SEGMENT_MS
+    assert sum(recorder.lengths_ms.values()) == 150_000
+
+
+def test_finish_raises_the_segment_error_and_cleans_up(tmp_path):
+    recorder = SegmentRecorder(fail_index=1)
+    source = write_wav(tmp_path / "source.wav", voice(60_000, PAUSES[:1]))
+    streamer = StreamingTranscriber(WavSink(tmp_path / "captured.wav"), transcribe=recorder)
+    for block in replay_pcm(source, speed=0):
+        streamer.feed(block)
+
+    with pytest.raises(RuntimeError, match="segment failed"):
+        streamer.finish()
+
+    assert not streamer.segment_dir.exists()
+    assert read_frames(tmp_path / "captured.wav") == read_frames(source)
+
+
+def test_abort_keeps_the_recording_and_drops_segments(tmp_path):
+    source = write_wav(tmp_path / "source.wav", voice(30_000, []))
+    streamer = StreamingTranscriber(WavSink(tmp_path / "captured.wav"), transcribe=SegmentRecorder())
+    for block in replay_pcm(source, speed=0):
+        streamer.feed(block)
+
+    streamer.abort()
+
+    assert not streamer.segment_dir.exists()
+    assert read_frames(tmp_path / "captured.wav") == read_frames(source)
+
+
+def test_stream_record_replay_with_fake_backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("AURA_TRANSCRIPTION_BACKEND", "fake")
+    monkeypatch.setenv("AURA_FAKE_LATENCY", "0.05")
+    samples = voice(90_000, PAUSES)
+    source = write_wav(tmp_path / "source.wav", samples)
+    saved = tmp_path / "audio.wav"
+
+    recorded, transcript = stream_record(saved, max_duration=600, replay=source, replay_speed=0)
+
+    assert recorded
+    assert re.findall(r"\[(\w+) ", transcript) == [f"segment{i:03d}" for i in range(len(PAUSES) + 1)]
+    assert read_frames(saved) == samples.tobytes()
+
+
+def test_replay_stops_at_max_duration(tmp_path):
+    source = write_wav(tmp_path / "source.wav", voice(5_000, []))
+
+    replayed = b"".join(replay_pcm(source, speed=0, max_duration=2))
+
+    assert len(replayed) == 2 * SAMPLE_RATE * stream_capture.SAMPLE_WIDTH
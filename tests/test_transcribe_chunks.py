@@ -0,0 +1,111 @@
+"""Concurrent chunk transcription against the fake backend (no network)."""
+
+import hashlib
+import random
+import threading
+
+import pytest
+
+import rate_limit
+import transcribe
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    """Use the fake backend and count calls and peak concurrency."""
+    monkeypatch.setenv("AURA_TRANSCRIPTION_BACKEND", "fake")
+    monkeypatch.setenv("AURA_FAKE_LATENCY", "0.05")
+    monkeypatch.setattr(rate_limit, "_scheduler", None)  # Restored after the test
+    rate_limit.configure(max_concurrency=8)
+
+    stats = {"calls": 0, "in_flight": 0, "peak": 0}
+    lock = threading.Lock()
+    fake = transcribe.fake_transcribe_audio
+
+    def counting_fake(path, model=transcribe.DEFAULT_MODEL):
+        with lock:
+            stats["calls"] += 1
+            stats["in_flight"] += 1
+            stats["peak"] = max(stats["peak"], stats["in_flight"])
+        try:
+            return fake(path, model)
+        finally:
+            with lock:
+                stats["in_flight"] -= 1
+
+    monkeypatch.setattr(transcribe, "fake_transcribe_audio", counting_fake)
+    return stats
+
+
+def make_chunks(directory, count: int) -> tuple[list[str], str]:
+    """Write `count` distinct chunk files; return their paths and the expected transcript."""
+    paths = []
+    expected = []
+    for i in range(count):
+        path = directory / f"chunk{i:03d}.wav"
+        data = f"chunk {i} ".encode() * (i + 1)
+        path.write_bytes(data)
+        paths.append(str(path))
+        expected.append(f"[chunk{i:03d} {hashlib.sha256(data).hexdigest()[:8]}]")
+    return paths, " ".join(expected)
+
+
+class FailFirstCalls:
+    """Stand-in for the random module: the first `failures` fail-rate draws fail."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.lock = threading.Lock()
+
+    def random(self) -> float:
+        with self.lock:
+            self.failures -= 1
+            return 0.0 if self.failures >= 0 else 1.0
+
+    def uniform(self, a: float, b: float) -> float:
+        return random.uniform(a, b)
+
+
+def test_transcripts_joined_in_chunk_order(tmp_path, fake_backend, monkeypatch):
+    # Random latency makes chunks finish out of order
+    monkeypatch.setenv("AURA_FAKE_LATENCY", "0.1")
+    paths, expected = make_chunks(tmp_path, 10)
+
+    text = transcribe.transcribe_chunks(paths, str(tmp_path / "original.wav"), jobs=5, use_cache=False)
+
+    assert text == expected
+    assert fake_backend["calls"] == 10
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_jobs_caps_requests_in_flight(tmp_path, fake_backend, jobs):
+    paths, expected = make_chunks(tmp_path, 12)
+
+    text = transcribe.transcribe_chunks(paths, str(tmp_path / "original.wav"), jobs=jobs, use_cache=False)
+
+    assert text == expected
+    assert fake_backend["peak"] == jobs
+
+
+def test_failed_chunks_are_retried(tmp_path, fake_backend, monkeypatch):
+    monkeypatch.setenv("AURA_FAKE_FAIL_RATE", "0.5")
+    monkeypatch.setattr(transcribe, "random", FailFirstCalls(3))
+    paths, expected = make_chunks(tmp_path, 8)
+
+    text = transcribe.transcribe_chunks(paths, str(tmp_path / "original.wav"), jobs=4, use_cache=False)
+
+    assert text == expected
+    assert fake_backend["calls"] == 8 + 3
+
+
+def test_chunk_failing_every_retry_raises(tmp_path, fake_backend, monkeypatch):
+    monkeypatch.setenv("AURA_FAKE_FAIL_RATE", "1")
+    paths, _ = make_chunks(tmp_path, 4)
+
+    with pytest.raises(RuntimeError, match="fake backend error"):
+        transcribe.transcribe_chunks(paths, str(tmp_path / "original.wav"), jobs=2, use_cache=False)
+
+    # One parallel pass, then MAX_CHUNK_RETRIES for the first failed chunk; the
+    # scheduler doesn't retry these errors on top
+    assert fake_backend["calls"] == 4 + transcribe.MAX_CHUNK_RETRIES
+    assert all(not (tmp_path / f"chunk{i:03d}.wav").exists() for i in range(4))
@@ -0,0 +1,184 @@
+"""Speech detection and the trimmed-to-original time map, on generated speech-like audio."""
+
+import math
+import random
+import shutil
+import sys
+import wave
+from array import array
+
+import pytest
+
+import audio_energy
+import transcribe
+from audio_energy import DEFAULT_FRAME_MS, TimestampMap, find_speech_regions, rms_envelope
+
+RATE = audio_energy.ANALYSIS_SAMPLE_RATE
+FRAME_LEN = RATE * DEFAULT_FRAME_MS // 1000
+PAD_MS = audio_energy.DEFAULT_SPEECH_PAD_MS
+
+
+def speech_like(duration_ms: int, speech: list[tuple[int, int]], rate: int = RATE) -> array:
+    """Background hiss, with voiced sound (harmonics, syllable-rate swell) inside each speech range (ms)."""
+    rng = random.Random(7)
+    samples = array("h", (int(rng.gauss(0, 30)) for _ in range(duration_ms * rate // 1000)))
+    for start, end in speech:
+        for k in range(start * rate // 1000, end * rate // 1000):
+            t = k / rate
+            swell = 0.7 + 0.3 * math.sin(2 * math.pi * 5 * t)
+            voice = sum(math.sin(2 * math.pi * 150 * h * t) / h for h in (1, 2, 3, 4))
+            samples[k] = int(4000 * swell * voice)
+    return samples
+
+
+def speech_regions(samples: array, **kwargs) -> list[tuple[int, int]]:
+    duration_ms = len(samples) * 1000 // RATE
+    return find_speech_regions(rms_envelope(samples.tobytes(), FRAME_LEN), duration_ms, **kwargs)
+
+
+def covered(span: tuple[int, int], regions: list[tuple[int, int]]) -> bool:
+    return any(start <= span[0] and span[1] <= end for start, end in regions)
+
+
+# An 800 ms pause (kept) and a 3 s pause (shortened), with 2 s and 4 s of silence at the ends
+SPEECH = [(2_000, 5_000), (5_800, 9_000), (12_000, 16_000)]
+DURATION_MS = 20_000
+
+
+def test_all_speech_is_kept():
+    regions = speech_regions(speech_like(DURATION_MS, SPEECH))
+
+    assert all(covered(span, regions) for span in SPEECH), regions
+
+
+def test_long_pauses_and_edges_shrink_to_the_padding():
+    regions = speech_regions(speech_like(DURATION_MS, SPEECH))
+
+    assert regions == [(2_000 - PAD_MS, 9_000 + PAD_MS), (12_000 - PAD_MS, 16_000 + PAD_MS)]
+
+
+def test_short_pauses_are_kept_whole():
+    regions = speech_regions(speech_like(DURATION_MS, SPEECH), min_silence_ms=4_000)
+
+    # The 3 s pause is now short enough to stay
+    assert regions == [(2_000 - PAD_MS, 16_000 + PAD_MS)]
+
+
+def test_no_speech_keeps_the_whole_recording():
+    assert speech_regions(speech_like(DURATION_MS, [])) == [(0, DURATION_MS)]
+
+
+def test_speech_without_pauses_keeps_the_whole_recording():
+    assert speech_regions(speech_like(DURATION_MS, [(0, DURATION_MS)])) == [(0, DURATION_MS)]
+
+
+def test_timestamp_map_points_back_into_the_original():
+    regions = speech_regions(speech_like(DURATION_MS, SPEECH))
+    timestamps = TimestampMap(regions, DURATION_MS)
+    first_ms = 9_000 - 2_000 + 2 * PAD_MS
+
+    assert timestamps.kept_ms == first_ms + 4_000 + 2 * PAD_MS
+    assert timestamps.removed_ms == DURATION_MS - timestamps.kept_ms
+    assert timestamps.to_original(0) == 2_000 - PAD_MS
+    assert timestamps.to_original(PAD_MS) == 2_000  # First word
+    assert timestamps.to_original(first_ms + PAD_MS) == 12_000  # First word after the long pause
+    assert timestamps.to_original(timestamps.kept_ms) == 16_000 + PAD_MS
+
+
+def test_timestamp_map_joint_goes_to_later_region():
+    timestamps = TimestampMap([(1_200, 5_400), (9_000, 15_000)], original_ms=16_000)
+
+    assert timestamps.to_original(4_200) == 9_000
+    assert timestamps.to_original(4_199) == 5_399
+    assert timestamps.to_original(4_500) == 9_300
+
+
+def test_timestamp_map_identity_and_round_trip():
+    identity = TimestampMap.identity(30_000)
+    timestamps = TimestampMap([(1_200, 5_400), (9_000, 15_000)], original_ms=16_000)
+    restored = TimestampMap.from_dict(timestamps.to_dict())
+
+    assert identity.removed_ms == 0 and identity.to_original(12_345) == 12_345
+    assert restored.regions == timestamps.regions and restored.original_ms == 16_000
+    assert restored.to_original(4_500) == timestamps.to_original(4_500)
+
+
+def write_wav(path, samples: array, rate: int = RATE) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(samples.tobytes())
+
+
+def test_trim_silence_default_read_from_aura_env(tmp_path, monkeypatch):
+    pytest.importorskip("dotenv")
+    pytest.importorskip("pydub")
+    (tmp_path / ".aura").mkdir()
+    (tmp_path / ".aura" / ".env").write_text("AURA_TRIM_SILENCE=1\n")
+    # Recorded so that teardown also removes the value load_dotenv sets
+    monkeypatch.setenv("AURA_TRIM_SILENCE", "")
+    monkeypatch.delenv("AURA_TRIM_SILENCE")
+    monkeypatch.setenv("AURA_TRANSCRIPTION_BACKEND", "fake")
+    write_wav(tmp_path / "memo.wav", array("h", [0] * RATE))
+    trimmed = []
+
+    def fake_trim(audio):
+        trimmed.append(audio.path)
+        return audio, TimestampMap.identity(audio.duration_ms)
+
+    monkeypatch.setattr(transcribe, "trim_silence", fake_trim)
+    monkeypatch.setattr(sys, "argv", ["transcribe.py", "memo.wav", "--no-cache"])
+
+    transcribe.main()
+
+    assert trimmed == ["memo.wav"]
+
+
+def test_trim_silence_skipped_when_ffmpeg_fails(tmp_path, monkeypatch):
+    samples = speech_like(DURATION_MS, SPEECH)
+    write_wav(tmp_path / "memo.wav", samples)
+    monkeypatch.setattr(audio_energy, "rms_envelope_from_file",
+                        lambda path: rms_envelope(samples.tobytes(), FRAME_LEN))
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("ffmpeg failed")
+
+    monkeypatch.setattr(transcribe, "reencode_for_upload", broken)
+    audio = transcribe.AudioHandle(str(tmp_path / "memo.wav"), duration_ms=DURATION_MS)
+
+    trimmed, timestamps = transcribe.trim_silence(audio)
+
+    assert trimmed is audio
+    assert timestamps.removed_ms == 0
+
+
+@pytest.mark.parametrize("reencode_fails", [False, True])
+def test_transcribe_file_removes_the_trimmed_copy(tmp_path, monkeypatch, reencode_fails):
+    monkeypatch.setenv("AURA_TRANSCRIPTION_BACKEND", "fake")
+    write_wav(tmp_path / "memo.wav", speech_like(DURATION_MS, SPEECH))
+    temp_files = []
+
+    def fake_trim(audio):
+        temp_files.append(tmp_path / "trimmed.wav")
+        write_wav(temp_files[-1], speech_like(10_000, [(0, 10_000)]))
+        return transcribe.AudioHandle(str(temp_files[-1]), duration_ms=10_000), TimestampMap.identity(10_000)
+
+    def fake_fit(audio):
+        if reencode_fails:
+            raise RuntimeError("ffmpeg failed")
+        temp_files.append(tmp_path / "reencoded.wav")
+        shutil.copyfile(audio.path, temp_files[-1])
+        return transcribe.AudioHandle(str(temp_files[-1]), duration_ms=audio.duration_ms)
+
+    monkeypatch.setattr(transcribe, "trim_silence", fake_trim)
+    monkeypatch.setattr(transcribe, "fit_to_upload_limit", fake_fit)
+
+    if reencode_fails:
+        with pytest.raises(RuntimeError):
+            transcribe.transcribe_file("memo.wav", use_cache=False, trim=True)
+    else:
+        assert transcribe.transcribe_file("memo.wav", use_cache=False, trim=True).startswith("[")
+
+    assert temp_files and not any(path.exists() for path in temp_files)
+    assert (tmp_path / "memo.wav").exists()